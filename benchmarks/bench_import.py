@@ -0,0 +1,70 @@
+"""
+`python -X importtime` でtamdrawの読み込み時間を計測するスクリプト。
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 5 --top 15
+
+各文(statement)を新しいプロセスで実行し，-X importtimeの出力から
+全体の読み込み時間(トップレベルモジュールのcumulativeの合計)と，
+重いモジュール(cartopy, scipy, PIL, matplotlib.pyplot)が読み込まれたかを表示します。
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+statements = [
+    "import tamdraw",
+    "from tamdraw import cmaps_ipcc",
+    "from tamdraw import plot_contourf",
+    "from tamdraw import create_gif",
+    "from tamdraw import draw_hrz_field",
+    "from tamdraw import plot_hovmuller_double_hatch",
+    "import tamdraw.tamdraw",
+]
+heavy_modules = ['matplotlib.pyplot','cartopy','scipy.stats','PIL.Image','xarray']
+line_re = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+def importtime(statement):
+    """
+    statement : string , python statement executed in a fresh interpreter
+    ------------------------------------------------------------
+    (合計時間[ms], {モジュール名: cumulative[ms]}) を返す。
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ,PYTHONPATH=root+os.pathsep+os.environ.get('PYTHONPATH',''))
+    proc = subprocess.run([sys.executable,'-X','importtime','-c',statement],
+                          capture_output=True,text=True,env=env,cwd=root)
+    if proc.returncode!=0:
+        raise Exception(f"'{statement}' failed:\n{proc.stderr[-2000:]}")
+    total = 0
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        m = line_re.match(line)
+        if m is None:
+            continue
+        cum, indent, name = int(m.group(2)), len(m.group(3)), m.group(4)
+        cumulative[name] = cum/1000.
+        if indent==1: # トップレベルのimportだけを足し合わせる
+            total += cum
+    return total/1000., cumulative
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat',type=int,default=3,help='number of runs (minimum is reported)')
+    parser.add_argument('--top',type=int,default=0,help='show the N slowest modules of each statement')
+    args = parser.parse_args()
+
+    print(f"{'statement':<48} {'total[ms]':>10}  heavy modules loaded")
+    for statement in statements:
+        runs = [importtime(statement) for _ in range(args.repeat)]
+        total, cumulative = min(runs,key=lambda r:r[0])
+        heavy = [m for m in heavy_modules if m in cumulative]
+        print(f"{statement:<48} {total:>10.1f}  {','.join(heavy) if heavy else '-'}")
+        if args.top:
+            for name,ms in sorted(cumulative.items(),key=lambda kv:-kv[1])[:args.top]:
+                print(f"    {name:<44} {ms:>10.1f}")
+
+if __name__=='__main__':
+    main()
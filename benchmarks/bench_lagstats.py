@@ -0,0 +1,46 @@
+"""
+ラグ相関・ラグ回帰(tamdraw.lagstats)の計算時間を，ラグごとのループと比べるスクリプト。
+
+    python benchmarks/bench_lagstats.py
+    python benchmarks/bench_lagstats.py --res 1 --ntime 3000 --lag 60
+
+乱数(seed固定)で作った (time, lat, lon) の全球格子のデータと基準の時系列について，
+lagmin..lagmax の全てのラグの相関を次の2通りで計算して時間と最大の差を表示します。
+  loop : ラグごとにずらして xr.corr で計算する (--loop-lags個のラグだけ計算し，全てのラグの時間に換算する)
+  fft  : lag_regression でまとめて計算する
+"""
+import argparse
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--res',type=float,nargs='+',default=[2.5],help='grid spacings [deg]')
+    parser.add_argument('--ntime',type=int,default=3000,help='length of the record')
+    parser.add_argument('--lag',type=int,default=60,help='lags from -LAG to LAG')
+    parser.add_argument('--loop-lags',type=int,default=5,help='number of lags timed for the loop')
+    args = parser.parse_args()
+
+    import numpy as np
+    import xarray as xr
+    from tamdraw.lagstats import lag_regression
+    rng = np.random.default_rng(0)
+    nlag = 2*args.lag+1
+    print(f"{'res':>6} {'ntime':>6} {'nlag':>5} {'loop[s]':>9} {'fft[s]':>8} {'speedup':>8} {'maxdiff':>9}")
+    for res in args.res:
+        lat, lon = np.arange(-90,90+res/2,res), np.arange(0,360,res)
+        field = xr.DataArray(rng.standard_normal((args.ntime,len(lat),len(lon))).astype('f4'),
+                             dims=('time','lat','lon'),coords={'lat':lat,'lon':lon})
+        index = xr.DataArray(rng.standard_normal(args.ntime),dims='time')
+        lags = np.linspace(-args.lag,args.lag,min(args.loop_lags,nlag)).astype(int)
+        t0 = time.perf_counter()
+        loop = {int(k):xr.corr(index,field.shift(time=-int(k)),dim='time') for k in lags}
+        t1 = time.perf_counter()
+        ds = lag_regression(index,field,-args.lag,args.lag)
+        t2 = time.perf_counter()
+        tloop = (t1-t0)/len(lags)*nlag
+        diff = max(float(np.nanmax(np.abs(ds['corr'].sel(lag=k)-loop[k]))) for k in loop)
+        print(f"{res:>6g} {args.ntime:>6d} {nlag:>5d} {tloop:>9.2f} {t2-t1:>8.2f} "
+              f"{tloop/(t2-t1):>7.1f}x {diff:>9.1e}",flush=True)
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,242 @@
+"""
+地図・ホフメラー図・アニメーションの描画時間と最大メモリを計測するスクリプト。
+
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --res 2.5 1 --cases draw_hrz_field create_gif
+    python benchmarks/bench_render.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_render.py --baseline benchmarks/baseline.json
+
+乱数(seed固定)で作った全球格子(2.5°, 1°, 0.25°)のデータを使い，各ケースを新しいプロセスで実行します。
+時間は--repeat回の最小値，メモリはtracemallocで測ったケース実行中の最大確保量[MB]です
+(numpyの配列を含む。データの作成と読み込みは含まない)。
+海岸線・陸地は一時ディレクトリに作った簡単なNatural Earth形式のshapefileを使うので，
+ネットワークに接続しないで実行できます(--natural-earthで手元のcartopyのデータを使う)。
+--baselineを指定すると，保存しておいた結果との比(今回/基準)を表示します。
+
+benchmarks/baseline.json は，高速化する前のtamdraw(最初のコミット)を2.5°と1°で測った基準です
+(1 CPUの計算機, matplotlib 3.11, cartopy 0.26)。以前のコードが今のmatplotlib/cartopyでは
+動かないケースはerrorとして記録してあり，比は"-"になります。
+時間は計算機によって変わるので，比べるときは同じ計算機で基準を作り直してください。
+
+    git worktree add /tmp/tamdraw_base <最初のコミット>
+    mkdir -p /tmp/tamdraw_base/benchmarks /tmp/tamdraw_base/tests
+    cp benchmarks/bench_render.py /tmp/tamdraw_base/benchmarks/ && cp tests/_data.py /tmp/tamdraw_base/tests/
+    (cd /tmp/tamdraw_base && python benchmarks/bench_render.py --res 2.5 1 --save-baseline /tmp/baseline.json)
+    python benchmarks/bench_render.py --res 2.5 1 --baseline /tmp/baseline.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# 合成データはテストと共通 (tests/_data.py)
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),'tests'))
+from _data import synthetic_field,synthetic_hovmuller,write_natural_earth
+
+resolutions = [2.5,1.,0.25]
+
+# ---------------------------------------------------------------------------
+# ケース : setup(res,workdir)がデータを作り，引数なしの関数(計測対象)を返す
+# ---------------------------------------------------------------------------
+def case_draw_hrz_field(res,workdir):
+    import tamdraw
+    field = synthetic_field(res)
+    def run():
+        tamdraw.draw_hrz_field(field,-1.5,1.5,0.25,savefig=True,
+                               fname_save=os.path.join(workdir,'draw_hrz_field.png'))
+    return run
+
+def case_axplot_hrz_field_double_hatch(res,workdir):
+    import matplotlib.pyplot as plt
+    import cartopy.crs as ccrs
+    import tamdraw
+    field1, field2 = synthetic_field(res,0), synthetic_field(res,1,scale=4.)
+    field_hatch = abs(synthetic_field(res,2,scale=3.))>2.
+    def run():
+        fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained')
+        ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180))
+        tamdraw.axplot_hrz_field_double_hatch(ax,field1,field2,field_hatch,-1.5,1.5,0.25,-4,4,1,
+                                              add_colorbar=True)
+        fig.savefig(os.path.join(workdir,'axplot_hrz_field_double_hatch.png'))
+        plt.close(fig)
+    return run
+
+def case_axplot_polar_field_double_hatch(res,workdir):
+    import matplotlib.pyplot as plt
+    import cartopy.crs as ccrs
+    import tamdraw
+    field1, field2 = synthetic_field(res,0), synthetic_field(res,1,scale=4.)
+    field_hatch = abs(synthetic_field(res,2,scale=3.))>2.
+    def run():
+        fig = plt.figure(figsize=(5,5),dpi=150,layout='constrained')
+        ax = fig.add_subplot(projection=ccrs.NorthPolarStereo(central_longitude=180))
+        ax.set_extent([0,359.9,20,90],crs=ccrs.PlateCarree())
+        tamdraw.axplot_polar_field_double_hatch(ax,field1,field2,field_hatch,-1.5,1.5,0.25,-4,4,1,
+                                                add_colorbar=True)
+        fig.savefig(os.path.join(workdir,'axplot_polar_field_double_hatch.png'))
+        plt.close(fig)
+    return run
+
+def case_axplot_polar_field_double_hatch_regrid(res,workdir):
+    import matplotlib.pyplot as plt
+    import cartopy.crs as ccrs
+    import tamdraw
+    field1, field2 = synthetic_field(res,0), synthetic_field(res,1,scale=4.)
+    field_hatch = abs(synthetic_field(res,2,scale=3.))>2.
+    def run():
+        fig = plt.figure(figsize=(5,5),dpi=150,layout='constrained')
+        ax = fig.add_subplot(projection=ccrs.NorthPolarStereo(central_longitude=180))
+        ax.set_extent([0,359.9,20,90],crs=ccrs.PlateCarree())
+        tamdraw.axplot_polar_field_double_hatch(ax,field1,field2,field_hatch,-1.5,1.5,0.25,-4,4,1,
+                                                add_colorbar=True,regrid=True,circle=True)
+        fig.savefig(os.path.join(workdir,'axplot_polar_field_double_hatch_regrid.png'))
+        plt.close(fig)
+    return run
+
+def case_plot_hovmuller_double_hatch(res,workdir):
+    import matplotlib.pyplot as plt
+    import cartopy.crs as ccrs
+    import tamdraw
+    var1, var2 = synthetic_hovmuller(res,0), synthetic_hovmuller(res,1)
+    vart = synthetic_hovmuller(res,2)*3
+    def run():
+        fig = plt.figure(figsize=(5,6),dpi=150)
+        ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180))
+        tamdraw.plot_hovmuller_double_hatch(ax,var1,var2,vart,-1,1,0.2,-1,1,0.5,dof=30)
+        fig.savefig(os.path.join(workdir,'plot_hovmuller_double_hatch.png'))
+        plt.close(fig)
+    return run
+
+def case_pcolmesh_lonlon(res,workdir):
+    import numpy as np
+    import matplotlib.pyplot as plt
+    import tamdraw
+    x = np.arange(140,240+res/2,res)
+    rng = np.random.default_rng(0)
+    c = np.cos(np.deg2rad(x[:,None]-x[None,:]))+0.1*rng.standard_normal((len(x),len(x)))
+    def run():
+        fig, ax = plt.subplots(figsize=(5,4),dpi=150)
+        tamdraw.pcolmesh_lonlon(fig,ax,c,x,x,vmin=-1,vmax=1,savefig=True,
+                                fname=os.path.join(workdir,'pcolmesh_lonlon.png'))
+        plt.close(fig)
+    return run
+
+def case_create_gif(res,workdir,nframes=20):
+    # 1格子点を1画素としたフレーム(0.25°なら1440x721)をPNGで用意しておく
+    import numpy as np
+    import matplotlib.pyplot as plt
+    import tamdraw
+    for i in range(nframes):
+        field = synthetic_field(res,seed=i)
+        plt.imsave(os.path.join(workdir,f'frame_{i:03d}.png'),np.asarray(field)[::-1],
+                   cmap='RdBu_r',vmin=-1.5,vmax=1.5)
+    def run():
+        tamdraw.create_gif(os.path.join(workdir,'frame_*.png'),duration=100,
+                           fname_save=os.path.join(workdir,'anim.gif'))
+    return run
+
+cases = {
+    'draw_hrz_field'                  : case_draw_hrz_field,
+    'axplot_hrz_field_double_hatch'   : case_axplot_hrz_field_double_hatch,
+    'axplot_polar_field_double_hatch' : case_axplot_polar_field_double_hatch,
+    'axplot_polar_field_double_hatch_regrid' : case_axplot_polar_field_double_hatch_regrid,
+    'plot_hovmuller_double_hatch'     : case_plot_hovmuller_double_hatch,
+    'pcolmesh_lonlon'                 : case_pcolmesh_lonlon,
+    'create_gif'                      : case_create_gif,
+}
+
+# ---------------------------------------------------------------------------
+# 計測
+# ---------------------------------------------------------------------------
+def measure(name,res,repeat,natural_earth=False):
+    """
+    子プロセスの中で1つのケースを計測し，{'seconds','peak_mb'}を返す。
+    1回目はキャッシュ(海岸線など)を作る分も含むので，--repeatの最小値を取る。
+    """
+    import tracemalloc
+    import warnings
+    import matplotlib
+    matplotlib.use('Agg')
+    warnings.filterwarnings('ignore')
+    with tempfile.TemporaryDirectory() as workdir:
+        if not natural_earth:
+            import cartopy
+            write_natural_earth(os.path.join(workdir,'cartopy'))
+            cartopy.config['data_dir'] = os.path.join(workdir,'cartopy')
+            cartopy.config['pre_existing_data_dir'] = ''
+        run = cases[name](res,workdir)
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            run()
+            times.append(time.perf_counter()-t0)
+        # メモリは時間とは別に1回だけ測る (tracemallocは遅くなるので)
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {'seconds':min(times),'peak_mb':peak/2**20}
+
+def run_case(name,res,repeat,natural_earth=False):
+    # ケースごとに新しいプロセスで実行する (importやキャッシュ・メモリが前のケースに影響されないように)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ,PYTHONPATH=root+os.pathsep+os.environ.get('PYTHONPATH',''))
+    command = [sys.executable,os.path.abspath(__file__),'--child',name,str(res),'--repeat',str(repeat)]
+    if natural_earth:
+        command.append('--natural-earth')
+    proc = subprocess.run(command,capture_output=True,text=True,env=env,cwd=root)
+    if proc.returncode!=0:
+        return {'error':proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'failed'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def _key(name,res):
+    return f"{name}@{res:g}"
+
+def _ratio(now,base):
+    if base is None or not base or now is None:
+        return '-'
+    return f"{now/base:.2f}x"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--res',type=float,nargs='+',default=resolutions,help='grid spacings [deg]')
+    parser.add_argument('--cases',nargs='+',default=list(cases),choices=list(cases),help='cases to run')
+    parser.add_argument('--repeat',type=int,default=3,help='number of runs (minimum time is reported)')
+    parser.add_argument('--baseline',default=None,help='JSON file of a previous run to compare with')
+    parser.add_argument('--save-baseline',default=None,help='save the results to this JSON file')
+    parser.add_argument('--natural-earth',action='store_true',help='use the Natural Earth data of cartopy')
+    parser.add_argument('--child',nargs=2,default=None,help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        name, res = args.child
+        print(json.dumps(measure(name,float(res),args.repeat,args.natural_earth)))
+        return
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    results = {}
+    print(f"{'case':<44} {'time[s]':>9} {'peak[MB]':>9} {'time':>7} {'memory':>7}")
+    for res in args.res:
+        for name in args.cases:
+            key = _key(name,res)
+            result = run_case(name,res,args.repeat,args.natural_earth)
+            results[key] = result
+            if 'error' in result:
+                print(f"{key:<44} error: {result['error']}")
+                continue
+            base = baseline.get(key,{})
+            print(f"{key:<44} {result['seconds']:>9.3f} {result['peak_mb']:>9.1f} "
+                  f"{_ratio(result['seconds'],base.get('seconds')):>7} "
+                  f"{_ratio(result['peak_mb'],base.get('peak_mb')):>7}",flush=True)
+    if args.save_baseline:
+        with open(args.save_baseline,'w') as f:
+            json.dump(results,f,indent=1)
+
+if __name__=='__main__':
+    main()
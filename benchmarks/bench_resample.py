@@ -0,0 +1,45 @@
+"""
+再標本化による有意性の検定(tamdraw.resample)の計算時間を計測するスクリプト。
+
+    python benchmarks/bench_resample.py
+    python benchmarks/bench_resample.py --res 1 --nresample 10000 --nworkers 8
+
+乱数(seed固定)で作った (time, lat, lon) の全球格子のデータについて，
+composite_pvalue・correlation_pvalue を permutation・bootstrap で実行し，
+--nresample個の標本での時間と1万個あたりに換算した時間を表示します
+(データの標準化などの準備の時間は1回分として含む)。
+"""
+import argparse
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--res',type=float,nargs='+',default=[2.5,1.],help='grid spacings [deg]')
+    parser.add_argument('--ntime',type=int,default=2000,help='length of the record')
+    parser.add_argument('--nevent',type=int,default=60,help='number of events of the composite')
+    parser.add_argument('--nresample',type=int,default=1000,help='number of resamples')
+    parser.add_argument('--nworkers',type=int,default=1,help='number of processes')
+    args = parser.parse_args()
+
+    import numpy as np
+    import xarray as xr
+    from tamdraw.resample import composite_pvalue,correlation_pvalue
+    rng = np.random.default_rng(0)
+    print(f"{'res':>6} {'case':>24} {'time[s]':>9} {'per 10000[s]':>13}")
+    for res in args.res:
+        lat, lon = np.arange(-90,90+res/2,res), np.arange(0,360,res)
+        field = xr.DataArray(rng.standard_normal((args.ntime,len(lat),len(lon))).astype('f4'),
+                             dims=('time','lat','lon'),coords={'lat':lat,'lon':lon})
+        index = rng.standard_normal(args.ntime)
+        events = rng.choice(args.ntime,args.nevent,replace=False)
+        for name,func,first in (('composite',composite_pvalue,field),('correlation',correlation_pvalue,index)):
+            for method in ('permutation','bootstrap'):
+                second = events if name=='composite' else field
+                t0 = time.perf_counter()
+                func(first,second,args.nresample,method=method,nworkers=args.nworkers)
+                elapsed = time.perf_counter()-t0
+                print(f"{res:>6g} {name+'/'+method:>24} {elapsed:>9.2f} "
+                      f"{elapsed*10000/args.nresample:>13.1f}",flush=True)
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+投影済みの格子のキャッシュ(tamdraw.meshes)で，地図の層(contourf, contour, hatch)の描画がどれだけ速くなるかを計測するスクリプト。
+
+    python benchmarks/bench_transform.py
+    python benchmarks/bench_transform.py --res 0.25 --frames 5 --extent 0 360 -90 90
+
+PlateCarree(central_longitude=180)の地図に，draw_hrz_field_double_hatchと同じ3つの層を
+--frames枚(データだけ違う)描いてPNGに保存するまでの時間を，次の3通りで比べます。
+  cartopy : transform=ccrs.PlateCarree()で緯度経度のまま描く (コンターの多角形を1つずつ投影する)
+  cold    : キャッシュを空にしてから geo_xy で投影済みの格子の上に描く (1枚目で格子を投影する)
+  cached  : キャッシュが残った状態で描く (2つ目以降の層・パネル・フレーム)
+海岸線・陸地は描かないので，Natural Earthのデータは要りません。
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0,os.path.dirname(os.path.abspath(__file__)))
+from bench_render import synthetic_field
+
+def draw_frames(fields,extent,fname,use_mesh):
+    """fields : (field1, field2, field_hatch)のリスト。1フレームごとに新しいFigureに描いて保存する。"""
+    import numpy as np
+    import matplotlib.pyplot as plt
+    import cartopy.crs as ccrs
+    from tamdraw.meshes import geo_xy
+    from tamdraw.grid import subset_fields
+    for field1,field2,field_hatch in fields:
+        fig = plt.figure(figsize=(6,4),dpi=150)
+        ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180))
+        field1,field2,field_hatch = subset_fields(*extent,field1,field2,field_hatch)
+        x, y, transform = field1['lon'].values, field1['lat'].values, ccrs.PlateCarree()
+        if use_mesh:
+            x, y, transform = geo_xy(ax,x,y,transform)
+        ax.contourf(x,y,field1.values,levels=np.linspace(-1.5,1.5,13),cmap='RdBu_r',
+                    extend='both',transform=transform)
+        ax.contour(x,y,field2.values,levels=np.arange(-4,4.1,1),colors='black',
+                   linewidths=1,transform=transform)
+        ax.contourf(x,y,field_hatch.where(abs(field_hatch)>2).values,hatches=['..'],colors='none',
+                    transform=transform)
+        ax.set_extent(extent,crs=ccrs.PlateCarree())
+        fig.savefig(fname)
+        plt.close(fig)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--res',type=float,nargs='+',default=[1.,0.25],help='grid spacings [deg]')
+    parser.add_argument('--frames',type=int,default=3,help='number of frames (same grid, different data)')
+    parser.add_argument('--extent',type=float,nargs=4,default=[120,260,-20,70],
+                        help='x_min x_max y_min y_max of the map')
+    args = parser.parse_args()
+
+    import warnings
+    import matplotlib
+    matplotlib.use('Agg')
+    warnings.filterwarnings('ignore')
+    from tamdraw.meshes import clear_mesh_cache,mesh_cache_info
+    print(f"{'res':>6} {'frames':>6} {'cartopy[s]':>11} {'cold[s]':>9} {'cached[s]':>10} "
+          f"{'speedup':>8} {'mesh[MB]':>9}")
+    with tempfile.TemporaryDirectory() as workdir:
+        fname = os.path.join(workdir,'frame.png')
+        for res in args.res:
+            fields = [(synthetic_field(res,3*i),synthetic_field(res,3*i+1,scale=4.),
+                       synthetic_field(res,3*i+2,scale=3.)) for i in range(args.frames)]
+            t0 = time.perf_counter()
+            draw_frames(fields,args.extent,fname,use_mesh=False)
+            t1 = time.perf_counter()
+            clear_mesh_cache()
+            draw_frames(fields,args.extent,fname,use_mesh=True)
+            t2 = time.perf_counter()
+            draw_frames(fields,args.extent,fname,use_mesh=True)
+            t3 = time.perf_counter()
+            info = mesh_cache_info()
+            print(f"{res:>6g} {args.frames:>6d} {t1-t0:>11.3f} {t2-t1:>9.3f} {t3-t2:>10.3f} "
+                  f"{(t1-t0)/(t3-t2):>7.1f}x {info['nbytes']/2**20:>9.2f}",flush=True)
+
+if __name__=='__main__':
+    main()
@@ -1 +1,124 @@
-from .tamdraw import *
+"""
+tamdraw : 主に地理的な図を描くための関数をまとめたパッケージ。
+
+関数はサブモジュールに分かれていて，`tamdraw.draw_hrz_field` のように
+最初にアクセスされたときに該当するサブモジュールだけを読み込みます。
+  series    : 時系列・一般的なcontourf/pcolormesh (matplotlib)
+  anim      : GIFなどのアニメーション作成 (PIL)
+  hrz       : 水平分布の地図 (cartopy)
+  template  : 背景を使い回す地図 (blit)
+  artists   : データ層だけを入れ替えるハンドル (HrzPlotHandle)
+  hovmuller : ホフメラー図 (cartopy, scipy)
+  stream    : 長い記録(複数ファイル・netCDF/zarr)をchunkずつ読む処理 (ホフメラー図の配列の作成)
+  lagstats  : ラグ相関・ラグ回帰 (FFTで全てのラグ・格子点をまとめて計算, scipy)
+  batch     : 時間方向などの複数フレームの並列描画
+  panels    : 季節ごとなどの複数パネルの地図をカラーバー1つでまとめて描く
+  grid      : 描画範囲の切り出し・間引きなど格子データの前処理
+  levels    : 色のレベル・norm・カラーマップ・目盛りをまとめたLevelSpec
+  meshes    : 投影済みの格子座標のキャッシュ (コンターを地図の座標で計算する)
+  polar     : 極投影の地図の高速化 (地図の座標の格子への内挿，円の外形)
+  raster    : 塗りつぶしを画像として描く高速モード・PDF/SVGでの層ごとの画像化
+  signif    : 有意性の検定(t分布の臨界値)とハッチ (scipy)
+  composite : 事例の合成図の場・t値・臨界値をchunkずつ読んで作る (Welford)
+  resample  : 再標本化(permutation・bootstrap)による有意性のp値の場 (複数プロセス)
+  features  : 陸地・海岸線の形状キャッシュ (cartopy, shapely)
+  profiling : draw_*/axplot_*の段階ごとの時間の計測 (with tamdraw.profile() as p:)
+  cmaps     : カラーマップ (matplotlib.colors)
+"""
+import importlib
+
+_submodule_attrs = {
+    'series': [
+        'plot_lagcorr','plot_1d_normalized_series','plot_contourf','plot_contour',
+        'plot_pcolormesh','pcolmesh_lonlon',
+    ],
+    'anim': [
+        'create_gif','AnimationWriter','write_animation','gif_palette',
+        'figure_to_image','write_figures',
+    ],
+    'batch': [
+        'render_hrz_batch',
+    ],
+    'hrz': [
+        'draw_hrz_field','axplot_hrz_field','axplot_hrz_field_hatch',
+        'axplot_polar_field_hatch','axplot_hrz_field_double','axplot_hrz_field_contour',
+        'axplot_hrz_field_double_hatch','axplot_polar_field_double_hatch',
+        'axplot_whitemap','ax_addpatch','ax_xr_addhatch','ax_addhatch',
+        'draw_hrz_field_double','draw_hrz_field_double_hatch',
+        'draw_hrz_field_double_hatch_hrz','draw_hrz_field_contour',
+        'draw_hrz_field_hatch','draw_hrz_field_hatch_hrz',
+        'draw_hrz_field_contour_hatch',
+    ],
+    'panels': [
+        'draw_hrz_panel_grid',
+    ],
+    'grid': [
+        'subset_to_extent','subset_fields','resolve_levels','coarsen_field',
+        'coarsen_factors','coarsen_fields',
+    ],
+    'levels': [
+        'LevelSpec','color_levels','discrete_cmap',
+    ],
+    'meshes': [
+        'projected_mesh','geo_xy','geo_plot','clear_mesh_cache','mesh_cache_info',
+    ],
+    'polar': [
+        'regrid_to_projection','regrid_fields','projection_grid','circle_path','clear_regrid_cache',
+    ],
+    'raster': [
+        'plot_filled','platecarree_grid','update_raster','rasterize_layers',
+    ],
+    'signif': [
+        't_critical','significance_mask','mask_to_path','add_mask_hatch',
+        'autocorrelation','effective_dof','tcval_field',
+    ],
+    'composite': [
+        'build_composite',
+    ],
+    'resample': [
+        'composite_pvalue','correlation_pvalue','event_index',
+    ],
+    'profiling': [
+        'profile','Profile','profiled','stage',
+    ],
+    'features': [
+        'add_land','add_coastlines','cached_feature_paths','clear_feature_cache',
+    ],
+    'artists': [
+        'HrzPlotHandle','contour_kwargs',
+    ],
+    'template': [
+        'MapTemplate',
+    ],
+    'hovmuller': [
+        'ax_xaxis2lon','plot_laghovmuller','plot_hovmuller_double',
+        'plot_hovmuller_hatch','plot_hovmuller_double_hatch',
+    ],
+    'stream': [
+        'build_hovmuller','iter_time_chunks','iter_sources','chunk_length',
+    ],
+    'lagstats': [
+        'lag_regression','lag_correlation',
+    ],
+    'cmaps': [
+        'parse_cmap_sources','build_cmap_bundle','load_cmap_tables','ipcc_cmap_names',
+        'get_ipcc_cmap','register_ipcc_cmaps','cmaps_ipcc','cmap_white_in_mid',
+        'cmap_centwhite','current_dir','cmap_master_dir_path',
+    ],
+}
+_attr_to_submodule = {name:mod for mod,names in _submodule_attrs.items() for name in names}
+__all__ = [name for names in _submodule_attrs.values() for name in names]
+
+def __getattr__(name):
+    # サブモジュールは必要になった時点で読み込む
+    if name in _attr_to_submodule:
+        module = importlib.import_module(f'.{_attr_to_submodule[name]}',__name__)
+        value = getattr(module,name)
+        globals()[name] = value
+        return value
+    if name in _submodule_attrs or name=='tamdraw':
+        return importlib.import_module(f'.{name}',__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals())|set(__all__)|set(_submodule_attrs))
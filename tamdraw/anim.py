@@ -0,0 +1,420 @@
+import glob
+import io
+import os
+import struct
+import zlib
+import numpy as np
+#
+def _frame_duration(duration,i):
+    # durationは全フレーム共通の値，またはフレームごとのリスト
+    if isinstance(duration,(list,tuple,np.ndarray)):
+        return int(duration[i])
+    return int(duration)
+
+def figure_to_image(fig=None,draw=True):
+    """
+    fig  : matplotlib Figure or Axes. plt.gcf() if None
+    draw : bool , False: 描画し直さずに現在のバッファを使う (MapTemplate.blitの後など)
+    ------------------------------------------------------------
+    Figureを描画し，canvasのRGBAバッファをコピーせずにPIL.Imageとして返す。
+    PNGへの保存・読み込みを経由しないので速い。
+    バッファは次の描画で書き換わるので，すぐにAnimationWriterなどに渡してください。
+    """
+    from PIL import Image
+    if fig is None:
+        import matplotlib.pyplot as plt
+        fig = plt.gcf()
+    while not hasattr(fig,'savefig'): # Axes, SubFigure -> Figure
+        fig = fig.figure
+    canvas = fig.canvas
+    if not hasattr(canvas,'buffer_rgba'):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        canvas = FigureCanvasAgg(fig)
+    if draw:
+        canvas.draw()
+    buf = np.asarray(canvas.buffer_rgba())
+    return Image.frombuffer('RGBA',(buf.shape[1],buf.shape[0]),buf,'raw','RGBA',0,1)
+
+def _to_image(frame):
+    """
+    frame : PIL.Image , file path , np.ndarray (ny,nx,3|4) uint8 , or matplotlib Figure/Axes
+    ------------------------------------------------------------
+    フレームをPIL.Imageに変換する。ファイルの場合は読み込んだ後すぐに閉じる。
+    """
+    from PIL import Image
+    if isinstance(frame,Image.Image):
+        return frame
+    if hasattr(frame,'get_figure'):
+        return figure_to_image(frame)
+    if isinstance(frame,(str,os.PathLike)):
+        with Image.open(frame) as img:
+            return img.convert('RGBA' if img.has_transparency_data else 'RGB')
+    return Image.fromarray(np.asarray(frame))
+
+def gif_palette(cmap="RdBu_r",levels=9,extend='both',
+                colors=("white","black","lightgray","dimgrey")):
+    """
+    cmap   : string or Colormap , colormap of the shaded field
+    levels : int or array       , color levels (same as clevels of draw_hrz_field)
+    extend : string             , extend of the colorbar ('both','min','max','neither')
+    colors : list               , static colors of the basemap (background, coastlines, land, ...)
+    ------------------------------------------------------------
+    GIFアニメーション全体で共有するパレットの固定色を (ncolor,3) uint8 の配列で返す。
+    AnimationWriter(...,palette=gif_palette(...)) のように渡すと，
+    残りの色(線のアンチエイリアスなど)は最初のフレームから補われます。
+    """
+    import matplotlib as mpl
+    import matplotlib.colors as mcolors
+    from .cmaps import register_ipcc_cmaps
+    register_ipcc_cmaps()
+    cmap = mpl.colormaps[cmap] if isinstance(cmap,str) else cmap
+    nlev = levels if np.ndim(levels)==0 else len(levels)
+    ncolors = nlev-1+{'both':2,'min':1,'max':1}.get(extend,0)
+    rgb = cmap(np.linspace(0,1,max(ncolors,1)))[:,:3]
+    fixed = np.array([mcolors.to_rgb(c) for c in colors]).reshape(-1,3)
+    return (np.vstack([fixed,rgb])*255).round().astype(np.uint8)
+
+def _complete_palette(colors,img,ncolors):
+    # 固定色を先頭に並べ，空いた分を画像の適応パレット(median cut)で埋める
+    fixed = np.asarray(colors,dtype=np.uint8).reshape(-1,3)[:ncolors]
+    nfree = ncolors-len(fixed)
+    if nfree>0:
+        q = img.quantize(colors=nfree)
+        pal = np.array(q.getpalette()[:3*nfree],dtype=np.uint8).reshape(-1,3)
+        extra = pal[np.unique(np.asarray(q))]
+        fixed = np.vstack([fixed,extra])
+    _, first = np.unique(fixed,axis=0,return_index=True)
+    pal = fixed[np.sort(first)]
+    if len(pal)<ncolors:
+        pal = np.vstack([pal,np.repeat(pal[:1],ncolors-len(pal),axis=0)])
+    return pal
+
+class _GifStream:
+    """
+    GIFを1フレームずつ書き出す。
+    palette=None     : 各フレームを個別に減色し，独自のパレット(local color table)で書く。
+    palette='global' : 最初のフレームから作った1つのパレットを全フレームで共有する。
+    palette=colors   : colors(gif_palette()など)を固定色とした共有パレット。
+    共有パレットでdelta=Trueのときは，前のフレームから変化した矩形だけを
+    (変化していない画素は透明色にして)書き出す。
+    """
+    transparent_index = 255
+
+    def __init__(self,fp,duration,loop,palette=None,delta=True):
+        self.fp, self.duration, self.loop = fp, duration, loop
+        self.palette, self.delta = palette, delta
+        self.nframes = 0
+        self.pal_img = None
+        self.prev = None
+
+    def write(self,img):
+        if self.palette is None:
+            self._write_local(img)
+        else:
+            self._write_global(img)
+        self.nframes += 1
+
+    def _write_local(self,img):
+        from PIL import Image, GifImagePlugin
+        img = img.convert('RGB').convert('P',palette=Image.Palette.ADAPTIVE)
+        params = {'duration':_frame_duration(self.duration,self.nframes)}
+        if self.nframes==0:
+            header, _ = GifImagePlugin.getheader(img,None,{'loop':self.loop,**params})
+            for s in header:
+                self.fp.write(s)
+        else:
+            params['include_color_table'] = True
+        for s in GifImagePlugin.getdata(img,(0,0),**params):
+            self.fp.write(s)
+
+    def _write_global(self,img):
+        from PIL import Image, GifImagePlugin
+        img = img.convert('RGB')
+        if self.pal_img is None:
+            # 透明色用に最後の1色を空けておく
+            colors = [] if isinstance(self.palette,str) else self.palette
+            pal = _complete_palette(colors,img,self.transparent_index)
+            self.pal_img = Image.new('P',(1,1))
+            self.pal_img.putpalette(pal.ravel().tolist())
+            self.pal_full = pal.ravel().tolist()+[0,0,0]
+        frame = img.quantize(palette=self.pal_img,dither=Image.Dither.NONE)
+        index = np.asarray(frame)
+        params = {'duration':_frame_duration(self.duration,self.nframes),'disposal':1}
+        if self.nframes==0:
+            frame.putpalette(self.pal_full)
+            header, _ = GifImagePlugin.getheader(frame,None,{'loop':self.loop,**params})
+            for s in header:
+                self.fp.write(s)
+            out, offset = frame, (0,0)
+        elif not self.delta:
+            out, offset = Image.fromarray(index), (0,0)
+        else:
+            changed = index!=self.prev
+            params['transparency'] = self.transparent_index
+            if not changed.any():
+                # 前のフレームと同じ: 1画素の透明フレームで表示時間だけ進める
+                out, offset = Image.new('L',(1,1),self.transparent_index), (0,0)
+            else:
+                rows = np.flatnonzero(changed.any(axis=1))
+                cols = np.flatnonzero(changed.any(axis=0))
+                box = (slice(rows[0],rows[-1]+1),slice(cols[0],cols[-1]+1))
+                sub = np.where(changed[box],index[box],self.transparent_index).astype(np.uint8)
+                out, offset = Image.fromarray(sub), (int(cols[0]),int(rows[0]))
+        for s in GifImagePlugin.getdata(out,offset,**params):
+            self.fp.write(s)
+        self.prev = index
+
+    def close(self):
+        self.fp.write(b';')
+
+def _png_chunk(ctype,data):
+    return struct.pack('>I',len(data))+ctype+data+struct.pack('>I',zlib.crc32(ctype+data))
+
+def _png_chunks(png):
+    # PNGのバイト列を (chunk type, data) のリストに分解する
+    chunks, pos = [], 8
+    while pos<len(png):
+        length, = struct.unpack('>I',png[pos:pos+4])
+        chunks.append((png[pos+4:pos+8],png[pos+8:pos+8+length]))
+        pos += 12+length
+    return chunks
+
+class _ApngStream:
+    # APNGを1フレームずつ書き出す。フレーム数(acTL)は最後に書き戻すので，fpはseek可能であること。
+    def __init__(self,fp,duration,loop,compress_level=6):
+        self.fp, self.duration, self.loop = fp, duration, loop
+        self.compress_level = compress_level
+        self.nframes = 0
+        self.seq = 0
+        self.mode = None
+
+    def write(self,img):
+        if self.mode is None:
+            self.mode = 'RGBA' if 'A' in img.mode or img.has_transparency_data else 'RGB'
+        img = img.convert(self.mode)
+        buf = io.BytesIO()
+        img.save(buf,'PNG',compress_level=self.compress_level)
+        chunks = _png_chunks(buf.getvalue())
+        if self.nframes==0:
+            self.fp.write(b'\x89PNG\r\n\x1a\n')
+            self.fp.write(_png_chunk(b'IHDR',dict(chunks)[b'IHDR']))
+            self.actl_pos = self.fp.tell()
+            self.fp.write(_png_chunk(b'acTL',struct.pack('>II',0,self.loop)))
+        self.fp.write(_png_chunk(b'fcTL',struct.pack('>IIIIIHHBB',self.seq,img.size[0],img.size[1],0,0,
+                                                      _frame_duration(self.duration,self.nframes),1000,0,0)))
+        self.seq += 1
+        for ctype,data in chunks:
+            if ctype!=b'IDAT':
+                continue
+            if self.nframes==0:
+                self.fp.write(_png_chunk(b'IDAT',data))
+            else:
+                self.fp.write(_png_chunk(b'fdAT',struct.pack('>I',self.seq)+data))
+                self.seq += 1
+        self.nframes += 1
+
+    def close(self):
+        self.fp.write(_png_chunk(b'IEND',b''))
+        end = self.fp.tell()
+        self.fp.seek(self.actl_pos)
+        self.fp.write(_png_chunk(b'acTL',struct.pack('>II',self.nframes,self.loop)))
+        self.fp.seek(end)
+
+def _webp_encoder_ok():
+    # PIL._webpのエンコーダーは非公開で引数がPillowの版で変わるので，確かめた版(11, 12)だけで直接使う
+    import PIL
+    from PIL import features
+    try:
+        major = int(PIL.__version__.split('.')[0])
+    except ValueError:
+        return False
+    return 11<=major<=12 and features.check_module('webp')
+
+class _WebpStream:
+    """
+    アニメーションWebPを書き出す。
+    対応するPillowの版では，エンコーダーにフレームを1枚ずつ渡す (保持されるのは圧縮後のデータのみ)。
+    それ以外の版では，フレームをPNGに圧縮して保持し，closeで公開のImage.save(save_all=True)で書き出す。
+    """
+    def __init__(self,fp,duration,loop,lossless=False,quality=80,method=0):
+        self.fp, self.duration, self.loop = fp, duration, loop
+        self.lossless, self.quality, self.method = lossless, quality, method
+        self.nframes = 0
+        self.timestamp = 0
+        self.enc = None
+        self.frames = None
+
+    def write(self,img):
+        if img.mode not in ('RGBX','RGBA','RGB'):
+            img = img.convert('RGBA' if img.has_transparency_data else 'RGB')
+        if self.nframes==0 and not _webp_encoder_ok():
+            self.frames = []
+        if self.frames is not None:
+            buf = io.BytesIO()
+            img.save(buf,'PNG',compress_level=1)
+            self.frames.append(buf.getvalue())
+        else:
+            from PIL import _webp
+            if self.enc is None:
+                kmin, kmax = (9,17) if self.lossless else (3,5)
+                self.enc = _webp.WebPAnimEncoder(img.size,0,self.loop,False,kmin,kmax,False,False)
+            self.enc.add(img.getim(),round(self.timestamp),self.lossless,self.quality,100,self.method)
+            self.timestamp += _frame_duration(self.duration,self.nframes)
+        self.nframes += 1
+
+    def close(self):
+        if self.frames is not None:
+            from PIL import Image
+            imgs = (Image.open(io.BytesIO(data)) for data in self.frames)
+            first = next(imgs)
+            durations = [_frame_duration(self.duration,i) for i in range(self.nframes)]
+            first.save(self.fp,format='WEBP',save_all=True,append_images=imgs,duration=durations,
+                       loop=self.loop,lossless=self.lossless,quality=self.quality,method=self.method)
+            return
+        self.enc.add(None,round(self.timestamp),self.lossless,self.quality,100,0)
+        data = self.enc.assemble('','','')
+        if data is None:
+            raise Exception("WebP encoder returned no data!")
+        self.fp.write(data)
+
+_streams = {'gif':_GifStream,'webp':_WebpStream,'apng':_ApngStream}
+_extensions = {'.gif':'gif','.webp':'webp','.png':'apng','.apng':'apng'}
+
+class AnimationWriter:
+    """
+    fname_save : string , output file (.gif, .webp, .png/.apng)
+    duration   : int or list , display time of each frame [ms]
+    loop       : int    , number of loops (0: infinite)
+    fmt        : string , "gif", "webp" or "apng". Guessed from fname_save if None
+    kwargs     : format options (gif: palette, delta / webp: lossless, quality, method /
+                 apng: compress_level)
+    ------------------------------------------------------------
+    フレームを1枚ずつ受け取ってアニメーションを書き出すクラス。
+    全フレームをメモリに保持しないので，フレーム数が多くても使用メモリはほぼ一定です。
+
+        with AnimationWriter('./anim.gif',duration=150) as writer:
+            for fname in sorted(glob.glob('./fig/*.png')):
+                writer.append(fname)
+    """
+    def __init__(self,fname_save,duration=150,loop=0,fmt=None,**kwargs):
+        if fmt is None:
+            fmt = _extensions.get(os.path.splitext(fname_save)[1].lower())
+        if fmt not in _streams:
+            raise Exception(f"Animation format of '{fname_save}' is not supported!")
+        self.fname_save = fname_save
+        self.fmt = fmt
+        self.size = None
+        self.fp = open(fname_save,'wb')
+        self.stream = _streams[fmt](self.fp,duration,loop,**kwargs)
+
+    @property
+    def nframes(self):
+        return self.stream.nframes
+
+    def append(self,frame):
+        """frame : PIL.Image, file path, np.ndarray (ny,nx,3|4) uint8 or matplotlib Figure/Axes"""
+        img = _to_image(frame)
+        if self.size is None:
+            self.size = img.size
+        elif img.size!=self.size:
+            raise Exception(f"Frame size {img.size} differs from the first frame {self.size}!")
+        self.stream.write(img)
+
+    def append_figure(self,fig=None,close=False):
+        """
+        fig   : matplotlib Figure or Axes. plt.gcf() if None
+        close : bool , close the figure after grabbing it
+        ------------------------------------------------------------
+        draw_hrz_fieldなどで描いた図を，保存せずにそのままフレームとして追加する。
+
+            with AnimationWriter('./anim.gif',palette='global') as writer:
+                for t in range(field.sizes['time']):
+                    draw_hrz_field(field.isel(time=t),clev_min=-1,clev_max=1,clev_int=0.2)
+                    writer.append_figure(close=True)
+        """
+        import matplotlib.pyplot as plt
+        if fig is None:
+            fig = plt.gcf()
+        self.append(figure_to_image(fig))
+        if close:
+            while not hasattr(fig,'savefig'):
+                fig = fig.figure
+            plt.close(fig)
+
+    def extend(self,frames):
+        for frame in frames:
+            self.append(frame)
+
+    def _discard(self):
+        # 書きかけのファイルを残さない
+        self.fp.close()
+        if os.path.exists(self.fname_save):
+            os.remove(self.fname_save)
+
+    def close(self):
+        if self.fp.closed:
+            return
+        try:
+            if self.nframes==0:
+                raise Exception("No frames were written!")
+            self.stream.close()
+        except BaseException:
+            self._discard()
+            raise
+        self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc,tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+def write_animation(frames,fname_save,duration=150,loop=0,fmt=None,**kwargs):
+    """
+    frames : iterable of PIL.Image, file paths or np.ndarray
+    ------------------------------------------------------------
+    イテレータからフレームを1枚ずつ読み込んでアニメーションを書き出す。
+    書き出したフレーム数を返す。
+    """
+    with AnimationWriter(fname_save,duration=duration,loop=loop,fmt=fmt,**kwargs) as writer:
+        writer.extend(frames)
+    return writer.nframes
+
+def write_figures(figs,fname_save,duration=150,loop=0,fmt=None,close=True,**kwargs):
+    """
+    figs  : iterable of matplotlib Figure/Axes (e.g. a generator that draws one frame each)
+    close : bool , close each figure after it is written
+    ------------------------------------------------------------
+    図をPNGに保存せず，canvasのバッファから直接アニメーションを書き出す。
+    書き出したフレーム数を返す。
+    """
+    with AnimationWriter(fname_save,duration=duration,loop=loop,fmt=fmt,**kwargs) as writer:
+        for fig in figs:
+            writer.append_figure(fig,close=close)
+    return writer.nframes
+
+def create_gif(fname_in,duration=150, loop=0, fname_save='./image.gif', stream=False, **kwargs):
+    """
+    fname_in   : string , 画像ファイルのglobのパターン (ファイル名の順にフレームにする)
+    duration   : int or list , 各フレームの表示時間[ms]
+    loop       : int    , ループ数 (0: 無限)
+    stream     : bool   , Trueなら画像を1枚ずつAnimationWriterで書き出す (全フレームをメモリに載せない)
+    kwargs     : AnimationWriterの形式ごとのオプション (gif: palette, delta など)。指定するとstream=Trueになる
+    ------------------------------------------------------------
+    画像ファイルからアニメーションを作る。既定では以前と同じく，Pillowでまとめて(optimize=True)書き出す。
+    """
+    path_list = sorted(glob.glob(fname_in)) # ファイルパスをソートしてリストする
+    if not path_list:
+        raise Exception(f"No file matches '{fname_in}'!")
+    if stream or kwargs:
+        # 拡張子が.webp/.pngならアニメーションWebP/APNGになる
+        write_animation(path_list,fname_save,duration=duration,loop=loop,**kwargs)
+        return
+    from PIL import Image
+    # 2枚目以降はジェネレータで順に開く。durationで持続時間、loopでループ数を指定可能。
+    with Image.open(path_list[0]) as first:
+        first.save(fname_save,save_all=True,append_images=(Image.open(p) for p in path_list[1:]),
+                   optimize=True,duration=duration,loop=loop)
@@ -0,0 +1,159 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+from matplotlib.contour import ContourSet
+from .grid import subset_to_extent,coarsen_fields
+from .raster import update_raster
+from .meshes import geo_xy
+#
+def _as_list(artists):
+    if artists is None:
+        return []
+    if isinstance(artists,(list,tuple)):
+        return [artist for artist in artists if artist is not None]
+    return [artists]
+
+def contour_kwargs(cs,**kwargs):
+    """
+    cs     : ContourSet (contourf/contour/hatchの戻り値)
+    kwargs : 作ったときの引数で，ContourSetから読めないもの (corner_maskなど。優先して使う)
+    ------------------------------------------------------------
+    同じ見た目のContourSetを作り直すためのcontourf/contourの引数を返す。
+    レベルは数値に確定したもの(levels=9などで自動に決まった値)を使うので，
+    データを入れ替えても色とカラーバーの対応は変わりません。
+    corner_maskを指定しなければ，作った直後に呼ぶ前提で現在のrcParamsの値を使う。
+    """
+    result = dict(levels=cs.levels,zorder=cs.get_zorder(),alpha=cs.get_alpha(),
+                  rasterized=cs.get_rasterized(),transform=ccrs.PlateCarree())
+    if cs.colors is not None:
+        result['colors'] = cs.colors
+    else:
+        result.update(cmap=cs.cmap,norm=cs.norm)
+    if cs.filled:
+        result.update(extend=cs.extend,hatches=cs.hatches,corner_mask=plt.rcParams["contour.corner_mask"])
+    else:
+        result.update(linewidths=cs.get_linewidth(),linestyles=cs.linestyles,
+                      negative_linestyles=cs.negative_linestyles)
+    result.update(kwargs)
+    return result
+
+def _pin_zorder(ax,artist):
+    # 同じzorderで後から追加されたartist(陸地など)より下に描かれているので，
+    # 作り直して最後に追加されても前後関係が変わらないように，zorderを少しだけ下げておく
+    z = artist.get_zorder()
+    children = ax.get_children()
+    if artist in children and any(a.get_zorder()==z for a in children[children.index(artist)+1:]):
+        artist.set_zorder(z-1e-6)
+
+class HrzPlotHandle:
+    """
+    ax      : GeoAxes
+    field1  : ContourSet , 塗りつぶし(contourf, mode="raster"ならAxesImage/QuadMesh)
+    field2  : ContourSet or list , コンター(主・副)
+    hatch   : ContourSet or list , ハッチ
+    clabel  : dict , field2の主コンターに付けるax.clabelの引数 (Noneならラベル無し)
+    extent  : (x_min,x_max,y_min,y_max) , 描画範囲
+    subset  : bool , update時に描画範囲(+のりしろ)だけを切り出して描く
+    coarsen : bool or int , update時に図の画素数に合わせて格子をまとめる (axplot_hrz_fieldのcoarsenと同じ)
+    kwargs  : dict , 層ごと({'field1':{...},'hatch':{...}})の作ったときの引数 (contour_kwargsを参照)
+    ------------------------------------------------------------
+    axplot_hrz_field(..., handle=True) などが返す，データ層だけを描き直すためのオブジェクト。
+    レベル・norm・カラーマップ・カラーバー・ハッチの見た目はそのままで，
+    update(new_field) でcontourf/contour/hatchだけを入れ替えます。
+
+        h = axplot_hrz_field_double_hatch(ax,sst[0],slp[0],pval[0]<0.05,...,handle=True)
+        def animate(t):
+            return h.update(sst[t],slp[t],pval[t]<0.05)
+        anim = FuncAnimation(fig,animate,frames=sst.sizes['time'],blit=True)
+
+    AnimationWriterでは update の後に writer.append_figure(fig) とします。
+    """
+    def __init__(self,ax,field1=None,field2=None,hatch=None,clabel=None,
+                 extent=None,subset=False,coarsen=False,kwargs=None):
+        self.ax = ax
+        self.clabel = clabel
+        self.extent = extent
+        self.subset = subset and extent is not None
+        self.coarsen = coarsen if extent is not None else False
+        self.hatch_color = plt.rcParams["hatch.color"]
+        kwargs = kwargs or {}
+        # layers[key] : [[ContourSet, 作り直すための引数], ...]
+        # 画像(mode="raster")は値だけを入れ替えるので引数は要らない
+        self.layers = {}
+        for key,artists in (('field1',field1),('field2',field2),('hatch',hatch)):
+            self.layers[key] = []
+            for cs in _as_list(artists):
+                if isinstance(cs,ContourSet):
+                    _pin_zorder(ax,cs)
+                    self.layers[key].append([cs,contour_kwargs(cs,**kwargs.get(key,{}))])
+                else:
+                    self.layers[key].append([cs,None])
+
+    @property
+    def artists(self):
+        """描かれているデータ層のartist(コンターのラベルを含む)のリスト。"""
+        artists = []
+        for layers in self.layers.values():
+            for cs, _ in layers:
+                artists.append(cs)
+                artists.extend(getattr(cs,'labelTexts',[]))
+        return artists
+
+    @property
+    def colorbar(self):
+        for cs, _ in self.layers['field1']:
+            if getattr(cs,'colorbar',None) is not None:
+                return cs.colorbar
+        return None
+
+    def _prepare(self,key,field):
+        # 最初の描画と同じように切り出し・間引きをする
+        if self.subset:
+            field = subset_to_extent(field,*self.extent)
+        if self.coarsen:
+            field, = coarsen_fields(self.ax,*self.extent,field,factor=self.coarsen,
+                                    method='stride' if key=='hatch' else 'mean')
+        return field
+
+    def _redraw(self,key,i,field):
+        old, kwargs = self.layers[key][i]
+        if kwargs is None:
+            update_raster(old,self._prepare(key,field))
+            return
+        colorbar = getattr(old,'colorbar',None)
+        old.remove()
+        if key=='hatch':
+            plt.rcParams["hatch.color"]=self.hatch_color
+        field = self._prepare(key,field)
+        if 'lat' in field.dims and 'lon' in field.dims:
+            field = field.transpose(...,'lat','lon')
+        x, y, z = field.lon.values, field.lat.values, np.asarray(field)
+        x, y, transform = geo_xy(self.ax,x,y,kwargs['transform'])
+        kwargs = dict(kwargs,transform=transform)
+        if old.filled:
+            new = self.ax.contourf(x,y,z,**kwargs)
+        else:
+            new = self.ax.contour(x,y,z,**kwargs)
+        if key=='field2' and i==0 and self.clabel is not None:
+            self.ax.clabel(new,**self.clabel)
+        if colorbar is not None:
+            # norm/cmapは同じなのでカラーバーは描き直さない
+            colorbar.mappable = new
+            new.colorbar = colorbar
+        self.layers[key][i][0] = new
+
+    def update(self,field1=None,field2=None,field_hatch=None):
+        """
+        field1      : xr.DataArray , 2-dims. 塗りつぶしの新しいデータ
+        field2      : xr.DataArray , 2-dims. コンターの新しいデータ
+        field_hatch : xr.DataArray , 2-dims. ハッチの新しいデータ
+        ------------------------------------------------------------
+        Noneの層はそのまま残す。FuncAnimation(blit=True)で使えるように，
+        描き直した後のデータ層のartistのリストを返す。
+        """
+        for key,field in (('field1',field1),('field2',field2),('hatch',field_hatch)):
+            if field is None:
+                continue
+            for i in range(len(self.layers[key])):
+                self._redraw(key,i,field)
+        return self.artists
@@ -0,0 +1,133 @@
+import os
+import time
+import numpy as np
+#
+# 子プロセス側で保持する状態 (initializerで設定)
+_worker = {}
+
+def _attach_shared_memory(name):
+    # 後片付け(unlink)は親プロセスが行う
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name,track=False)
+    except TypeError: # python<3.13 (resource trackerは親と共有される)
+        return shared_memory.SharedMemory(name=name)
+
+def _resolve_func(func):
+    if isinstance(func,str):
+        import tamdraw
+        func = getattr(tamdraw,func)
+    return func
+
+def _format_keys(index,dim,coord):
+    keys = {'index':index}
+    if coord is not None:
+        keys[dim] = coord[index]
+    return keys
+
+def _render_one(func,args,index,keys,fname_save,kwargs):
+    import matplotlib.pyplot as plt
+    kwargs = dict(kwargs)
+    if isinstance(kwargs.get('title'),str):
+        kwargs['title'] = kwargs['title'].format(**keys)
+    fname = fname_save.format(**keys)
+    t0 = time.perf_counter()
+    func(*args,savefig=True,fname_save=fname,**kwargs)
+    plt.close('all')
+    return {'index':index,'fname':fname,'seconds':time.perf_counter()-t0}
+
+def _init_worker(func,specs,dim,coord,fname_save,kwargs):
+    import matplotlib
+    matplotlib.use('Agg')
+    shms, args = [], []
+    for spec in specs:
+        if spec[0]=='shared':
+            _, name, shape, dtype, template = spec
+            shm = _attach_shared_memory(name)
+            shms.append(shm)
+            args.append(('shared',np.ndarray(shape,dtype=dtype,buffer=shm.buf),template))
+        else:
+            args.append(spec)
+    _worker.update(func=_resolve_func(func),args=args,shms=shms,dim=dim,coord=coord,
+                   fname_save=fname_save,kwargs=kwargs)
+
+def _frame_template(arr,dim):
+    # 1フレームのDataArrayを作るための次元・座標・属性 (データは含めない)
+    first = arr.isel({dim:0},drop=True)
+    coords = {name:(c.dims,c.values,c.attrs) for name,c in first.coords.items()}
+    return first.dims, coords, first.name, first.attrs
+
+def _frame(template,data):
+    import xarray as xr
+    dims, coords, name, attrs = template
+    return xr.DataArray(data,dims=dims,coords=coords,name=name,attrs=attrs)
+
+def _worker_render(index):
+    args = [_frame(arg[2],arg[1][index]) if arg[0]=='shared' else arg[1]
+            for arg in _worker['args']]
+    keys = _format_keys(index,_worker['dim'],_worker['coord'])
+    return _render_one(_worker['func'],args,index,keys,_worker['fname_save'],_worker['kwargs'])
+
+def render_hrz_batch(func,*args,dim='time',fname_save='./frame_{index:04d}.png',
+                     nworkers=None,**kwargs):
+    """
+    func       : draw_hrz_field family function (or its name, e.g. "draw_hrz_field_double_hatch")
+    args       : positional arguments of func. xr.DataArrays having `dim` are sliced frame by frame,
+                 the others (e.g. tc_val) are passed to every frame as they are
+    dim        : string , dimension to iterate over
+    fname_save : string , output file template. {index} and {<dim>} (coordinate value) can be used,
+                 e.g. "./fig/sst_{time:%Y%m%d}.png". `title` kwarg is formatted in the same way
+    nworkers   : int    , number of processes (os.cpu_count() if None, 1: run in this process)
+    kwargs     : keyword arguments of func (clev_min, x_min, cmap, ...)
+    ------------------------------------------------------------
+    dimに沿った全スライスを複数プロセスで描画して保存する関数。
+    データは共有メモリに1回だけコピーし，各プロセスはスライスごとにpickleせずに参照します。
+    各フレームの {'index','fname','seconds'} のリストを返す。
+
+        render_hrz_batch(draw_hrz_field,sst,dim='time',fname_save='./fig/sst_{time:%Y%m%d}.png',
+                         clev_min=-2,clev_max=2,clev_int=0.2,nworkers=8)
+    """
+    import xarray as xr
+    sliced = [isinstance(arg,xr.DataArray) and dim in arg.dims for arg in args]
+    if not any(sliced):
+        raise Exception(f"No DataArray has the dimension '{dim}'!")
+    nframe = [arg.sizes[dim] for arg,s in zip(args,sliced) if s]
+    if len(set(nframe))!=1:
+        raise Exception(f"Length of '{dim}' is not the same among the DataArrays!")
+    nframe = nframe[0]
+    first = args[sliced.index(True)]
+    coord = first.indexes[dim] if dim in first.indexes else None
+    nworkers = os.cpu_count() if nworkers is None else nworkers
+    dirname = os.path.dirname(fname_save)
+    if dirname and '{' not in dirname:
+        os.makedirs(dirname,exist_ok=True)
+
+    if nworkers<=1:
+        func = _resolve_func(func)
+        return [_render_one(func,[arg.isel({dim:i}) if s else arg for arg,s in zip(args,sliced)],
+                            i,_format_keys(i,dim,coord),fname_save,kwargs)
+                for i in range(nframe)]
+
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    shms, specs = [], []
+    try:
+        for arg,s in zip(args,sliced):
+            if not s:
+                specs.append(('const',arg))
+                continue
+            arr = arg.transpose(dim,...)
+            shm = shared_memory.SharedMemory(create=True,size=max(arr.nbytes,1))
+            shms.append(shm)
+            buf = np.ndarray(arr.shape,dtype=arr.dtype,buffer=shm.buf)
+            buf[...] = arr.values
+            del buf
+            # 次元・座標はinitializerで各プロセスに1回だけ渡し，フレームごとには番号だけを渡す
+            specs.append(('shared',shm.name,arr.shape,arr.dtype,_frame_template(arr,dim)))
+        with ProcessPoolExecutor(max_workers=nworkers,initializer=_init_worker,
+                                 initargs=(func,specs,dim,coord,fname_save,kwargs)) as pool:
+            return list(pool.map(_worker_render,range(nframe)))
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
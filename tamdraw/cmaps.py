@@ -0,0 +1,168 @@
+import os
+import glob
+import numpy as np
+import matplotlib as mpl
+import matplotlib.colors as mcolors
+
+current_dir=os.path.dirname(os.path.abspath(__file__))
+cmap_master_dir_path=os.path.join(current_dir,'colormaps-master')
+cmap_bundle_path=os.path.join(cmap_master_dir_path,'ipcc_colormaps.npz')
+
+# 一度だけ読み込んだカラーテーブルとColormapオブジェクトを保持する
+_cmap_tables = None
+_cmap_cache = {}
+_registered = False
+
+def parse_cmap_sources(cmap_dir=cmap_master_dir_path):
+    """
+    cmap_dir : string , path to the colormaps-master directory
+    ------------------------------------------------------------
+    colormaps-masterのテキスト/xlsxファイルを全て読み込み，
+    {"kind.name": (N,3) array} の辞書を返す関数。
+    kindは "continuous"(0-1), "categorical"(0-255), "discrete"(0-255)。
+    discreteの読み込みにはopenpyxlが必要です(無ければスキップ)。
+    """
+    tables = {}
+    for path in sorted(glob.glob(f'{cmap_dir}/continuous_colormaps_rgb_0-1/*.txt')):
+        name = os.path.splitext(os.path.basename(path))[0]
+        tables[f'continuous.{name}'] = np.loadtxt(path).astype(np.float32)
+    for path in sorted(glob.glob(f'{cmap_dir}/categorical_colors_rgb_0-255/*.txt')):
+        name = os.path.splitext(os.path.basename(path))[0]
+        tables[f'categorical.{name}'] = np.loadtxt(path,ndmin=2).astype(np.uint8)
+    try:
+        import openpyxl
+    except ImportError:
+        return tables
+    wb = openpyxl.load_workbook(f'{cmap_dir}/discrete_colormaps.xlsx',read_only=True,data_only=True)
+    for ws in wb.worksheets:
+        # シートは "temp_div_5" のような見出し行の後にRGB行が続く構造
+        name, rows = None, []
+        for row in ws.iter_rows(values_only=True):
+            if isinstance(row[0],str):
+                if name is not None:
+                    tables[f'discrete.{name}'] = np.array(rows,dtype=np.uint8)
+                name, rows = row[0].strip(), []
+            elif row[0] is not None:
+                rows.append(row[:3])
+        if name is not None:
+            tables[f'discrete.{name}'] = np.array(rows,dtype=np.uint8)
+    wb.close()
+    return tables
+
+def build_cmap_bundle(fname_save=cmap_bundle_path,cmap_dir=cmap_master_dir_path):
+    """
+    元のテキスト/xlsxファイルを解析し，パッケージ同梱の圧縮バイナリ(npz)を作り直す関数。
+    カラーテーブルを追加・変更したときだけ実行すれば良いです。
+    """
+    tables = parse_cmap_sources(cmap_dir)
+    np.savez_compressed(fname_save,**tables)
+    return fname_save
+
+def load_cmap_tables():
+    """
+    全カラーテーブルの辞書を返す。プロセス内で最初の1回だけnpzを読み込む。
+    npzが無い場合は元のテキストファイルから解析する。
+    """
+    global _cmap_tables
+    if _cmap_tables is None:
+        if os.path.exists(cmap_bundle_path):
+            with np.load(cmap_bundle_path) as npz:
+                _cmap_tables = {key:npz[key] for key in npz.files}
+        else:
+            _cmap_tables = parse_cmap_sources()
+    return _cmap_tables
+
+def ipcc_cmap_names(kind=None):
+    """
+    kind : string , "continuous", "categorical", "discrete" or None(all)
+    ------------------------------------------------------------
+    利用できるカラーマップ名のリストを返す。
+    """
+    return [key.split('.',1)[1] for key in load_cmap_tables()
+            if kind is None or key.split('.',1)[0]==kind]
+
+def _find_table(cmname):
+    tables = load_cmap_tables()
+    for kind in ('continuous','categorical','discrete'):
+        key = f'{kind}.{cmname}'
+        if key in tables:
+            return kind, tables[key]
+    raise Exception(f"Colormap '{cmname}' is not in colormaps-master!")
+
+def _cached_cmap(cmname,reverse):
+    # 表から作ったカラーマップはプロセス内で1回だけ作る (呼び出し側には渡さない)
+    key = (cmname,reverse)
+    if key in _cmap_cache:
+        return _cmap_cache[key]
+    if reverse:
+        cmap = _cached_cmap(cmname,False).reversed(name=f'ipcc_{cmname}_r')
+    else:
+        kind, table = _find_table(cmname)
+        if kind=='continuous':
+            cmap = mcolors.LinearSegmentedColormap.from_list(f'ipcc_{cmname}',table,N=len(table))
+        else:
+            cmap = mcolors.ListedColormap(table/255.,name=f'ipcc_{cmname}')
+    _cmap_cache[key] = cmap
+    return cmap
+
+def get_ipcc_cmap(cmname='slev_div',reverse=False):
+    """
+    cmname  : string , name of the table (e.g. "temp_div", "bright_cat", "temp_div_11")
+    reverse : bool   , return the reversed colormap
+    ------------------------------------------------------------
+    カラーマップオブジェクトを返す。表の読み込みと変換はキャッシュし，呼び出しごとに
+    コピーを返すので，set_badなどで書き換えても他の呼び出しには影響しません。
+    """
+    if cmname.endswith('_r') and cmname not in ipcc_cmap_names():
+        cmname, reverse = cmname[:-2], not reverse
+    return _cached_cmap(cmname,reverse).copy()
+
+def register_ipcc_cmaps():
+    """
+    全てのカラーマップ(反転版を含む)を "ipcc_<name>", "ipcc_<name>_r" の名前で
+    matplotlibに登録する。これで cmap="ipcc_temp_div" のように名前で指定できます。
+    2回目以降の呼び出しは何もしません。
+    """
+    global _registered
+    if _registered:
+        return
+    for cmname in ipcc_cmap_names():
+        for reverse in (False,True):
+            cmap = _cached_cmap(cmname,reverse)
+            if cmap.name not in mpl.colormaps:
+                mpl.colormaps.register(cmap,name=cmap.name)
+    _registered = True
+
+def cmaps_ipcc(cmname='slev_div'):
+    return get_ipcc_cmap(cmname)
+
+def cmap_white_in_mid(cmap,wmin=0.45,wmax=0.55):
+    import matplotlib.pyplot as plt
+    cmap_obj = plt.cm.get_cmap(cmap)
+    colors = [(cmap_obj(i)) if (i < wmin or i > wmax) else (1, 1, 1, 1) for i in np.linspace(0, 1, 256)]
+    custom_cmap = mcolors.LinearSegmentedColormap.from_list('custom_RdBu_r', colors)
+
+def cmap_centwhite(cmap, center_fraction=0.1):
+    """
+    Modify a given colormap by making the central `center_fraction` portion white.
+
+    Parameters:
+    - cmap_name: str, name of the original colormap
+    - center_fraction: float, fraction of colormap to turn white (default 0.1)
+
+    Returns:
+    - new_cmap: matplotlib.colors.ListedColormap, modified colormap
+    """
+    # cmap = cm.get_cmap(cmap_name, 256)  # Get the colormap
+    colors = cmap(np.linspace(0, 1, 256))  # Convert to RGBA values
+    
+    # Determine the indices for the central region
+    center_start = int(0.5 * 256 - (center_fraction / 2) * 256)
+    center_end = int(0.5 * 256 + (center_fraction / 2) * 256)
+
+    # Set the central region to white
+    colors[center_start:center_end] = [1, 1, 1, 1]  # RGBA for white
+
+    # Create a new colormap
+    new_cmap = mcolors.ListedColormap(colors)
+    return new_cmap
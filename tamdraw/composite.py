@@ -0,0 +1,150 @@
+import numpy as np
+#
+def _check_duplicates(values):
+    # 同じ事例を2回数えるかどうかが曖昧になるので，重複はエラーにする (resample.event_indexと同じ)
+    unique, counts = np.unique(values,return_counts=True)
+    if np.any(counts>1):
+        raise Exception(f"Duplicate events {unique[counts>1][:5]} are given!")
+    return unique
+
+def _prepare_events(events):
+    # ('bool', mask) , ('index', 番号) or ('time', 時刻)
+    values = np.asarray(getattr(events,'values',events))
+    if values.dtype==bool:
+        return 'bool', values
+    if values.dtype.kind in 'iu':
+        if len(values) and values.min()<0:
+            raise Exception("Negative event indices are not supported when streaming!")
+        return 'index', _check_duplicates(values.ravel())
+    if values.dtype.kind in 'UO':
+        values = values.astype('datetime64[ns]')
+    return 'time', _check_duplicates(values.ravel())
+
+def _event_rows(part,time,offset,events):
+    kind, values = events
+    n = part.sizes[time]
+    if kind=='bool':
+        # 足りないときは読み終わる前にエラーにする (長すぎるときは_accumulateで調べる)
+        if offset+n>len(values):
+            raise Exception(f"Length of the bool events ({len(values)}) is not that of '{time}' "
+                            f"({offset+n} or more)!")
+        return values[offset:offset+n]
+    if kind=='index':
+        return np.isin(np.arange(offset,offset+n),values)
+    return np.isin(part[time].values,values)
+
+def _welford_merge(state,data):
+    # Chanらの方法でchunkの (個数, 平均, 偏差の2乗和) をまとめて足す
+    n, mean, m2 = state
+    valid = np.isfinite(data)
+    nb = valid.sum(axis=0)
+    sb = np.where(valid,data,0.).sum(axis=0)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        mb = np.where(nb>0,sb/nb,0.)
+    m2b = np.where(valid,(data-mb)**2,0.).sum(axis=0)
+    total = n+nb
+    with np.errstate(invalid='ignore',divide='ignore'):
+        delta = mb-mean
+        mean += np.where(total>0,delta*nb/total,0.)
+        m2 += m2b+np.where(total>0,delta**2*n*nb/total,0.)
+    state[0] = total
+
+def _accumulate(source,var,events,time,chunk,max_mb,engine,select):
+    from .stream import iter_time_chunks
+    states, template, offset, nevent = None, None, 0, 0
+    for part in iter_time_chunks(source,var,time,chunk,max_mb,engine,select):
+        part = part.transpose(time,...)
+        data = np.asarray(part.values,dtype=float)
+        if template is None:
+            template = part.isel({time:0},drop=True)
+            states = {group:[np.zeros(data.shape[1:]),np.zeros(data.shape[1:]),np.zeros(data.shape[1:])]
+                      for group in ('event','rest')}
+        rows = _event_rows(part,time,offset,events)
+        nevent += int(rows.sum())
+        if rows.any():
+            _welford_merge(states['event'],data[rows])
+        if not rows.all():
+            _welford_merge(states['rest'],data[~rows])
+        offset += part.sizes[time]
+    if template is None:
+        raise Exception("No data was read!")
+    kind, values = events
+    if kind=='bool' and len(values)!=offset:
+        raise Exception(f"Length of the bool events ({len(values)}) is not that of '{time}' ({offset})!")
+    nexpect = int(values.sum()) if kind=='bool' else len(values)
+    if nevent!=nexpect:
+        raise Exception(f"Only {nevent} of {nexpect} events are found in '{time}'!")
+    return states, template
+
+def _merge_states(a,b):
+    n = a[0]+b[0]
+    with np.errstate(invalid='ignore',divide='ignore'):
+        delta = b[1]-a[1]
+        mean = a[1]+np.where(n>0,delta*b[0]/n,0.)
+        m2 = a[2]+b[2]+np.where(n>0,delta**2*a[0]*b[0]/n,0.)
+    return [n,mean,m2]
+
+def _composite_stats(states,reference):
+    if reference not in ('rest','all'):
+        raise Exception(f"reference must be 'rest' or 'all', not '{reference}'!")
+    event = states['event']
+    ref = states['rest'] if reference=='rest' else _merge_states(states['event'],states['rest'])
+    with np.errstate(invalid='ignore',divide='ignore'):
+        (n1,m1,s1), (n2,m2,s2) = ((n,np.where(n>0,mean,np.nan),m2/(n-1)) for n,mean,m2 in (event,ref))
+        a, b = s1/n1, s2/n2
+        if reference=='rest':
+            # 2つの群の平均の差のWelchのt値と，Welch-Satterthwaiteの自由度
+            tval = (m1-m2)/np.sqrt(a+b)
+            dof = (a+b)**2/(a**2/(n1-1)+b**2/(n2-1))
+            valid = (n1>=2)&(n2>=2)
+        else:
+            # 気候値は事例を含むので2標本の検定はできない: 気候値の平均を既知の値とした1標本のt値
+            tval = (m1-m2)/np.sqrt(a)
+            dof = n1-1.
+            valid = (n1>=2)&(n2>=1)
+    return m1, m2, np.where(valid,tval,np.nan), np.where(valid,dof,np.nan)
+
+def build_composite(source1,events,source2=None,var1=None,var2=None,anomaly=True,reference='rest',
+                    alpha=0.95,time='time',chunk=None,max_mb=256,engine=None,select=None):
+    """
+    source1  : xr.DataArray (time,lat,lon) , またはファイル名(globのパターン可)・Dataset・リスト (iter_time_chunksと同じ)
+               塗りつぶしとt検定に使う変数
+    events   : 事例の時刻 (field[time]の値, 文字列も可), 事例の番号(int, 全期間の通し番号), またはtimeと同じ長さのbool
+    source2  : source1と同じ形式 , 等値線に使う2つ目の変数 (Noneならfield2はNone)
+    var1, var2 : string , ファイル・Datasetのときの変数名
+    anomaly  : bool   , Trueなら事例の平均から基準の平均を引いた偏差を返す (Falseなら事例の平均)
+    reference: string , "rest" : 事例以外の時刻と比べる (Welchの2標本のt検定)
+                        "all"  : 全ての時刻の平均(気候値)と比べる (気候値を既知とした1標本のt検定)
+    alpha    : float  , tc_valの信頼水準 (0.95なら両側5%)
+    chunk, max_mb, engine, select : iter_time_chunksと同じ (1回に読む時間の長さ・読む範囲。selectはdictも可)
+    ------------------------------------------------------------
+    事例の合成(コンポジット)図の (field1, field2, field_hatch, tc_val) を返す関数。
+    timeの方向にchunkずつ読み，事例と基準の2つの群の格子点ごとの個数・平均・偏差の2乗和を
+    Welford(Chan)の方法で足していくので，全期間を読み込まずに1回の読み込みで計算します。
+    field_hatchは2つの群の平均の差のWelchのt値，tc_valはWelch-Satterthwaiteの自由度による
+    格子点ごとのt値の臨界値 (DataArray)。reference="all"ではfield_hatchは1標本のt値，自由度は事例の数-1。
+    NaNは格子点ごとに除く。同じ事例を重複して渡すとエラーになる。
+
+        comp = build_composite("./olr/olr_*.nc",mjo_dates,"./u850/u850_*.nc",var1="olr",var2="u")
+        draw_hrz_field_double_hatch(*comp,clev_min1=-30,clev_max1=30,clev_int1=5)
+    """
+    import xarray as xr
+    from .signif import t_critical
+    events = _prepare_events(events)
+    states, template = _accumulate(source1,var1,events,time,chunk,max_mb,engine,select)
+    m1, m2, tval, dof = _composite_stats(states,reference)
+    def wrap(values,name,attrs):
+        return xr.DataArray(values,dims=template.dims,coords=template.coords,name=name,attrs=attrs)
+    nevent = int(np.max(states['event'][0]))
+    attrs = dict(template.attrs,nevent=nevent,reference=reference)
+    field1 = wrap(m1-m2 if anomaly else m1,template.name,attrs)
+    field2 = None
+    if source2 is not None:
+        states2, template2 = _accumulate(source2,var2,events,time,chunk,max_mb,engine,select)
+        mean2, ref2 = _composite_stats(states2,reference)[:2]
+        field2 = xr.DataArray(mean2-ref2 if anomaly else mean2,dims=template2.dims,coords=template2.coords,
+                              name=template2.name,attrs=dict(template2.attrs,nevent=nevent,reference=reference))
+    long_name = 'Welch t-statistic' if reference=='rest' else 'one-sample t-statistic'
+    field_hatch = wrap(tval,'tval',{'long_name':long_name,'nevent':nevent})
+    tc_val = t_critical(wrap(dof,'dof',{}),alpha).rename('tcval')
+    return field1, field2, field_hatch, tc_val
@@ -0,0 +1,117 @@
+import collections
+import numpy as np
+import cartopy.crs as ccrs
+#
+# Natural Earthの形状のキャッシュ
+#   _raw_geoms   : (kind, scale) -> 緯度経度のshapely geometryのリスト
+#   _proj_geoms  : (kind, scale, projection) -> 投影済みのshapely geometryのリスト
+#   _path_cache  : (kind, scale, projection, 範囲) -> 投影・切り抜き済みのmatplotlib Pathのリスト
+#                  (範囲ごとに増えるので，最近使った_path_cache_max個だけを残す)
+_raw_geoms = {}
+_proj_geoms = {}
+_path_cache = collections.OrderedDict()
+_path_cache_max = 64
+
+def _projection_key(projection):
+    return (type(projection).__name__,projection.proj4_init)
+
+def _raw_geometries(kind,scale):
+    key = (kind,scale)
+    if key not in _raw_geoms:
+        import cartopy.feature as cfea
+        feature = cfea.NaturalEarthFeature('physical',kind,scale)
+        _raw_geoms[key] = list(feature.geometries())
+    return _raw_geoms[key]
+
+def _projected_geometries(kind,scale,projection):
+    key = (kind,scale,_projection_key(projection))
+    if key not in _proj_geoms:
+        src = ccrs.PlateCarree()
+        geoms = [projection.project_geometry(geom,src) for geom in _raw_geometries(kind,scale)]
+        _proj_geoms[key] = [geom for geom in geoms if not geom.is_empty]
+    return _proj_geoms[key]
+
+def _geoms_to_path(geom):
+    try:
+        from cartopy.mpl.path import shapely_to_path
+        return shapely_to_path(geom)
+    except ImportError: # cartopy<0.23
+        from matplotlib.path import Path
+        from cartopy.mpl.patch import geos_to_path
+        return Path.make_compound_path(*geos_to_path(geom))
+
+def cached_feature_paths(kind,projection,bounds,scale='50m'):
+    """
+    kind       : string , "land" or "coastline"
+    projection : cartopy CRS of the axes
+    bounds     : (xmin,xmax,ymin,ymax) in projection coordinates
+    scale      : string , "110m", "50m" or "10m"
+    ------------------------------------------------------------
+    Natural Earthの陸地/海岸線をprojectionに投影し，bounds(少し余白を付ける)で
+    切り抜いたmatplotlib Pathのリストを返す。(kind,scale,projection,bounds)ごとに
+    キャッシュするので，同じ範囲の2枚目以降のパネル・フレームでは再計算しません。
+    キャッシュは最近使った_path_cache_max個の範囲まで。
+    """
+    bounds = tuple(float(b) for b in np.round(bounds,6))
+    key = (kind,scale,_projection_key(projection),bounds)
+    if key in _path_cache:
+        _path_cache.move_to_end(key)
+        return _path_cache[key]
+    import shapely.geometry as sgeom
+    xmin, xmax, ymin, ymax = bounds
+    mx, my = 0.02*(xmax-xmin), 0.02*(ymax-ymin)
+    box = sgeom.box(xmin-mx,ymin-my,xmax+mx,ymax+my)
+    paths = []
+    for geom in _projected_geometries(kind,scale,projection):
+        gxmin, gymin, gxmax, gymax = geom.bounds
+        if gxmax<box.bounds[0] or gxmin>box.bounds[2] or gymax<box.bounds[1] or gymin>box.bounds[3]:
+            continue
+        if not box.contains(geom):
+            geom = geom.intersection(box)
+        if geom.is_empty:
+            continue
+        path = _geoms_to_path(geom)
+        if len(path.vertices):
+            paths.append(path)
+    _path_cache[key] = paths
+    while len(_path_cache)>_path_cache_max:
+        _path_cache.popitem(last=False)
+    return paths
+
+def clear_feature_cache():
+    """形状のキャッシュを空にする。"""
+    _raw_geoms.clear()
+    _proj_geoms.clear()
+    _path_cache.clear()
+
+def _add_cached_feature(ax,kind,scale,extent,**kwargs):
+    from matplotlib.collections import PathCollection
+    if extent is not None:
+        ax.set_extent(extent,crs=ccrs.PlateCarree())
+    bounds = (*ax.get_xlim(),*ax.get_ylim())
+    paths = cached_feature_paths(kind,ax.projection,bounds,scale=scale)
+    coll = PathCollection(paths,transform=ax.transData,**kwargs)
+    coll.set_clip_path(ax.patch)
+    ax.add_collection(coll,autolim=False)
+    return coll
+
+def add_land(ax,scale='50m',fc='lightgray',zorder=2,extent=None,**kwargs):
+    """
+    ax     : GeoAxes
+    scale  : string , resolution of Natural Earth ("110m","50m","10m")
+    fc     : color of the land
+    extent : [x_min,x_max,y_min,y_max] (lon/lat). 指定した場合はax.set_extentも行う
+    ------------------------------------------------------------
+    ax.add_feature(cfea.LAND.with_scale(scale),fc=fc) と同じ見た目で，
+    投影・切り抜き済みの形状をキャッシュから描く。
+    """
+    kwargs.setdefault('edgecolor','face')
+    return _add_cached_feature(ax,'land',scale,extent,facecolor=fc,zorder=zorder,**kwargs)
+
+def add_coastlines(ax,scale='50m',linewidth=0.5,zorder=3,extent=None,color='black',**kwargs):
+    """
+    ax.coastlines(resolution=scale,linewidth=linewidth) と同じ見た目で，
+    投影・切り抜き済みの形状をキャッシュから描く。
+    """
+    return _add_cached_feature(ax,'coastline',scale,extent,facecolor='none',edgecolor=color,
+                               linewidth=linewidth,zorder=zorder,**kwargs)
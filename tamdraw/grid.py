@@ -0,0 +1,190 @@
+import numpy as np
+#
+def _is_global(lon):
+    if len(lon)<2:
+        return False
+    dlon = np.median(np.diff(lon))
+    return lon[-1]-lon[0]+dlon >= 360-1e-3*dlon
+
+def _lon_indices(lon,x_min,x_max,halo):
+    """
+    経度方向に切り出す格子点の番号を返す。連続していればslice，
+    0/360(または±180)をまたぐ場合は番号の配列を返す。切り出さない場合はNone。
+    """
+    n = len(lon)
+    if n<2 or x_max-x_min>=360 or np.any(np.diff(lon)<=0):
+        return None
+    inside = np.mod(lon-x_min,360) <= x_max-x_min
+    if not inside.any(): # 範囲が格子間隔より狭い
+        inside[np.argmin(np.abs(np.mod(lon-x_min+180,360)-180))] = True
+    count = int(inside.sum())
+    # 範囲の先頭 (一つ前の点が範囲外になっている点)
+    start = int(np.flatnonzero(inside & ~np.roll(inside,1))[0]) if count<n else 0
+    start, count = start-halo, count+2*halo
+    if count>=n:
+        return None
+    if _is_global(lon):
+        if start>=0 and start+count<=n:
+            return slice(start,start+count)
+        return np.arange(start,start+count)%n
+    # 全球でないデータは端で打ち切る (両端にまたがる場合は切り出さない)
+    if inside[0] and inside[-1]:
+        return None
+    return slice(max(start,0),min(start+count,n))
+
+def _lat_indices(lat,y_min,y_max,halo):
+    inside = np.flatnonzero((lat>=y_min)&(lat<=y_max))
+    if len(inside)==0:
+        return None
+    i0, i1 = max(inside[0]-halo,0), min(inside[-1]+halo+1,len(lat))
+    if (i0,i1)==(0,len(lat)):
+        return None
+    return slice(int(i0),int(i1))
+
+def subset_to_extent(field,x_min=120,x_max=260,y_min=-20,y_max=70,halo=2):
+    """
+    field : xr.DataArray , "lon","lat"の次元を持つ配列
+    x_min,x_max,y_min,y_max : 描画範囲 (ax.set_extentと同じ, 経度は0-360でも-180-180でも良い)
+    halo  : int , 範囲の外側に残す格子点の数 (コンターが範囲の端で途切れないように)
+    ------------------------------------------------------------
+    描画範囲とその外側のhalo点だけを切り出す関数。contourfの前に使うと，
+    表示されない領域のコンターを計算しなくて済みます。
+    範囲が連続していればビュー(コピー無し)を返し，0/360や±180をまたぐ場合だけ
+    つなぎ合わせて(経度が単調増加になるように360を足して)返す。
+    lon/latが無いものやDataArray以外はそのまま返す。
+    """
+    dims = getattr(field,'dims',())
+    if 'lon' not in dims or 'lat' not in dims:
+        return field
+    lon = np.asarray(field['lon'])
+    lat = np.asarray(field['lat'])
+    indexers = {}
+    ilat = _lat_indices(lat,y_min,y_max,halo)
+    if ilat is not None:
+        indexers['lat'] = ilat
+    ilon = _lon_indices(lon,x_min,x_max,halo)
+    if ilon is not None:
+        indexers['lon'] = ilon
+    if not indexers:
+        return field
+    sub = field.isel(indexers)
+    if isinstance(ilon,np.ndarray):
+        # つなぎ目から後ろの経度に360を足して単調増加にする
+        newlon = np.asarray(sub['lon'],dtype=float).copy()
+        jump = np.flatnonzero(np.diff(newlon)<0)
+        if len(jump):
+            newlon[jump[0]+1:] += 360
+        sub = sub.assign_coords(lon=newlon)
+    return sub
+
+def subset_fields(x_min,x_max,y_min,y_max,*fields,halo=2):
+    """
+    subset_to_extentを複数の配列にまとめて適用する。float(tc_valなど)はそのまま返す。
+    """
+    return tuple(subset_to_extent(field,x_min,x_max,y_min,y_max,halo=halo) for field in fields)
+
+def resolve_levels(field,levels,center=None):
+    """
+    field  : xr.DataArray or np.ndarray
+    levels : int or array , contourf/contourのlevels
+    center : float        , contourfに渡すcenter (Noneならデータが0をまたぐときだけ0を中心にする)
+    ------------------------------------------------------------
+    levels=9 のような個数だけの指定を，xarrayのplotと同じ規則で具体的な値にする。
+    間引く前のデータでレベルを決めておけば，間引いた後も同じレベルで描けます。
+    配列で指定されている場合はそのまま返す。
+    """
+    if not np.isscalar(levels):
+        return levels
+    from matplotlib.ticker import MaxNLocator
+    data = np.asarray(field,dtype=float)
+    data = data[np.isfinite(data)]
+    vmin, vmax = (float(data.min()), float(data.max())) if data.size else (0.,0.)
+    if center is not None or vmin<0<vmax:
+        center = 0. if center is None else center
+        vlim = max(abs(vmin-center),abs(vmax-center))
+        vmin, vmax = center-vlim, center+vlim
+    return MaxNLocator(levels-1).tick_values(vmin,vmax)
+
+def _block_mean(data,factors,min_valid):
+    # factors({axis: 点数})のブロックごとにNaNを除いて平均する (有効な点の割合がmin_valid未満ならNaN)
+    # 方向ごとに順に平均すると欠測の多い行・列の重みが変わるので，ブロック全体でまとめて平均する
+    index, shape = [], []
+    for axis,n in enumerate(data.shape):
+        f = factors.get(axis,1)
+        index.append(slice(0,n//f*f))
+        shape.extend([n//f,f])
+    blocks = data[tuple(index)].reshape(shape)
+    inner = tuple(range(1,2*data.ndim,2))
+    valid = np.isfinite(blocks)
+    count = valid.sum(axis=inner)
+    total = np.where(valid,blocks,0.).sum(axis=inner)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        mean = total/count
+    return np.where(count>=min_valid*np.prod(list(factors.values())),mean,np.nan)
+
+def coarsen_field(field,fx=1,fy=1,method='mean',min_valid=0.5):
+    """
+    field     : xr.DataArray , "lon","lat"の次元を持つ配列
+    fx, fy    : int , 経度・緯度方向に何点を1点にまとめるか
+    method    : string , "mean" (NaNを除いたブロック平均) or "stride" (間引き, ビューを返す)
+    min_valid : float  , "mean"のとき，ブロック内の有効な点の割合がこれ未満ならNaNにする
+    ------------------------------------------------------------
+    格子を粗くする関数。座標は"mean"ならブロックの平均，"stride"なら間引いた点の値。
+    """
+    if (fx,fy)==(1,1) or 'lon' not in getattr(field,'dims',()) or 'lat' not in field.dims:
+        return field
+    factors = {'lon':int(fx),'lat':int(fy)}
+    if method=='stride':
+        return field.isel({dim:slice(None,None,f) for dim,f in factors.items()})
+    if method!='mean':
+        raise Exception(f"method '{method}' is not supported!")
+    coords, axes = {}, {}
+    for dim,f in factors.items():
+        if f<=1:
+            continue
+        axes[field.dims.index(dim)] = f
+        n = field.sizes[dim]//f*f
+        coords[dim] = np.asarray(field[dim][:n],dtype=float).reshape(-1,f).mean(axis=1)
+    data = _block_mean(np.asarray(field,dtype=float),axes,min_valid)
+    if field.dtype.kind=='f':
+        data = data.astype(field.dtype,copy=False)
+    sub = field.isel({dim:slice(None,len(c)) for dim,c in coords.items()})
+    return sub.copy(data=data).assign_coords(coords)
+
+def coarsen_factors(field,ax,x_min=120,x_max=260,y_min=-20,y_max=70,oversample=1.):
+    """
+    field      : xr.DataArray , "lon","lat"の次元を持つ配列
+    ax         : Axes , 描画するAxes (画素数を調べる)
+    oversample : float , 1画素あたりに残す格子点の数
+    ------------------------------------------------------------
+    Axesの画素数から，1画素におよそoversample点になるようなまとめる点数(fx,fy)を返す。
+    """
+    if 'lon' not in getattr(field,'dims',()) or 'lat' not in field.dims:
+        return 1, 1
+    bbox = ax.get_window_extent()
+    factors = []
+    for dim,span,npix in (('lon',x_max-x_min,bbox.width),('lat',y_max-y_min,bbox.height)):
+        coord = np.asarray(field[dim],dtype=float)
+        if len(coord)<2 or npix<=0:
+            factors.append(1)
+            continue
+        dx = abs(float(np.median(np.diff(coord))))
+        factors.append(max(int(abs(span)/dx/(npix*oversample)),1))
+    return tuple(factors)
+
+def coarsen_fields(ax,x_min,x_max,y_min,y_max,*fields,factor=True,method='mean'):
+    """
+    factor : True(Axesの画素数から決める), int, or (fx,fy)
+    ------------------------------------------------------------
+    coarsen_fieldを複数の配列にまとめて適用する。float(tc_valなど)やNoneはそのまま返す。
+    """
+    out = []
+    for field in fields:
+        if factor is True:
+            fx, fy = coarsen_factors(field,ax,x_min,x_max,y_min,y_max)
+        elif np.isscalar(factor):
+            fx = fy = int(factor)
+        else:
+            fx, fy = factor
+        out.append(coarsen_field(field,fx,fy,method=method))
+    return tuple(out)
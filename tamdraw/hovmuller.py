@@ -0,0 +1,287 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from .cmaps import register_ipcc_cmaps
+from .levels import color_levels
+from .raster import rasterize_layers
+from .profiling import profiled,stage
+register_ipcc_cmaps()
+#
+def ax_xaxis2lon(ax,xmin,xmax,xint):
+    from   cartopy.mpl.ticker import LongitudeFormatter
+    xticks = np.arange(xmin,xmax+xint,xint)
+    ax.set_xticks(xticks)
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    ax.xaxis.set_major_formatter(lon_formatter)
+#
+@profiled
+def plot_laghovmuller(ax,
+                   var,clev_min, clev_max, clev_int,
+                   x_min=140, x_max=240,
+                   lagmin=-60,lagmax=60,
+                   lon='lon',lag='lag',
+                   xtickint=20,
+                   cmap='RdBu_r', var_label="",
+                   title="",
+                   savefig=False, fname_save="",rasterize=False,spec=None):
+    '''
+    da: (time, lon)の構造を持つdataarray
+    Purpose: Hovmuller diagramを描く
+    参考: https://unidata.github.io/python-gallery/examples/Hovmoller_Diagram.html
+    spec: LevelSpec , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    rasterize: PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    '''
+    
+    import cartopy.crs as ccrs
+    from   cartopy.mpl.ticker import LongitudeFormatter,LatitudeFormatter
+    
+    da = var.sel({lag:slice(lagmin,lagmax)})
+    
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks, cmap = spec.levels, spec.ticks, spec.cmap
+    
+    stage("contourf")
+    cf = ax.contourf(da[lon].values, da[lag].values, da.values,
+                levels=clevels, cmap=cmap, extend='both',
+                norm=None if spec is None else spec.norm
+                )
+    plt.colorbar(cf, pad=0.1,
+        extend='both',orientation='horizontal',shrink=1,aspect=40,
+        ticks=cticks)
+    
+    rasterize_layers(rasterize,fill=cf)
+    
+    stage("ticks")
+    xticks = np.arange(360//xtickint+1)*xtickint
+    ax.set_xticks(xticks,)
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    ax.xaxis.set_major_formatter(lon_formatter)
+    
+    ax.axes.tick_params(labelsize=13)
+    ## region
+    ax.set_xlim([x_min,x_max])
+    # fig/label title
+    ax.set_xlabel("",fontsize=18)
+    # ax.set_ylabel("Time",fontsize=18)
+    # ax.set_title(title,fontsize=20)
+    
+@profiled
+def plot_hovmuller_double(ax,
+                          var1,var2,
+                          clev_min, clev_max, clev_int,
+                          clev_min2, clev_max2, clev_int2,
+                          lagmin=-60,lagmax=60,
+                          x_min=145, x_max=210,
+                          lon='lon',lag='lag',
+                          xtickint=20,
+                          cmap='RdBu_r', var_label="",
+                          contourwidth=1,clabel=False,
+                          fmt='%.1f',
+                          title="",
+                          savefig=False, fname_save="",rasterize=False,spec=None):
+    '''
+    da: (time, lon)の構造を持つdataarray
+    Purpose: Hovmuller diagramを描く
+    参考: https://unidata.github.io/python-gallery/examples/Hovmoller_Diagram.html
+    spec: LevelSpec , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    rasterize: PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    '''
+    
+    import cartopy.crs as ccrs
+    from   cartopy.mpl.ticker import LongitudeFormatter,LatitudeFormatter
+
+    
+    da1 = var1.sel({lag:slice(lagmin,lagmax)})
+    da2 = var2.sel({lag:slice(lagmin,lagmax)})
+    
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks, cmap = spec.levels, spec.ticks, spec.cmap
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    
+    stage("contourf")
+    cf = ax.contourf(da1[lon].values, da1[lag].values, da1.values,
+                levels=clevels, cmap=cmap, extend='both',
+                norm=None if spec is None else spec.norm
+                )
+    plt.colorbar(cf, pad=0.1,
+        extend='both',orientation='horizontal',shrink=1,aspect=40,
+        ticks=cticks)
+    stage("contour")
+    # plot contour
+    contour = ax.contour(da2[lon].values,da2[lag].values,da2.values,
+               levels=clevels2,
+               linewidth=contourwidth,colors='dimgray',
+               alpha=0.7)
+    stage("clabel")
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            colors='black',
+        )
+    
+    rasterize_layers(rasterize,fill=cf)
+    
+    stage("ticks")
+    xticks = np.arange(360//xtickint+1)*xtickint
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    ax.xaxis.set_major_formatter(lon_formatter)
+    
+    ax.axes.tick_params(labelsize=13)
+    ## region
+    ax.set_xlim([x_min,x_max])
+    # fig/label title
+    ax.set_xlabel("",fontsize=14)
+    # ax.set_ylabel("Time",fontsize=14)
+    # ax.set_title(title,fontsize=20)
+#   
+@profiled
+def plot_hovmuller_hatch(ax,
+                         var1,var_hatch,
+                         clev_min, clev_max, clev_int,
+                         x_min=140, x_max=240,
+                         lon='lon',lag='lag',
+                         xtickint=20,transform=None,
+                         cmap='RdBu_r',rasterize=False,spec=None):
+    '''
+    da: (time, lon)の構造を持つdataarray
+    Purpose: Hovmuller diagramを描く
+    参考: https://unidata.github.io/python-gallery/examples/Hovmoller_Diagram.html
+    spec: LevelSpec , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    rasterize: PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    '''
+    
+    import cartopy.crs as ccrs
+    from   cartopy.mpl.ticker import LongitudeFormatter,LatitudeFormatter
+    from .hrz import ax_addhatch
+    
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks, cmap = spec.levels, spec.ticks, spec.cmap
+    
+    stage("contourf")
+    cf = ax.contourf(var1[lon].values, var1[lag].values, var1.values,
+                levels=clevels, cmap=cmap, extend='both',
+                norm=None if spec is None else spec.norm
+                )
+    plt.colorbar(cf, pad=0.1,
+        extend='both',orientation='horizontal',shrink=1,aspect=40,
+        ticks=cticks)
+    
+    stage("hatch")
+    # hatching
+    # tcval=stats.t.ppf(1-(1-alpha)/2,dof)
+    # vart.plot.contourf(ax=ax,
+    #             levels=[-10**5,-tcval,tcval,10**5],
+    #             hatches=['..',None,'..'],
+    #             add_colorbar=False,
+    #             colors='none',
+    #             )
+    h=ax_addhatch(ax,var_hatch[lon],var_hatch[lag],var_hatch,transform=transform)
+    
+    rasterize_layers(rasterize,fill=cf,hatch=h)
+    
+    stage("ticks")
+    xticks = np.arange(360//xtickint+1)*xtickint
+    ax.set_xticks(xticks)
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.axes.tick_params(labelsize=13)
+    ## region
+    ax.set_xlim([x_min,x_max])
+
+@profiled
+def plot_hovmuller_double_hatch(ax,
+                          var1,var2,
+                          vart,
+                          clev_min, clev_max, clev_int,
+                          clev_min2, clev_max2, clev_int2,
+                          dof,alpha=0.95,
+                          lagmin=-60,lagmax=60,
+                          x_min=145, x_max=210,
+                          lon='lon',lag='lag',
+                          xtickint=20,
+                          cmap='RdBu_r',
+                          contourwidth=1,concolors='dimgray',
+                          clabel=False,
+                          fmt='%.1f',rasterize=False,spec=None):
+    '''
+    da: (time, lon)の構造を持つdataarray
+    Purpose: Hovmuller diagramを描く
+    参考: https://unidata.github.io/python-gallery/examples/Hovmoller_Diagram.html
+    spec: LevelSpec , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    rasterize: PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    '''
+    import cartopy.crs as ccrs
+    from   cartopy.mpl.ticker import LongitudeFormatter
+    from .signif import t_critical,significance_mask,add_mask_hatch
+    
+    da1 = var1.sel({lag:slice(lagmin,lagmax)})
+    da2 = var2.sel({lag:slice(lagmin,lagmax)})
+    dat = vart.sel({lag:slice(lagmin,lagmax)})
+    
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks, cmap = spec.levels, spec.ticks, spec.cmap
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    
+    stage("contourf")
+    cf = ax.contourf(da1[lon].values, da1[lag].values, da1.values,
+                levels=clevels, cmap=cmap, extend='both',
+                norm=None if spec is None else spec.norm
+                )
+    plt.colorbar(cf, pad=0.1,
+        extend='both',orientation='horizontal',shrink=1,aspect=40,
+        ticks=cticks)
+    stage("contour")
+    # plot contour
+    contour = ax.contour(da2[lon].values,da2[lag].values,da2.values,
+               levels=clevels2,
+               linewidth=contourwidth,colors=concolors,
+               alpha=0.7)
+    stage("hatch")
+    # hatching (臨界値はキャッシュされる)
+    tcval=t_critical(dof,alpha)
+    h=add_mask_hatch(ax,significance_mask(dat,tcval),x=lon,y=lag,transform=ax.transData)
+    
+    stage("clabel")
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            colors='black',
+        )
+    
+    rasterize_layers(rasterize,fill=cf,hatch=h)
+    
+    stage("ticks")
+    xticks = np.arange(360//xtickint+1)*xtickint
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    ax.xaxis.set_major_formatter(lon_formatter)
+    
+    ax.axes.tick_params(labelsize=13)
+    ## region
+    ax.set_xlim([x_min,x_max])
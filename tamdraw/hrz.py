@@ -0,0 +1,2094 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import patches
+import cartopy.crs as ccrs
+from   cartopy.mpl.ticker import LongitudeFormatter,LatitudeFormatter
+from .cmaps import register_ipcc_cmaps
+from .features import add_land,add_coastlines
+from .artists import HrzPlotHandle
+from .raster import plot_filled,rasterize_layers,_savefig_dpi
+from .signif import significance_mask,add_mask_hatch
+from .levels import color_levels
+from .grid import subset_to_extent,subset_fields,resolve_levels,coarsen_fields
+from .profiling import profiled,stage
+from .meshes import geo_plot,geo_xy
+from .polar import regrid_fields,circle_path
+register_ipcc_cmaps()
+# 
+@profiled
+def draw_hrz_field(field,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",
+                   contour=False,grid=False,grid_width=1.,
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",
+                   savefig=False,fname_save=None,subset=True,coarsen=False,mode="contour",rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks = spec.levels, spec.ticks
+
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels,center=0)
+        field = subset_to_extent(field,x_min,x_max,y_min,y_max)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels,center=0)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+    stage("contourf")
+    # Plot
+    c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.,"aspect":40,'ticks':cticks,},
+    ) # xarrayに内蔵されたplot.contourfメソッド。
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=3)
+    if grid:
+        ax.grid(linestyle="--",linewidth=grid_width,alpha=1,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=2)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+
+# 
+@profiled
+def axplot_hrz_field(ax,field,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",add_colorbar=False,cout=True,
+                   grid=False,grid_width=1.,
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",handle=False,subset=True,coarsen=False,mode="contour",rasterize=False,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    handle    : bool         , Trueならupdate(new_field)でデータ層だけを入れ替えられるHrzPlotHandleを返す
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks = spec.levels, spec.ticks
+
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels,center=0)
+        field = subset_to_extent(field,x_min,x_max,y_min,y_max)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels,center=0)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+    stage("contourf")
+   # Plot
+    if add_colorbar:
+        c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.1,"aspect":40,'ticks':cticks},)
+    else:
+        c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,)
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=3)
+    if grid:
+        ax.grid(linestyle="--",linewidth=grid_width,alpha=1,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=2)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c)
+    if handle:
+        return HrzPlotHandle(ax,field1=c,
+                             extent=(x_min,x_max,y_min,y_max),subset=subset,coarsen=coarsen)
+    if cout:
+        return c
+
+@profiled
+def axplot_hrz_field_hatch(ax,field,field_hatch,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",add_colorbar=False,cout=True,
+                   grid=False,grid_width=1.,hatches=[".."],echatch="black",
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",handle=False,subset=True,coarsen=False,mode="contour",rasterize=False,spec=None):
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks = spec.levels, spec.ticks
+
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels,center=0)
+        field,field_hatch = subset_fields(x_min,x_max,y_min,y_max,field,field_hatch)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels,center=0)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+        field_hatch, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,factor=coarsen,method='stride')
+    stage("contourf")
+   # Plot
+    if add_colorbar:
+        c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.1,"aspect":40,'ticks':cticks},)
+    else:
+        c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,)
+    stage("hatch")
+    # Hatching
+    h=ax_addhatch(ax,field_hatch.lon.values,field_hatch.lat.values,field_hatch,
+    hatches=hatches,ec=echatch)
+    
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=3)
+    if grid:
+        ax.grid(linestyle="--",linewidth=grid_width,alpha=1,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=2)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    if handle:
+        return HrzPlotHandle(ax,field1=c,hatch=h,kwargs={'hatch':{'corner_mask':True}},
+                             extent=(x_min,x_max,y_min,y_max),subset=subset,coarsen=coarsen)
+    if cout:
+        return c
+
+@profiled
+def axplot_polar_field_hatch(ax,field,field_hatch,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   var_label="",title="",
+                   cmap="RdBu_r",add_colorbar=False,cout=True,
+                   grid=False,grid_width=1.,hatches=[".."],echatch="black",
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",rasterize=False,spec=None,mode="contour",regrid=False,circle=False):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く)
+    regrid    : bool or int  , Trueなら表示範囲(set_extentの後に呼ぶ)にかかる緯度の帯だけを地図の座標の等間隔格子
+                               (intなら長い辺の格子点の数)に内挿し，投影の計算をせずに描く。大きな格子で速い
+    circle    : bool         , Trueなら地図の外形を円にする
+    ------------------------------------------------------------
+    極投影などの地図(ax)に水平方向2次元の配列を描き，field_hatchにハッチを付ける関数。
+    """
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks = spec.levels, spec.ticks
+
+    stage("regrid")
+    # 表示範囲にかかる緯度の帯だけを，地図の座標の等間隔格子に内挿してから描く
+    transform, xname, yname = ccrs.PlateCarree(), 'lon', 'lat'
+    if regrid:
+        field,field_hatch = regrid_fields(ax,field,field_hatch,npix=regrid)
+        transform, xname, yname = ax.projection, 'x', 'y'
+    stage("contourf")
+   # Plot
+    if add_colorbar:
+        c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=transform,
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.1,"aspect":40,'ticks':cticks},)
+    else:
+        c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=transform,
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,)
+    stage("hatch")
+    # Hatching
+    h=ax_addhatch(ax,field_hatch[xname].values,field_hatch[yname].values,field_hatch,
+    hatches=hatches,ec=echatch,transform=transform)
+    
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    # xticks = np.arange(0,360,xtickint)
+    # yticks = np.arange(-80,90,ytickint)
+    # ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    # ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    # 極投影などの矩形でない地図ではcartopyの経度・緯度フォーマッタは使えない
+    if isinstance(ax.projection,(ccrs.PlateCarree,ccrs.Mercator)):
+        lon_formatter = LongitudeFormatter(zero_direction_label=True)
+        lat_formatter = LatitudeFormatter()
+        ax.xaxis.set_major_formatter(lon_formatter)
+        ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    # ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    if circle:
+        ax.set_boundary(circle_path(),transform=ax.transAxes)
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=3)
+    if grid:
+        ax.grid(linestyle="--",linewidth=grid_width,alpha=1,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=2)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    if cout:
+        return c
+
+@profiled
+def axplot_hrz_field_double(ax,field1, field2,
+                   clev_min1=None,clev_max1=None,clev_int1=None,
+                   clev_min2=None,clev_max2=None,clev_int2=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",add_colorbar=False,cout=True,ccontour='black',
+                   clabel=False,clabelsize='medium',cclabel="black",inline_spacing=5,grid=False,grid_width=1.,contourwidth=1,
+                   sub_contour=False,
+                   fmt='%.1f',
+                   rec=False,xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",zland=5,zcontour=6.2,handle=False,subset=True,coarsen=False,mode="contour",rasterize=False,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    handle    : bool         , Trueならupdate(new_field)でデータ層だけを入れ替えられるHrzPlotHandleを返す
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels1, cticks1 = color_levels(clev_min1,clev_max1,clev_int1)
+    if spec is not None:
+        clevels1, cticks1 = spec.levels, spec.ticks
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    # field2の副コンター、細い線
+    clev_int2_sub = clev_int2/5
+    if clev_min2 is not None and clev_max2 is not None and clev_int2_sub is not None:
+        clevels2_sub = np.arange(clev_min2,clev_max2+clev_int2_sub,clev_int2_sub)
+    elif (clev_min2,clev_max2,clev_int2_sub)==(None,None,None):
+        clevels2_sub = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = subset_fields(x_min,x_max,y_min,y_max,field1,field2)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = coarsen_fields(ax,x_min,x_max,y_min,y_max,field1,field2,factor=coarsen)
+    stage("contourf")
+    # Plot
+    if add_colorbar:
+        c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1,"aspect":40,'ticks':cticks1},)
+    else:
+        c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,)
+    stage("contour")
+    # field2はコンター
+    contour = geo_plot(field2,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels2,
+        linewidths=contourwidth,
+        # linestyles=['-','--','--','--','--'],
+        colors=ccontour,zorder=zcontour,
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=clabelsize,inline_spacing=inline_spacing,
+            colors=cclabel,
+            zorder=6.1
+        )
+    stage("contour")
+    # sub_contour
+    contour_sub = None
+    if sub_contour:
+        contour_sub = geo_plot(field2,"contour",
+            ax=ax,
+            transform=ccrs.PlateCarree(),
+            levels=clevels2_sub,
+            linewidths=0.2,
+            colors=ccontour,
+            linestyles='--',
+            add_labels=False,
+            zorder=6
+        )
+    
+    stage("rectangle")
+    # 指定領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=zland)
+
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c)
+    if handle:
+        clabel_kw = dict(fmt=fmt,fontsize=clabelsize,inline_spacing=inline_spacing,
+                         colors=cclabel,zorder=6.1) if clabel else None
+        return HrzPlotHandle(ax,field1=c,field2=[contour,contour_sub],clabel=clabel_kw,
+                             extent=(x_min,x_max,y_min,y_max),subset=subset,coarsen=coarsen)
+    if cout:
+        return c
+
+@profiled
+def axplot_hrz_field_contour(ax,field,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cout=False,ccontour='black',
+                   clabel=False,clabelsize='medium',cclabel="black",inline_spacing=7,grid=False,grid_width=1.,contourwidth=1,
+                   sub_contour=False,
+                   fmt='%.1f',
+                   rec=False,xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",zland=5,zcontour=6.2,subset=True,coarsen=False,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    spec      : LevelSpec    , コンターのレベル (clev_min/clev_max/clev_intの代わりにspec.levelsを使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("levels")
+    # fieldのコンターレベルの指定
+    clevels = color_levels(clev_min,clev_max,clev_int)[0]
+    if spec is not None:
+        clevels = spec.levels
+    # 自動のレベルは切り出す前のデータで決める
+    clevels = resolve_levels(field,clevels)
+    # fieldの副コンター、細い線 (レベルの間を5等分)
+    nsub = (len(clevels)-1)*5+1
+    clevels_sub = np.interp(np.arange(nsub)/5,np.arange(len(clevels)),clevels)
+    
+    # fieldはコンター
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする
+    if subset:
+        field = subset_to_extent(field,x_min,x_max,y_min,y_max)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる
+    if coarsen:
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+    stage("contour")
+    contour = geo_plot(field,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels,
+        linewidths=contourwidth,
+        # linestyles=['-','--','--','--','--'],
+        colors=ccontour,zorder=zcontour,
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=clabelsize,inline_spacing=inline_spacing,
+            colors=cclabel,
+            zorder=6.1
+        )
+        
+    stage("contour")
+    # sub_contour
+    if sub_contour:
+        geo_plot(field,"contour",
+            ax=ax,
+            transform=ccrs.PlateCarree(),
+            levels=clevels_sub,
+            linewidths=0.2,
+            colors=ccontour,
+            linestyles='--',
+            add_labels=False,
+            zorder=6
+        )
+    
+    stage("rectangle")
+    # 指定領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=zland)
+
+    if cout:
+        return contour
+
+
+
+@profiled
+def axplot_hrz_field_double_hatch(ax,field1, field2, field_hatch,
+                   clev_min1=None,clev_max1=None,clev_int1=None,
+                   clev_min2=None,clev_max2=None,clev_int2=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",add_colorbar=False,cout=True,ccontour='black',
+                   clabel=False,clabelsize='medium',cclabel="black",inline_spacing=5,grid=False,grid_width=1.,contourwidth=1,
+                   sub_contour=False,hatches=[".."],echatch="black",
+                   fmt='%.1f',
+                   rec=False,xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",zland=5,zcontour=6.2,handle=False,subset=True,coarsen=False,mode="contour",rasterize=False,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    handle    : bool         , Trueならupdate(new_field)でデータ層だけを入れ替えられるHrzPlotHandleを返す
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels1, cticks1 = color_levels(clev_min1,clev_max1,clev_int1)
+    if spec is not None:
+        clevels1, cticks1 = spec.levels, spec.ticks
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    # field2の副コンター、細い線
+    clev_int2_sub = clev_int2/5
+    if clev_min2 is not None and clev_max2 is not None and clev_int2_sub is not None:
+        clevels2_sub = np.arange(clev_min2,clev_max2+clev_int2_sub,clev_int2_sub)
+    elif (clev_min2,clev_max2,clev_int2_sub)==(None,None,None):
+        clevels2_sub = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2,field_hatch = subset_fields(x_min,x_max,y_min,y_max,field1,field2,field_hatch)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = coarsen_fields(ax,x_min,x_max,y_min,y_max,field1,field2,factor=coarsen)
+        field_hatch, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,factor=coarsen,method='stride')
+    stage("contourf")
+    # Plot
+    if add_colorbar:
+        c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1,"aspect":40,'ticks':cticks1},)
+    else:
+        c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,)
+    stage("contour")
+    # field2はコンター
+    contour = geo_plot(field2,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels2,
+        linewidths=contourwidth,
+        # linestyles=['-','--','--','--','--'],
+        colors=ccontour,zorder=zcontour,
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=clabelsize,inline_spacing=inline_spacing,
+            colors=cclabel,
+            zorder=6.1
+        )
+    stage("contour")
+    # sub_contour
+    contour_sub = None
+    if sub_contour:
+        contour_sub = geo_plot(field2,"contour",
+            ax=ax,
+            transform=ccrs.PlateCarree(),
+            levels=clevels2_sub,
+            linewidths=0.2,
+            colors=ccontour,
+            linestyles='--',
+            add_labels=False,
+            zorder=6
+        )
+    stage("hatch")
+    h=ax_addhatch(ax,field_hatch.lon.values,field_hatch.lat.values,field_hatch,
+    hatches=hatches,ec=echatch)
+    stage("rectangle")
+    # 指定領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=zland)
+
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    if handle:
+        clabel_kw = dict(fmt=fmt,fontsize=clabelsize,inline_spacing=inline_spacing,
+                         colors=cclabel,zorder=6.1) if clabel else None
+        return HrzPlotHandle(ax,field1=c,field2=[contour,contour_sub],hatch=h,clabel=clabel_kw,
+                             kwargs={'hatch':{'corner_mask':True}},
+                             extent=(x_min,x_max,y_min,y_max),subset=subset,coarsen=coarsen)
+    if cout:
+        return c
+
+@profiled
+def axplot_polar_field_double_hatch(ax,field1, field2, field_hatch,
+                   clev_min1=None,clev_max1=None,clev_int1=None,
+                   clev_min2=None,clev_max2=None,clev_int2=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",add_colorbar=False,cout=True,ccontour='black',
+                   clabel=False,clabelsize='medium',cclabel="black",inline_spacing=5,grid=False,grid_width=1.,contourwidth=1,
+                   sub_contour=False,hatches=[".."],echatch="black",
+                   fmt='%.1f',
+                   rec=False,xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",cland='lightgray',zland=5,zcontour=6.2,rasterize=False,spec=None,mode="contour",regrid=False,circle=False):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く)
+    regrid    : bool or int  , Trueなら表示範囲(set_extentの後に呼ぶ)にかかる緯度の帯だけを地図の座標の等間隔格子
+                               (intなら長い辺の格子点の数)に内挿し，投影の計算をせずに描く。大きな格子で速い
+    circle    : bool         , Trueなら地図の外形を円にする
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels1, cticks1 = color_levels(clev_min1,clev_max1,clev_int1)
+    if spec is not None:
+        clevels1, cticks1 = spec.levels, spec.ticks
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    # field2の副コンター、細い線
+    clev_int2_sub = clev_int2/5
+    if clev_min2 is not None and clev_max2 is not None and clev_int2_sub is not None:
+        clevels2_sub = np.arange(clev_min2,clev_max2+clev_int2_sub,clev_int2_sub)
+    elif (clev_min2,clev_max2,clev_int2_sub)==(None,None,None):
+        clevels2_sub = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    stage("regrid")
+    # 表示範囲にかかる緯度の帯だけを，地図の座標の等間隔格子に内挿してから描く
+    transform, xname, yname = ccrs.PlateCarree(), 'lon', 'lat'
+    if regrid:
+        field1,field2,field_hatch = regrid_fields(ax,field1,field2,field_hatch,npix=regrid)
+        transform, xname, yname = ax.projection, 'x', 'y'
+    stage("contourf")
+    # Plot
+    if add_colorbar:
+        c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=transform,
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1,"aspect":40,'ticks':cticks1},)
+    else:
+        c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=transform,
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        add_colorbar=add_colorbar,)
+    stage("contour")
+    # field2はコンター
+    contour = geo_plot(field2,"contour",
+        ax=ax,
+        transform=transform,
+        levels=clevels2,
+        linewidths=contourwidth,
+        # linestyles=['-','--','--','--','--'],
+        colors=ccontour,zorder=zcontour,
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=clabelsize,inline_spacing=inline_spacing,
+            colors=cclabel,
+            zorder=6.1
+        )
+    stage("contour")
+    # sub_contour
+    if sub_contour:
+        geo_plot(field2,"contour",
+            ax=ax,
+            transform=transform,
+            levels=clevels2_sub,
+            linewidths=0.2,
+            colors=ccontour,
+            linestyles='--',
+            add_labels=False,
+            zorder=6
+        )
+    stage("hatch")
+    h=ax_addhatch(ax,field_hatch[xname].values,field_hatch[yname].values,field_hatch,
+    hatches=hatches,ec=echatch,transform=transform)
+    stage("rectangle")
+    # 指定領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    # xticks = np.arange(0,360,xtickint)
+    # yticks = np.arange(-80,90,ytickint)
+    # ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    # ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    # 極投影などの矩形でない地図ではcartopyの経度・緯度フォーマッタは使えない
+    if isinstance(ax.projection,(ccrs.PlateCarree,ccrs.Mercator)):
+        lon_formatter = LongitudeFormatter(zero_direction_label=True)
+        lat_formatter = LatitudeFormatter()
+        ax.xaxis.set_major_formatter(lon_formatter)
+        ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    # ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    if circle:
+        ax.set_boundary(circle_path(),transform=ax.transAxes)
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=cland,zorder=zland)
+
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    if cout:
+        return c
+#
+@profiled
+def axplot_whitemap(ax,x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   title="",grid=False,grid_width=1.,zrec=10,zland=1,
+                   rec=False,xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",):
+   
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='black',linewidth=2.5,
+        zorder=zrec)
+        ax.add_patch(r)
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+   
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=3)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),
+                     linestyle="--",linewidth=grid_width,
+                     draw_labels=False,
+                     alpha=0.8,
+                     zorder=2)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=zland)
+
+def ax_addpatch(ax,xy,w,h,ec,ls='-',lw=1.5,fill=False,zorder=20):
+    r=patches.Rectangle(xy=xy,width=w,height=h,
+        fill=fill,edgecolor=ec,linestyle=ls,linewidth=lw,
+        zorder=zorder)
+    ax.add_patch(r)
+
+def ax_xr_addhatch(ax,field,hatches=[".."],ec="black",colors="none",corner_mask=True,zorder=5,cout=False):
+    plt.rcParams["hatch.color"]=ec
+    chatch=geo_plot(field,"contourf",ax=ax,hatches=hatches,colors=colors,
+                transform=ccrs.PlateCarree(),corner_mask=corner_mask,zorder=zorder,
+                )
+    if cout:
+        return chatch
+
+def ax_addhatch(ax,x,y,field,hatches=[".."],ec="black",colors="none",corner_mask=True,
+                transform=ccrs.PlateCarree(),zorder=5):
+    plt.rcParams["hatch.color"]=ec
+    x, y, transform = geo_xy(ax,x,y,transform)
+    return ax.contourf(x,y,field,hatches=hatches,colors=colors,
+                transform=transform,zorder=zorder,corner_mask=corner_mask)
+
+@profiled
+def draw_hrz_field_double(field1, field2,
+                   clev_min1=None,clev_max1=None,clev_int1=None,
+                   clev_min2=None,clev_max2=None,clev_int2=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",
+                   clabel=False,grid=False,grid_width=1.,contourwidth=1,
+                   sub_contour=False,
+                   fmt='%.1f',
+                   rec=False,xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",zorder_land=5,z_contour=6.2,
+                   savefig=False,fname_save=None,subset=True,coarsen=False,mode="contour",rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels1, cticks1 = color_levels(clev_min1,clev_max1,clev_int1)
+    if spec is not None:
+        clevels1, cticks1 = spec.levels, spec.ticks
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    # field2の副コンター、細い線
+    clev_int2_sub = clev_int2/5
+    if clev_min2 is not None and clev_max2 is not None and clev_int2_sub is not None:
+        clevels2_sub = np.arange(clev_min2,clev_max2+clev_int2_sub,clev_int2_sub)
+    elif (clev_min2,clev_max2,clev_int2_sub)==(None,None,None):
+        clevels2_sub = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = subset_fields(x_min,x_max,y_min,y_max,field1,field2)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = coarsen_fields(ax,x_min,x_max,y_min,y_max,field1,field2,factor=coarsen)
+    stage("contourf")
+    # Plot
+    # field1は塗りつぶし
+    # field2はコンター
+    c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.,"aspect":40,'ticks':cticks1},
+    ) # xarrayに内蔵されたplot.contourfメソッド。
+    stage("contour")
+    contour = geo_plot(field2,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels2,
+        linewidths=contourwidth,
+        # linestyles=['-','--','--','--','--'],
+        colors='black',zorder=z_contour,
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=6,
+            colors='black',
+            zorder=6.1
+        )
+    stage("contour")
+    # sub_contour
+    if sub_contour:
+        geo_plot(field2,"contour",
+            ax=ax,
+            transform=ccrs.PlateCarree(),
+            levels=clevels2_sub,
+            linewidths=0.2,
+            colors='black',
+            linestyles='--',
+            add_labels=False,
+            zorder=6
+        )
+    
+    stage("rectangle")
+    # 指定領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=zorder_land)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+
+@profiled
+def draw_hrz_field_double_hatch(field1,field2,field_hatch,tc_val,
+                   clev_min1=None,clev_max1=None,clev_int1=None,
+                   clev_min2=None,clev_max2=None,clev_int2=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",
+                   grid=False,grid_width=1,
+                   clabel=False,
+                   sub_contour=False,
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   fmt='%.1f',
+                   landcol=True,landfc="lightgray",z_land=3,z_contour=4,z_hatch=2,
+                   savefig=False,fname_save=None,subset=True,coarsen=False,mode="contour",rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+   # カラーバーの範囲の指定
+    clevels1, cticks1 = color_levels(clev_min1,clev_max1,clev_int1)
+    if spec is not None:
+        clevels1, cticks1 = spec.levels, spec.ticks
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    # field2の副コンター、細い線
+    clev_int2_sub = clev_int2/5
+    if clev_min2 is not None and clev_max2 is not None and clev_int2_sub is not None:
+        clevels2_sub = np.arange(clev_min2,clev_max2+clev_int2_sub,clev_int2_sub)
+    elif (clev_min2,clev_max2,clev_int2_sub)==(None,None,None):
+        clevels2_sub = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2,field_hatch = subset_fields(x_min,x_max,y_min,y_max,field1,field2,field_hatch)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = coarsen_fields(ax,x_min,x_max,y_min,y_max,field1,field2,factor=coarsen)
+        field_hatch, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,factor=coarsen,method='stride')
+    stage("contourf")
+    # Plot
+    # field1は塗りつぶし
+    # field2はコンター
+    c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.,"aspect":40,'ticks':cticks1},
+    ) # xarrayに内蔵されたplot.contourfメソッド。
+    stage("contour")
+    contour = geo_plot(field2,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels2,
+        linewidths=1,
+        zorder=z_contour,
+        # linestyles=['-','--','--','--','--'],
+        colors='black'
+    )
+    stage("hatch")
+    # hatching
+    h=add_mask_hatch(ax,significance_mask(field_hatch,tc_val),zorder=z_hatch)
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=6,
+            colors='black',
+        )
+    stage("contour")
+    # sub_contour
+    if sub_contour:
+        geo_plot(field2,"contour",
+            ax=ax,
+            transform=ccrs.PlateCarree(),
+            levels=clevels2_sub,
+            linewidths=0.2,
+            colors='black',
+            linestyles='--',
+            add_labels=False,
+        )
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=z_land)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+
+@profiled
+def draw_hrz_field_double_hatch_hrz(field1,field2,field_hatch,tcval_da,
+                   clev_min1=None,clev_max1=None,clev_int1=None,
+                   clev_min2=None,clev_max2=None,clev_int2=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",
+                   grid=False,grid_width=1,
+                   clabel=False,
+                   sub_contour=False,
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   fmt='%.1f',
+                   landcol=True,landfc="lightgray",z_land=3,z_contour=4,z_hatch=2,
+                   savefig=False,fname_save=None,subset=True,coarsen=False,mode="contour",rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    tcval_da  : xr.DataArray , 格子点ごとのt値の臨界値 (tcval_fieldで自由度を格子点ごとに見積もって作れる)
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+   # カラーバーの範囲の指定
+    clevels1, cticks1 = color_levels(clev_min1,clev_max1,clev_int1)
+    if spec is not None:
+        clevels1, cticks1 = spec.levels, spec.ticks
+    # field2のコンターレベルの指定
+    if clev_min2 is not None and clev_max2 is not None and clev_int2 is not None:
+        clevels2 = np.arange(clev_min2,clev_max2+clev_int2,clev_int2)
+    elif (clev_min2,clev_max2,clev_int2)==(None,None,None):
+        clevels2 = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    # field2の副コンター、細い線
+    clev_int2_sub = clev_int2/5
+    if clev_min2 is not None and clev_max2 is not None and clev_int2_sub is not None:
+        clevels2_sub = np.arange(clev_min2,clev_max2+clev_int2_sub,clev_int2_sub)
+    elif (clev_min2,clev_max2,clev_int2_sub)==(None,None,None):
+        clevels2_sub = 9 
+    else:
+        raise Exception("Contour level max/min/int is not correct!")
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2,field_hatch,tcval_da = subset_fields(x_min,x_max,y_min,y_max,field1,field2,field_hatch,tcval_da)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels1 = resolve_levels(field1,clevels1,center=0)
+        clevels2 = resolve_levels(field2,clevels2)
+        clevels2_sub = resolve_levels(field2,clevels2_sub)
+        field1,field2 = coarsen_fields(ax,x_min,x_max,y_min,y_max,field1,field2,factor=coarsen)
+        field_hatch,tcval_da = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,tcval_da,factor=coarsen,method='stride')
+    stage("contourf")
+    # Plot
+    # field1は塗りつぶし
+    # field2はコンター
+    c=plot_filled(field1,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels1,
+        cmap=cmap,
+        extend='both',
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.,"aspect":40,'ticks':cticks1},
+    ) # xarrayに内蔵されたplot.contourfメソッド。
+    stage("contour")
+    contour = geo_plot(field2,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels2,
+        linewidths=1,
+        zorder=z_contour,
+        # linestyles=['-','--','--','--','--'],
+        colors='black'
+    )
+    stage("hatch")
+    # hatching
+    h=add_mask_hatch(ax,significance_mask(field_hatch,tcval_da),zorder=z_hatch)
+    stage("clabel")
+    # コンターのラベルの作成
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=6,
+            colors='black',
+        )
+    stage("contour")
+    # sub_contour
+    if sub_contour:
+        geo_plot(field2,"contour",
+            ax=ax,
+            transform=ccrs.PlateCarree(),
+            levels=clevels2_sub,
+            linewidths=0.2,
+            colors='black',
+            linestyles='--',
+            add_labels=False,
+        )
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=z_land)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+
+@profiled
+def draw_hrz_field_contour(field,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   fmt='%.1f',
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   contourwidth=0.5,
+                   subarc=False,subtro=False,
+                   landcol=True,landfc="lightgray",z_land=4.9,
+                   savefig=False,fname_save=None,subset=True,coarsen=False,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+    # カラーバーの範囲の指定
+    if clev_min is not None and clev_max is not None and clev_int is not None:
+        clevels = np.arange(clev_min,clev_max+clev_int/2,clev_int)
+    elif (clev_min,clev_max,clev_int)==(None,None,None):
+        clevels = 19 # カラーバーを特に指定しなければ，9つのレベルに分かれて色付けをする
+    else:
+        raise Exception("Color level max/min/int is not correct!")
+    if spec is not None:
+        clevels = spec.levels
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    # contour
+
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels)
+        field = subset_to_extent(field,x_min,x_max,y_min,y_max)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+    stage("contour")
+    plot = geo_plot(field,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels,
+        colors='black',
+        linewidths=contourwidth,
+        zorder=5
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    ax.clabel(
+        plot,
+        fmt=fmt,
+        fontsize=6,
+        colors='black',
+        zorder=6.1,
+        inline_spacing=7
+    )
+    # とか，
+    # plot = ax.plot.contour(
+    #     field["lon"],
+    #     field["lat"],
+    #     field.values,
+    #     transform=ccrs.PlateCaree(),
+    # )
+    # で描けると思います。
+    
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if subarc:
+        r=patches.Rectangle(xy=(-30,34),width=30,height=14,
+        fill=False,edgecolor='black',linewidth=1.5,
+        zorder=20)
+        ax.add_patch(r)
+    elif subtro:
+        r=patches.Rectangle(xy=(0,22),width=30,height=14,
+        fill=False,edgecolor='black',linewidth=1.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    #ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+    # draw_labels=False,
+    # alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=z_land)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save)
+
+@profiled
+def draw_hrz_field_hatch(field,field_hatch,tc_val,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",
+                   contour=False,
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",
+                   savefig=False,fname_save=None,subset=True,coarsen=False,mode="contour",rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+    # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks = spec.levels, spec.ticks
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels,center=0)
+        field,field_hatch = subset_fields(x_min,x_max,y_min,y_max,field,field_hatch)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels,center=0)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+        field_hatch, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,factor=coarsen,method='stride')
+    stage("contourf")
+    # Plot
+    c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.,"aspect":40,'ticks':cticks},
+    ) # xarrayに内蔵されたplot.contourfメソッド。
+    
+    stage("hatch")
+    # hatching
+    h=add_mask_hatch(ax,significance_mask(field_hatch,tc_val),zorder=10)
+
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=1.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=13)
+    #ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+    # draw_labels=False,
+    # alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=12)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+
+@profiled
+def draw_hrz_field_hatch_hrz(field,field_hatch,tcval_da,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   cmap="RdBu_r",
+                   grid=False,grid_width=1,
+                   clabel=False,
+                   sub_contour=False,
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   fmt='%.1f',
+                   landcol=True,landfc="lightgray",z_land=3,z_contour=4,z_hatch=2,
+                   savefig=False,fname_save=None,subset=True,coarsen=False,mode="contour",rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    tcval_da  : xr.DataArray , 格子点ごとのt値の臨界値 (tcval_fieldで自由度を格子点ごとに見積もって作れる)
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    mode      : string       , "contour"(contourf) or "raster"(同じレベル・色で画像として描く。速くファイルも小さい)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+   # カラーバーの範囲の指定
+    clevels, cticks = color_levels(clev_min,clev_max,clev_int)
+    if spec is not None:
+        clevels, cticks = spec.levels, spec.ticks
+
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels,center=0)
+        field,field_hatch,tcval_da = subset_fields(x_min,x_max,y_min,y_max,field,field_hatch,tcval_da)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels,center=0)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+        field_hatch,tcval_da = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,tcval_da,factor=coarsen,method='stride')
+    stage("contourf")
+    # Plot
+    # fieldは塗りつぶし
+    # field2はコンター
+    c=plot_filled(field,mode,spec=spec,
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        center=0,
+        levels=clevels,
+        cmap=cmap,
+        extend='both',
+        cbar_kwargs={"label":var_label,"orientation":"horizontal",
+                     "shrink":1.,"aspect":40,'ticks':cticks},
+    ) # xarrayに内蔵されたplot.contourfメソッド。
+    
+    stage("hatch")
+    # hatching
+    h=add_mask_hatch(ax,significance_mask(field_hatch,tcval_da),zorder=z_hatch)
+    
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=2.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+    
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=10)
+    if grid:
+        ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+        draw_labels=False,
+        alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=z_land)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,fill=c,hatch=h)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+
+@profiled
+def draw_hrz_field_contour_hatch(field,field_hatch,tc_val,
+                   clev_min=None,clev_max=None,clev_int=None,
+                   x_min=120,x_max=260,y_min=-20,y_max=70,
+                   fmt='%.1f',
+                   xtickint=20,ytickint=10,
+                   var_label="",title="",
+                   rec=False,
+                   xy=None,width=None,height=None,
+                   landcol=True,landfc="lightgray",
+                   savefig=False,fname_save=None,subset=True,coarsen=False,rasterize=False,raster_dpi=None,spec=None):
+    """
+    field     : xr.DataArray , 2-dims. horizontal data array
+    var_label : string       , discripsion of the variable
+    title     : string       , title of the Figure
+    subset    : bool         , Trueなら描画範囲(x_min-y_max)の外側を除いてからcontourfする
+    coarsen   : bool or int  , Trueなら図の画素数に合わせて格子をまとめてから描く(intならまとめる点数)
+    rasterize : bool or list , PDF/SVGで塗りつぶし・ハッチを画像として埋め込む (True, "fill", "hatch", ["fill","hatch"])
+    raster_dpi: int          , 画像にした層の解像度 (PDF/SVG/EPS/PSで保存するときのdpi, Noneなら図の解像度)
+    spec      : LevelSpec    , 色のレベル・norm・カラーマップ・目盛り (clev_min/clev_max/clev_int, cmapの代わりに使う)
+    ------------------------------------------------------------
+    水平方向2次元のxarrayの配列を受け取り，描画する関数。
+    2つの軸の名前が("lon","lat")になっていることを想定しています。
+    """
+    stage("figure")
+    # Figure/Axes objects
+    fig = plt.figure(figsize=(6,4),dpi=150,layout='constrained') # 図のサイズと解像度を指定
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180)) # cartopyのprojectionを指定したAxesオブジェクトを生成
+
+    stage("levels")
+    # カラーバーの範囲の指定
+    if clev_min is not None and clev_max is not None and clev_int is not None:
+        clevels = np.arange(clev_min,clev_max+clev_int/2,clev_int)
+    elif (clev_min,clev_max,clev_int)==(None,None,None):
+        clevels = 19 # カラーバーを特に指定しなければ，9つのレベルに分かれて色付けをする
+    else:
+        raise Exception("Color level max/min/int is not correct!")
+    if spec is not None:
+        clevels = spec.levels
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    # contour
+
+    stage("subset")
+    # 描画範囲(+のりしろ)だけを切り出してからcontourfする (自動のレベルは切り出す前のデータで決める)
+    if subset:
+        clevels = resolve_levels(field,clevels)
+        field,field_hatch = subset_fields(x_min,x_max,y_min,y_max,field,field_hatch)
+    stage("coarsen")
+    # 図の画素数に合わせて格子をまとめる (自動のレベルは元の解像度のデータで決める)
+    if coarsen:
+        clevels = resolve_levels(field,clevels)
+        field, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field,factor=coarsen)
+        field_hatch, = coarsen_fields(ax,x_min,x_max,y_min,y_max,field_hatch,factor=coarsen,method='stride')
+    stage("contour")
+    plot = geo_plot(field,"contour",
+        ax=ax,
+        transform=ccrs.PlateCarree(),
+        levels=clevels,
+        colors='black',
+        linewidths=0.5,
+        zorder=5
+    )
+    stage("clabel")
+    # コンターのラベルの作成
+    ax.clabel(
+        plot,
+        fmt=fmt,
+        fontsize=6,
+        colors='black',
+        zorder=6.1,
+        inline_spacing=7
+    )
+
+    stage("hatch")
+    # hatching
+    h=add_mask_hatch(ax,significance_mask(field_hatch,tc_val),zorder=10)
+    stage("rectangle")
+    # subarc/subtro front領域を四角形で囲う
+    if rec:
+        r=patches.Rectangle(xy=xy,width=width,height=height,
+        fill=False,edgecolor='dimgrey',linestyle='--',linewidth=1.5,
+        zorder=20)
+        ax.add_patch(r)
+    
+
+    stage("ticks")
+    # Ticks # この辺は，最初の頃はおまじないだと思っておけば良いと思います。
+    xticks = np.arange(0,360,xtickint)
+    yticks = np.arange(-80,90,ytickint)
+    ax.set_xticks(xticks,crs=ccrs.PlateCarree())
+    ax.set_yticks(yticks,crs=ccrs.PlateCarree())
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    lat_formatter = LatitudeFormatter()
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lat_formatter)
+    # ax.tick_params('x')
+    # ax.tick_params('y')
+
+    # fig/label title
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.set_title(title)
+    
+    ## region
+    ax.set_extent([x_min,x_max,y_min,y_max],crs=ccrs.PlateCarree())
+    stage("coastlines")
+    # 海岸線とグリッドラインの描画
+    add_coastlines(ax,scale="50m",linewidth=0.5,zorder=6)
+    #ax.gridlines(crs=ccrs.PlateCarree(),linestyle="--",linewidth=grid_width,
+    # draw_labels=False,
+    # alpha=0.8,zorder=10)
+    stage("land")
+    #大陸部分の塗りつぶし
+    if landcol:
+        add_land(ax,scale="50m",fc=landfc,zorder=4.9)
+    # PDF/SVGで画像として埋め込む層
+    rasterize_layers(rasterize,hatch=h)
+    stage("savefig")
+    # save figure
+    if savefig: 
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
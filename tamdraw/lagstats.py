@@ -0,0 +1,109 @@
+import numpy as np
+#
+def _fft_length(n):
+    # n以上で2,3,5だけの積になる長さ (FFTが速い)
+    from scipy import fft
+    return fft.next_fast_len(int(n),real=True)
+
+def _lagged_sums(fa,fb,nfft,lags):
+    # sum_t a(t)*b(t+k) (fa, fbはa, bのrfft。(nf,) or (nf,m))
+    from scipy import fft
+    if fa.ndim<fb.ndim:
+        fa = fa[:,None]
+    return fft.irfft(np.conj(fa)*fb,nfft,axis=0)[lags%nfft]
+
+def _prepare_inputs(index,field,time):
+    import xarray as xr
+    if not isinstance(field,xr.DataArray):
+        raise Exception("field must be an xr.DataArray with a time dimension!")
+    if isinstance(index,xr.DataArray):
+        if index.ndim!=1:
+            raise Exception("index must be a 1-dim time series!")
+        index = index.rename({index.dims[0]:time})
+        if time in index.coords and time in field.coords:
+            index, field = xr.align(index,field,join='inner')
+        index = index.values
+    index = np.asarray(index,dtype=float)
+    if len(index)!=field.sizes[time]:
+        raise Exception(f"Length of index ({len(index)}) and field ({field.sizes[time]}) differ!")
+    return index, field
+
+def lag_regression(index,field,lagmin=-60,lagmax=60,time='time',lag='lag',
+                   min_count=3,chunk=None,max_mb=256):
+    """
+    index  : 1-dim array or xr.DataArray (time) , 基準の時系列 (DataArrayならfieldと時刻を合わせる)
+    field  : xr.DataArray , timeの次元を持つ配列 ((time,lat,lon), (time,lon), (time,) など)
+    lagmin, lagmax : int , ラグの範囲 (時間ステップの数。両端を含む)
+    time, lag : string , 時間の次元と，結果のラグの次元の名前
+    min_count : int , ラグごとの有効なデータ(両方がNaNでない組)の数がこれより少なければNaN
+    chunk  : int , 1回に計算する格子点の数 (Noneならmax_mb[MB]に収まる数)
+    ------------------------------------------------------------
+    全てのラグ・全ての格子点のラグ相関とラグ回帰を，FFTでまとめて計算する関数。
+    ラグkの値は index(t) と field(t+k) の相関 (k>0ならfieldが遅れる) で，
+    Dataset {'corr','regr','nsample'} を (lag, fieldのtime以外の次元) で返す。
+    regrはindexの1単位あたりのfieldの回帰係数，nsampleはラグごとの有効なデータの数。
+    NaNは組ごとに除くので，欠測があってもラグごとに使えるデータだけで計算します。
+
+        ds = lag_regression(mjo_index,olr_hov,-30,30)
+        plot_laghovmuller(ax,ds['corr'],-0.8,0.8,0.1,lagmin=-30,lagmax=30)
+        plot_lagcorr(ds[lag],ds['corr'],"lag correlation")   # fieldが1次元の時系列のとき
+    """
+    import xarray as xr
+    index, field = _prepare_inputs(index,field,time)
+    field = field.transpose(time,...)
+    nt, lags = field.sizes[time], np.arange(int(lagmin),int(lagmax)+1)
+    if np.max(np.abs(lags))>=nt:
+        raise Exception(f"Lag range ({lagmin},{lagmax}) is longer than the record ({nt})!")
+    nfft = _fft_length(nt+np.max(np.abs(lags)))
+    shape = field.shape[1:]
+    data = np.asarray(field.values,dtype=float).reshape(nt,-1)
+    npoint = data.shape[1]
+    # 共分散は平行移動で変わらないので，平均を引いて桁落ちを防ぐ
+    mx = np.isfinite(index).astype(float)
+    x = np.where(mx>0,index-np.nanmean(index),0.)
+    if chunk is None:
+        # rfft・irfftの作業配列 (複素数の6本分程度) がmax_mbに収まる格子点の数
+        chunk = max(int(max_mb*2**20//(nfft*8*6)),1)
+    from scipy import fft
+    fx, fxx, fmx = (fft.rfft(a,nfft) for a in (x,x*x,mx))
+    # indexだけで決まる量 (fieldに欠測がない格子点で使う)
+    fone = fft.rfft(np.ones(nt),nfft)
+    sx_all, sxx_all, n_all = (_lagged_sums(a,fone,nfft,lags) for a in (fx,fxx,fmx))
+    corr, regr, count = (np.full((len(lags),npoint),np.nan) for _ in range(3))
+    for i0 in range(0,npoint,chunk):
+        block = data[:,i0:i0+chunk]
+        my = np.isfinite(block)
+        y = np.where(my,block,0.)
+        y = np.where(my,y-y.sum(axis=0)/np.maximum(my.sum(axis=0),1),0.)
+        fy = fft.rfft(y,nfft,axis=0)
+        sy, sxy = _lagged_sums(fmx,fy,nfft,lags), _lagged_sums(fx,fy,nfft,lags)
+        syy = _lagged_sums(fmx,fft.rfft(y*y,nfft,axis=0),nfft,lags)
+        if my.all():
+            n, sx, sxx = n_all[:,None], sx_all[:,None], sxx_all[:,None]
+        else:
+            fmy = fft.rfft(my.astype(float),nfft,axis=0)
+            n, sx, sxx = (_lagged_sums(a,fmy,nfft,lags) for a in (fmx,fx,fxx))
+        n = np.rint(n)
+        cov, varx, vary = n*sxy-sx*sy, n*sxx-sx*sx, n*syy-sy*sy
+        ok = (n>=min_count)&(varx>0)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            corr[:,i0:i0+chunk] = np.where(ok&(vary>0),cov/np.sqrt(varx*vary),np.nan)
+            regr[:,i0:i0+chunk] = np.where(ok,cov/varx,np.nan)
+        count[:,i0:i0+chunk] = n
+    coords = {name:c for name,c in field.coords.items() if time not in c.dims}
+    coords[lag] = lags
+    dims = (lag,)+field.dims[1:]
+    def wrap(values,name,attrs):
+        return xr.DataArray(values.reshape((len(lags),)+shape),dims=dims,coords=coords,name=name,attrs=attrs)
+    return xr.Dataset({
+        'corr':wrap(np.clip(corr,-1,1),'corr',{'long_name':'lag correlation'}),
+        'regr':wrap(regr,'regr',{'long_name':'lag regression',
+                                 'units':field.attrs.get('units','')}),
+        'nsample':wrap(count.astype(int),'nsample',{'long_name':'number of samples'}),
+    })
+
+def lag_correlation(index,field,lagmin=-60,lagmax=60,time='time',lag='lag',**kwargs):
+    """
+    lag_regressionの相関係数だけを (lag, fieldのtime以外の次元) のDataArrayで返す。
+    """
+    return lag_regression(index,field,lagmin,lagmax,time,lag,**kwargs)['corr']
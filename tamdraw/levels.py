@@ -0,0 +1,99 @@
+import numpy as np
+#
+def color_levels(clev_min=None,clev_max=None,clev_int=None):
+    """
+    clev_min,clev_max,clev_int : float , draw_*/axplot_*関数と同じ色のレベルの指定
+    ------------------------------------------------------------
+    (clevels, cticks) を返す。3つともNoneならclevels=9 (データから自動で決める)。
+    """
+    if clev_min is not None and clev_max is not None and clev_int is not None:
+        clevels = np.arange(clev_min,clev_max+clev_int/2,clev_int)
+        cticks = None
+    elif clev_min is not None and clev_max is not None and clev_int == None:
+        nlev = 12
+        clevels = np.linspace(clev_min,clev_max,nlev)
+        cticks = list(clevels[:nlev//2:2])+list(clevels[nlev//2+1::2])
+    elif (clev_min,clev_max,clev_int)==(None,None,None):
+        clevels = 9 # カラーバーを特に指定しなければ，9つのレベルに分かれて色付けをする
+        cticks = None
+    else:
+        raise Exception("Color level max/min/int is not correct!")
+    return clevels, cticks
+
+def discrete_cmap(cmap,levels,extend='both'):
+    """
+    cmap   : string or Colormap
+    levels : array , 塗り分けの境界
+    ------------------------------------------------------------
+    xarrayのcontourfと同じ規則で，levelsの間(と両端のextend)に色を割り当てた
+    (ListedColormap, BoundaryNorm) を返す。
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import Colormap,from_levels_and_colors
+    base = cmap if isinstance(cmap,Colormap) else plt.get_cmap(cmap)
+    ext_n = {'both':2,'min':1,'max':1,'neither':0}[extend]
+    colors = base(np.linspace(0,1,len(levels)+ext_n-1))
+    new_cmap, norm = from_levels_and_colors(levels,colors,extend=extend)
+    new_cmap.name = base.name
+    # set_bad/set_over/set_underで変えた色は引き継ぐ
+    bad, under, over = base(np.nan), base(-np.inf), base(np.inf)
+    new_cmap = new_cmap.with_extremes(bad=bad,
+                                      under=None if under==base(0) else under,
+                                      over=None if over==base(base.N-1) else over)
+    return new_cmap, norm
+
+class LevelSpec:
+    """
+    clev_min,clev_max,clev_int : float , draw_*/axplot_*関数と同じ色のレベルの指定
+    cmap    : string or Colormap
+    extend  : string , "both","min","max","neither"
+    field   : xr.DataArray or list of them , 3つともNoneのときにレベルを決めるデータ
+              (全てのデータを合わせて，levels=nlevelsと同じ規則で決める)
+    nlevels : int   , 自動で決めるときのレベルの数
+    center  : float , 自動で決めるときの中心 (Noneならデータが0をまたぐときだけ0)
+    levels  : array , レベルを直接指定する (clev_*より優先)
+    ticks   : list  , カラーバーの目盛り (Noneならclev_*から決まる既定)
+    ------------------------------------------------------------
+    色のレベル・BoundaryNorm・両端を伸ばしたカラーマップ・カラーバーの目盛りを1回だけ計算して持つオブジェクト。
+    draw_*/axplot_*関数にspec=として渡すと，clev_min/clev_max/clev_int/cmapの代わりに使い，
+    xarrayを通さずにcontourfするのでデータの走査(範囲・中心の計算)もしません。
+    複数パネルやアニメーションの全てのフレームで色とカラーバーが揃います。
+
+        spec = LevelSpec(-2,2,0.25,cmap="RdBu_r")
+        for t in range(12):
+            draw_hrz_field_double_hatch(sst[t],slp[t],tval[t],tc,spec=spec,...)
+    """
+    def __init__(self,clev_min=None,clev_max=None,clev_int=None,cmap="RdBu_r",extend='both',
+                 field=None,nlevels=9,center=0,levels=None,ticks=None):
+        default_ticks = None
+        if levels is None:
+            levels, default_ticks = color_levels(clev_min,clev_max,clev_int)
+        if np.isscalar(levels):
+            if field is None:
+                raise Exception("field is needed to decide the color levels automatically!")
+            from .grid import resolve_levels
+            fields = field if isinstance(field,(list,tuple)) else [field]
+            data = np.concatenate([np.ravel(np.asarray(f,dtype=float)) for f in fields])
+            levels = resolve_levels(data,nlevels,center=center)
+        self.levels = np.asarray(levels,dtype=float)
+        self.ticks = ticks if ticks is not None else default_ticks
+        self.extend = extend
+        self.cmap, self.norm = discrete_cmap(cmap,self.levels,extend)
+
+    def __repr__(self):
+        return (f"LevelSpec(levels=[{self.levels[0]:g}, ..., {self.levels[-1]:g}] ({len(self.levels)}), "
+                f"cmap={self.cmap.name!r}, extend={self.extend!r})")
+
+    def contourf_kwargs(self):
+        """ax.contourfにそのまま渡せる引数 (levels, cmap, norm, extend)。"""
+        return dict(levels=self.levels,cmap=self.cmap,norm=self.norm,extend=self.extend)
+
+    def colorbar(self,mappable,ax=None,label="",orientation="horizontal",shrink=1.,aspect=40,**kwargs):
+        """
+        このレベルのカラーバーを付ける (複数パネルで共有するときはaxにAxesのリストを渡す)。
+        """
+        fig = mappable.axes.figure if ax is None else np.ravel(ax)[0].figure
+        kwargs.setdefault('ticks',self.ticks)
+        kwargs.setdefault('extend',self.extend)
+        return fig.colorbar(mappable,ax=ax if ax is not None else mappable.axes,label=label,
+                            orientation=orientation,shrink=shrink,aspect=aspect,**kwargs)
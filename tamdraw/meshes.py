@@ -0,0 +1,119 @@
+import hashlib
+import collections
+import numpy as np
+import cartopy.crs as ccrs
+from .features import _projection_key
+#
+# 投影済みの格子座標のキャッシュ
+#   (格子座標, 元のCRS, 地図のCRS) -> (X, Y) 地図座標の2次元の格子 (投影座標でコンターできなければNone)
+_mesh_cache = collections.OrderedDict()
+_mesh_cache_max = 16
+_mesh_stats = {'hits':0,'misses':0}
+
+def _coord_key(coord):
+    # hash()は衝突すると別の格子のメッシュを使ってしまうので，座標の値のダイジェスト(blake2b)で区別する
+    coord = np.ascontiguousarray(coord,dtype=float)
+    return (coord.shape,hashlib.blake2b(coord.tobytes(),digest_size=20).digest())
+
+def _monotonic(diff):
+    return bool(np.all(diff>0) or np.all(diff<0))
+
+def _project_mesh(x,y,projection,src):
+    if x.ndim==1 and y.ndim==1:
+        x, y = np.meshgrid(x,y)
+    elif x.shape!=y.shape or x.ndim!=2:
+        return None
+    pts = projection.transform_points(src,x,y)
+    px, py = pts[...,0], pts[...,1]
+    if not (np.all(np.isfinite(px)) and np.all(np.isfinite(py))):
+        return None
+    # 円筒図法では経度のつなぎ目で飛ぶxを連続にする (範囲の外側は地図で切り取られる)
+    if isinstance(projection,(ccrs.PlateCarree,ccrs.Mercator)) and px.shape[1]>1:
+        px = np.unwrap(px,period=projection.x_limits[1]-projection.x_limits[0],axis=1)
+    # 極を囲む格子などは投影座標では格子にならないので使わない
+    if px.shape[1]>1 and not _monotonic(np.diff(px,axis=1)):
+        return None
+    if py.shape[0]>1 and not _monotonic(np.diff(py,axis=0)):
+        return None
+    px.flags.writeable = False
+    py.flags.writeable = False
+    return px, py
+
+def projected_mesh(x,y,projection,src=None):
+    """
+    x, y       : array , 格子点の経度・緯度 (1次元 (nx,),(ny,) または2次元 (ny,nx))
+    projection : cartopy CRS , 地図(Axes)のprojection
+    src        : cartopy CRS , x,yの座標系 (NoneならPlateCarree())
+    ------------------------------------------------------------
+    格子をprojectionの座標に投影した2次元の (X, Y) を返す。投影した格子が途切れる・
+    折り返す(極を囲む・範囲外の点がある)ときはNoneを返す。
+    (格子座標, src, projection) ごとにキャッシュするので，同じ格子の2つ目以降の層
+    (contour, hatch)・パネル・フレームでは投影を計算しません。
+    """
+    src = ccrs.PlateCarree() if src is None else src
+    key = (_coord_key(x),_coord_key(y),_projection_key(src),_projection_key(projection))
+    if key in _mesh_cache:
+        _mesh_stats['hits'] += 1
+        _mesh_cache.move_to_end(key)
+        return _mesh_cache[key]
+    _mesh_stats['misses'] += 1
+    mesh = _project_mesh(np.asarray(x,dtype=float),np.asarray(y,dtype=float),projection,src)
+    _mesh_cache[key] = mesh
+    while len(_mesh_cache)>_mesh_cache_max:
+        _mesh_cache.popitem(last=False)
+    return mesh
+
+def clear_mesh_cache():
+    """投影済みの格子のキャッシュを消す。"""
+    _mesh_cache.clear()
+    _mesh_stats.update(hits=0,misses=0)
+
+def mesh_cache_info():
+    """キャッシュの {'entries','hits','misses','nbytes'} を返す。"""
+    nbytes = sum(X.nbytes+Y.nbytes for X,Y in filter(None,_mesh_cache.values()))
+    return dict(entries=len(_mesh_cache),nbytes=nbytes,**_mesh_stats)
+
+def geo_xy(ax,x,y,transform):
+    """
+    ax        : Axes (GeoAxes)
+    x, y      : array , 格子点の経度・緯度
+    transform : cartopy CRS , x,yの座標系
+    ------------------------------------------------------------
+    格子を地図の座標に投影して (X, Y, ax.projection) を返す。
+
+        x, y, transform = geo_xy(ax,lon,lat,ccrs.PlateCarree())
+        ax.contourf(x,y,z,transform=transform)
+
+    コンターを投影座標で計算するので，cartopyがコンターの多角形を1つずつ投影し直す(遅い)処理がなくなる。
+    投影できない格子・地図ではそのまま (x, y, transform) を返す。
+    """
+    projection = getattr(ax,'projection',None)
+    if projection is None or not isinstance(transform,ccrs.CRS) or transform==projection:
+        return x, y, transform
+    mesh = projected_mesh(x,y,projection,transform)
+    if mesh is None:
+        return x, y, transform
+    return mesh[0], mesh[1], projection
+
+def _mesh_coord(values,coord):
+    attrs = dict(coord.attrs)
+    if 'long_name' not in attrs and 'standard_name' not in attrs:
+        attrs['long_name'] = coord.name
+    return (('lat','lon'),values,attrs)
+
+def geo_plot(field,method,ax,transform=None,**kwargs):
+    """
+    field  : xr.DataArray , 2-dims ("lat","lon")
+    method : string , "contourf" or "contour"
+    ------------------------------------------------------------
+    field.plot.<method>(ax=ax,transform=transform,**kwargs) と同じ図を，
+    キャッシュした投影済みの格子(geo_xy)の上で描く。軸ラベルも同じになります。
+    """
+    if 'lon' in field.dims and 'lat' in field.dims:
+        x, y, t = geo_xy(ax,field['lon'].values,field['lat'].values,transform)
+        if t is not transform:
+            field = field.transpose(...,'lat','lon')
+            field = field.assign_coords(mesh_x=_mesh_coord(x,field['lon']),
+                                        mesh_y=_mesh_coord(y,field['lat']))
+            return getattr(field.plot,method)(ax=ax,x='mesh_x',y='mesh_y',transform=t,**kwargs)
+    return getattr(field.plot,method)(ax=ax,transform=transform,**kwargs)
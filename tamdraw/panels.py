@@ -0,0 +1,152 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+from .hrz import axplot_hrz_field,axplot_hrz_field_double
+from .levels import LevelSpec
+from .signif import significance_mask,add_mask_hatch
+from .grid import subset_to_extent
+from .raster import rasterize_layers,_savefig_dpi
+from .batch import _format_keys
+from .profiling import profiled,stage
+#
+def _panel_dim(field,dim):
+    if dim is not None:
+        return dim
+    dims = [d for d in field.dims if d not in ('lat','lon')]
+    if len(dims)!=1:
+        raise Exception(f"Cannot decide the panel dimension from {field.dims}! (use dim=)")
+    return dims[0]
+
+def _panel_titles(titles,dim,coord,npanel):
+    if titles is None:
+        titles = "{"+dim+"}" if coord is not None else ""
+    if isinstance(titles,str):
+        return [titles.format(**_format_keys(i,dim,coord)) for i in range(npanel)]
+    if len(titles)!=npanel:
+        raise Exception("Number of titles is not the same as the number of panels!")
+    return list(titles)
+
+def _plot_panel(ax,field1,field2,mask,spec,title,kwargs):
+    # 1枚のパネル (塗りつぶし・コンター・ハッチ・目盛り・海岸線・陸地)
+    kwargs = dict(kwargs)
+    hatches, echatch = kwargs.pop('hatches',[".."]), kwargs.pop('echatch',"black")
+    zhatch, rasterize = kwargs.pop('zhatch',1.5), kwargs.get('rasterize',False)
+    if field2 is None:
+        c = axplot_hrz_field(ax,field1,spec=spec,title=title,add_colorbar=False,cout=True,**kwargs)
+    else:
+        c = axplot_hrz_field_double(ax,field1,field2,spec=spec,title=title,add_colorbar=False,
+                                    cout=True,**kwargs)
+    if mask is not None:
+        if kwargs.get('subset',True):
+            mask = subset_to_extent(mask,kwargs.get('x_min',120),kwargs.get('x_max',260),
+                                    kwargs.get('y_min',-20),kwargs.get('y_max',70))
+        h = add_mask_hatch(ax,mask,hatches=hatches,ec=echatch,zorder=zhatch)
+        rasterize_layers(rasterize,hatch=h)
+    return c
+
+def _render_panel_image(args):
+    # 別プロセスで1枚のパネルを描き，RGBAの配列にして返す
+    import matplotlib
+    matplotlib.use('Agg')
+    from .anim import figure_to_image
+    field1,field2,mask,spec,title,kwargs,projection,figsize,dpi = args
+    fig = plt.figure(figsize=figsize,dpi=dpi,layout='constrained')
+    ax = fig.add_subplot(projection=projection)
+    _plot_panel(ax,field1,field2,mask,spec,title,kwargs)
+    image = np.array(figure_to_image(fig))
+    plt.close(fig)
+    return image
+
+@profiled
+def draw_hrz_panel_grid(field1,field2=None,field_hatch=None,tc_val=None,dim=None,ncols=None,
+                        clev_min=None,clev_max=None,clev_int=None,cmap="RdBu_r",spec=None,
+                        x_min=120,x_max=260,y_min=-20,y_max=70,central_longitude=180,
+                        titles=None,title="",var_label="",panel_width=4.,figsize=None,dpi=150,
+                        outer_ticks=True,nworkers=1,
+                        savefig=False,fname_save=None,raster_dpi=None,**kwargs):
+    """
+    field1      : xr.DataArray , 3-dims (dim,"lat","lon"). パネルごとに塗りつぶす場
+    field2      : xr.DataArray , field1と同じ形。パネルごとにコンターで重ねる場 (clev_min2/clev_max2/clev_int2を指定)
+    field_hatch : xr.DataArray , t値 (tc_valと比べる) またはboolのマスク。有意な所にハッチを付ける
+    tc_val      : float or xr.DataArray , t値の臨界値
+    dim         : string , パネルの次元 (Noneなら"lat","lon"以外の次元)
+    ncols       : int    , 横に並べるパネルの数 (Noneならほぼ正方形になるように決める)
+    clev_min,clev_max,clev_int : float , 全パネル共通の色のレベル (3つともNoneなら全パネルのデータから決める)
+    spec        : LevelSpec , 指定するとclev_*/cmapの代わりに使う
+    titles      : list or string , パネルごとのタイトル。文字列なら{index}と{<dim>}(座標の値)を使える
+                  (例: "{season}", "{time:%Y-%m}")。Noneなら座標の値
+    title       : string , 図全体のタイトル
+    outer_ticks : bool   , Trueなら目盛りのラベルを左端の列と下端の行のパネルだけに付ける
+    nworkers    : int    , 1より大きければパネルを別々のプロセスで画像にしてから並べる (PNGなどの画像向け)
+    kwargs      : axplot_hrz_field(_double)の引数 (xtickint,ytickint,clev_min2,...,landcol,mode,rasterize,...)
+                  とハッチの hatches, echatch, zhatch
+    ------------------------------------------------------------
+    パネルの次元を持つ配列を受け取り，季節ごとなどの複数パネルの地図を1枚の図にまとめて描く関数。
+    GeoAxesは1回でまとめて作り，色のレベル・norm・カラーマップ(LevelSpec)は全パネルで1つだけ計算し，
+    カラーバーも図に1つだけ付ける。陸地・海岸線の投影済みの形状はパネル間でキャッシュを共有します。
+    (fig, axes) を返す。
+
+        fig, axes = draw_hrz_panel_grid(sst_clim,slp_clim,tval,tc,dim='month',ncols=3,
+                                        clev_min=-2,clev_max=2,clev_int=0.25,
+                                        clev_min2=-8,clev_max2=8,clev_int2=2,titles="{month}",
+                                        var_label="SST [K]",savefig=True,fname_save="./clim.png")
+    """
+    stage("levels")
+    dim = _panel_dim(field1,dim)
+    npanel = field1.sizes[dim]
+    coord = field1.indexes[dim] if dim in field1.indexes else None
+    if spec is None:
+        spec = LevelSpec(clev_min,clev_max,clev_int,cmap=cmap,field=field1)
+    masks = None
+    if field_hatch is not None:
+        masks = significance_mask(field_hatch,tc_val)
+    titles = _panel_titles(titles,dim,coord,npanel)
+    kwargs.update(x_min=x_min,x_max=x_max,y_min=y_min,y_max=y_max)
+    panels = [(field1.isel({dim:i}),
+               None if field2 is None else field2.isel({dim:i}),
+               None if masks is None else masks.isel({dim:i}),
+               titles[i]) for i in range(npanel)]
+
+    stage("figure")
+    ncols = int(np.ceil(np.sqrt(npanel))) if ncols is None else ncols
+    nrows = int(np.ceil(npanel/ncols))
+    panel_size = (panel_width,panel_width*(y_max-y_min)/(x_max-x_min)+0.5)
+    if figsize is None:
+        figsize = (panel_size[0]*ncols,panel_size[1]*nrows+0.8)
+    projection = ccrs.PlateCarree(central_longitude=central_longitude)
+    fig = plt.figure(figsize=figsize,dpi=dpi,layout='constrained')
+    if nworkers<=1:
+        axes = fig.subplots(nrows,ncols,squeeze=False,subplot_kw={'projection':projection})
+    else:
+        axes = fig.subplots(nrows,ncols,squeeze=False)
+    for ax in axes.ravel()[npanel:]:
+        ax.set_visible(False)
+    axes_used = list(axes.ravel()[:npanel])
+
+    stage("panels")
+    if nworkers<=1:
+        for i,(ax,(f1,f2,mask,ptitle)) in enumerate(zip(axes_used,panels)):
+            c = _plot_panel(ax,f1,f2,mask,spec,ptitle,kwargs)
+            if outer_ticks:
+                ax.tick_params(labelleft=i%ncols==0,labelbottom=i+ncols>=npanel)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        jobs = [(f1,f2,mask,spec,ptitle,kwargs,projection,panel_size,dpi)
+                for f1,f2,mask,ptitle in panels]
+        with ProcessPoolExecutor(max_workers=nworkers) as pool:
+            images = list(pool.map(_render_panel_image,jobs))
+        for ax,image in zip(axes_used,images):
+            ax.imshow(image,interpolation='none')
+            ax.set_axis_off()
+        c = plt.cm.ScalarMappable(norm=spec.norm,cmap=spec.cmap)
+
+    stage("colorbar")
+    # 全パネルで1つのカラーバー
+    spec.colorbar(c,ax=axes_used,label=var_label,shrink=0.8)
+    if title:
+        fig.suptitle(title)
+
+    stage("savefig")
+    if savefig:
+        fig.savefig(fname_save,dpi=_savefig_dpi(fname_save,raster_dpi))
+    return fig, axes
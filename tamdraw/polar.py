@@ -0,0 +1,121 @@
+import functools
+import collections
+import numpy as np
+import cartopy.crs as ccrs
+from .features import _projection_key
+from .meshes import _coord_key
+#
+# 地図の座標の等間隔格子への内挿の重み
+#   (経度, 緯度, 地図のCRS, 格子) -> {'band','index','weight','shape'}
+_weight_cache = collections.OrderedDict()
+_weight_cache_max = 8
+
+@functools.lru_cache(maxsize=None)
+def circle_path(npoint=100):
+    """
+    ax.set_boundary(circle_path(),transform=ax.transAxes) で極投影の地図の外形を円にするPath。
+    全てのパネルで同じPathを使う。
+    """
+    from matplotlib.path import Path
+    theta = np.linspace(0,2*np.pi,npoint)
+    return Path(np.stack([0.5+0.5*np.cos(theta),0.5+0.5*np.sin(theta)],1))
+
+def projection_grid(ax,npix=True):
+    """
+    ax   : GeoAxes
+    npix : True (Axesの画素数の半分) or int (長い辺の格子点の数)
+    ------------------------------------------------------------
+    今の表示範囲を覆う地図の座標の等間隔格子の (x, y) (格子点の中心) を返す。
+    """
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    if npix is True:
+        nx, ny = max(int(ax.bbox.width)//2,2), max(int(ax.bbox.height)//2,2)
+    else:
+        scale = int(npix)/max(abs(x1-x0),abs(y1-y0))
+        nx, ny = max(int(round(abs(x1-x0)*scale)),2), max(int(round(abs(y1-y0)*scale)),2)
+    dx, dy = (x1-x0)/nx, (y1-y0)/ny
+    return x0+dx*(np.arange(nx)+0.5), y0+dy*(np.arange(ny)+0.5)
+
+def _axis_weights(coord,q,cyclic=False):
+    # 1次元の線形内挿の (左の番号, 右の番号, 右の重み, 範囲内か)
+    ext = np.append(coord,coord[0]+360) if cyclic else coord
+    i = np.clip(np.searchsorted(ext,q,side='right')-1,0,len(ext)-2)
+    w = (q-ext[i])/(ext[i+1]-ext[i])
+    valid = (w>=-1e-9)&(w<=1+1e-9)
+    return i, (i+1)%len(coord), np.clip(w,0,1), valid
+
+def _regrid_weights(lon,lat,projection,x,y):
+    key = (_coord_key(lon),_coord_key(lat),_projection_key(projection),_coord_key(x),_coord_key(y))
+    if key in _weight_cache:
+        _weight_cache.move_to_end(key)
+        return _weight_cache[key]
+    X, Y = np.meshgrid(x,y)
+    pts = ccrs.PlateCarree().transform_points(projection,X,Y)
+    qlon, qlat = pts[...,0].ravel(), pts[...,1].ravel()
+    # 表示範囲にかかる緯度の帯 (+1格子) だけを使う
+    ok = np.isfinite(qlon)&np.isfinite(qlat)
+    band = slice(0,len(lat))
+    if ok.any():
+        j0 = np.searchsorted(lat,np.min(qlat[ok]),side='right')-2
+        j1 = np.searchsorted(lat,np.max(qlat[ok]),side='left')+2
+        if j1-j0>=2:
+            band = slice(max(j0,0),min(j1,len(lat)))
+    blat, nlon = lat[band], len(lon)
+    # 全球の経度なら最後と最初の経度の間もつなぐ
+    dlon = np.median(np.diff(lon)) if nlon>1 else 360.
+    cyclic = abs(lon[-1]-lon[0]+dlon-360)<dlon/2
+    qlon = np.mod(np.where(ok,qlon,lon[0])-lon[0],360)+lon[0]
+    i0, i1, wx, vx = _axis_weights(lon,qlon,cyclic)
+    j0, j1, wy, vy = _axis_weights(blat,np.where(ok,qlat,blat[0]))
+    index = np.stack([j0*nlon+i0,j0*nlon+i1,j1*nlon+i0,j1*nlon+i1])
+    weight = np.stack([(1-wy)*(1-wx),(1-wy)*wx,wy*(1-wx),wy*wx])
+    weight[:,~(ok&vx&vy)] = np.nan
+    entry = {'band':band,'index':index,'weight':weight,'shape':(len(y),len(x))}
+    _weight_cache[key] = entry
+    while len(_weight_cache)>_weight_cache_max:
+        _weight_cache.popitem(last=False)
+    return entry
+
+def regrid_to_projection(field,ax,npix=True):
+    """
+    field : xr.DataArray , 2-dims ("lat","lon"). boolのマスクも可
+    ax    : GeoAxes (表示範囲を決めてから呼ぶ。set_extentなど)
+    npix  : True or int , 格子の細かさ (projection_gridと同じ)
+    ------------------------------------------------------------
+    表示範囲にかかる緯度の帯だけを切り出し，地図の座標の等間隔格子("y","x")に双線形内挿した配列を返す。
+    内挿の重みは (格子, projection, 表示範囲) ごとにキャッシュするので，同じ格子の
+    2つ目以降の層(contour, hatch)・パネル・フレームでは投影を計算しません。
+    範囲外の点と，周りの格子点の重みの半分以上がNaNの点はNaN (boolはFalse) になる。
+    """
+    import xarray as xr
+    x, y = projection_grid(ax,npix)
+    field = field.transpose(...,'lat','lon')
+    if field['lat'].values[0]>field['lat'].values[-1]:
+        field = field.isel(lat=slice(None,None,-1))
+    if np.any(np.diff(field['lon'].values)<=0):
+        field = field.sortby('lon')
+    lon, lat = field['lon'].values.astype(float), field['lat'].values.astype(float)
+    entry = _regrid_weights(lon,lat,ax.projection,x,y)
+    is_bool = field.dtype==bool
+    data = np.asarray(field.isel(lat=entry['band']).values,dtype=float).reshape(-1)[entry['index']]
+    # NaNの点を除いて重みを付け直す (重みの半分以上がNaNならNaN。マスクの境界は格子点の中間になる)
+    weight = np.where(np.isnan(data),0.,entry['weight'])
+    with np.errstate(invalid='ignore',divide='ignore'):
+        wsum = np.sum(weight,axis=0)
+        values = np.sum(weight*np.nan_to_num(data),axis=0)/wsum
+    values = np.where(wsum>=0.5,values,np.nan).reshape(entry['shape'])
+    if is_bool:
+        values = np.nan_to_num(values)>=0.5
+    return xr.DataArray(values,dims=('y','x'),coords={'y':y,'x':x},name=field.name,attrs=field.attrs)
+
+def regrid_fields(ax,*fields,npix=True):
+    """
+    regrid_to_projectionを複数の配列にまとめて適用する。float(tc_valなど)やNoneはそのまま返す。
+    """
+    return tuple(regrid_to_projection(field,ax,npix) if hasattr(field,'dims') else field
+                 for field in fields)
+
+def clear_regrid_cache():
+    """内挿の重みのキャッシュを消す。"""
+    _weight_cache.clear()
@@ -0,0 +1,153 @@
+import time
+import json
+import functools
+import threading
+import contextlib
+#
+# 計測中のProfile (空なら計測しない)。呼び出しの入れ子はスレッドごとに持つ
+_profiles = []
+_local = threading.local()
+
+def _stack():
+    stack = getattr(_local,'stack',None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+class _Call:
+    # 1回の関数呼び出しの計測 (今の段階とその開始時刻)
+    __slots__ = ('func','t0','stage','t_stage','stages')
+    def __init__(self,func):
+        now = time.perf_counter()
+        self.func, self.t0 = func, now
+        self.stage, self.t_stage = 'setup', now
+        self.stages = {}
+
+    def switch(self,name,now):
+        self.stages[self.stage] = self.stages.get(self.stage,0.)+now-self.t_stage
+        self.stage, self.t_stage = name, now
+
+    def finish(self):
+        now = time.perf_counter()
+        self.switch(None,now)
+        return {'func':self.func,'total':now-self.t0,'stages':self.stages}
+
+def stage(name):
+    """
+    name : string , これから始まる段階の名前 ("levels","contourf","hatch","savefig"など)
+    ------------------------------------------------------------
+    profiledな関数の中で段階の区切りを付ける。次のstage(または関数の終わり)までの時間がnameに入る。
+    同じnameが1回の呼び出しで何度出てきても足し合わせる。計測していなければ何もしない。
+    """
+    if not _profiles:
+        return
+    stack = _stack()
+    if stack:
+        stack[-1].switch(name,time.perf_counter())
+
+def profiled(func):
+    """
+    関数の呼び出しごとに段階別の時間を記録するデコレータ。計測していなければそのまま呼ぶだけ。
+    入れ子の呼び出し(MapTemplateの中のaxplot_whitemapなど)は別の記録になり，
+    呼び出し側では呼んだ段階の時間に含まれる。
+    """
+    name = func.__name__
+    @functools.wraps(func)
+    def wrapper(*args,**kwargs):
+        if not _profiles:
+            return func(*args,**kwargs)
+        call = _Call(name)
+        stack = _stack()
+        stack.append(call)
+        try:
+            return func(*args,**kwargs)
+        finally:
+            stack.pop()
+            record = call.finish()
+            for prof in list(_profiles):
+                prof.records.append(record)
+    return wrapper
+
+class Profile:
+    """
+    profile()が返す計測結果。
+    records : list of dict , 呼び出しごとの {'func','total','stages':{段階:秒}}
+    """
+    def __init__(self):
+        self.records = []
+
+    def summary(self):
+        """
+        関数ごとに全ての呼び出しをまとめた
+        {func: {'calls','total','mean','stages':{段階: {'total','mean','max','share'}}}} を返す。
+        shareはその関数の合計時間に対する割合。
+        """
+        summary = {}
+        for record in self.records:
+            entry = summary.setdefault(record['func'],{'calls':0,'total':0.,'stages':{}})
+            entry['calls'] += 1
+            entry['total'] += record['total']
+            for name,sec in record['stages'].items():
+                st = entry['stages'].setdefault(name,{'total':0.,'max':0.,'calls':0})
+                st['total'] += sec
+                st['max'] = max(st['max'],sec)
+                st['calls'] += 1
+        for entry in summary.values():
+            entry['mean'] = entry['total']/entry['calls']
+            for st in entry['stages'].values():
+                st['mean'] = st['total']/entry['calls']
+                st['share'] = st['total']/entry['total'] if entry['total']>0 else 0.
+                del st['calls']
+        return summary
+
+    def stage_totals(self):
+        """全ての関数の段階ごとの合計時間 {段階: 秒} (大きい順)。"""
+        totals = {}
+        for record in self.records:
+            for name,sec in record['stages'].items():
+                totals[name] = totals.get(name,0.)+sec
+        return dict(sorted(totals.items(),key=lambda kv:-kv[1]))
+
+    def to_dict(self):
+        return {'records':self.records,'summary':self.summary(),'stage_totals':self.stage_totals()}
+
+    def to_json(self,fname=None,indent=1):
+        """
+        fname : string , 保存するファイル名 (Noneなら文字列を返すだけ)
+        """
+        text = json.dumps(self.to_dict(),indent=indent)
+        if fname is not None:
+            with open(fname,'w') as f:
+                f.write(text)
+        return text
+
+    def report(self,file=None):
+        """関数ごと・段階ごとの合計時間の表を表示する。"""
+        for func,entry in self.summary().items():
+            print(f"{func}: {entry['calls']} calls, total {entry['total']:.3f} s, "
+                  f"mean {entry['mean']:.3f} s",file=file)
+            for name,st in sorted(entry['stages'].items(),key=lambda kv:-kv[1]['total']):
+                print(f"    {name:<12} {st['total']:>9.3f} s {100*st['share']:>6.1f} %"
+                      f"  (mean {st['mean']:.3f}, max {st['max']:.3f})",file=file)
+
+@contextlib.contextmanager
+def profile():
+    """
+    with tamdraw.profile() as p:
+        for t in range(12):
+            tamdraw.draw_hrz_field_double_hatch(...,savefig=True)
+    p.report()                 # 関数ごと・段階ごとの表
+    p.to_json('profile.json')  # or p.to_dict()
+    ------------------------------------------------------------
+    with文の中で呼ばれたdraw_*/axplot_*などの関数について，段階
+    (subset, figure, levels, coarsen, contourf, contour, clabel, hatch, rectangle, ticks,
+    coastlines, land, savefig) ごとの時間を呼び出しごとに記録する。
+    matplotlib/cartopyは描画(投影・塗りつぶし)をsavefigまで遅らせるので，その時間はsavefigに入ります。
+    with文の外では計測しないので，普段の描画はほとんど遅くなりません。
+    """
+    prof = Profile()
+    _profiles.append(prof)
+    try:
+        yield prof
+    finally:
+        _profiles.remove(prof)
@@ -0,0 +1,163 @@
+import os
+import numpy as np
+#
+# 画像にした層の解像度(raster_dpi)を使う保存形式
+_vector_formats = ('.pdf','.svg','.svgz','.eps','.ps')
+
+def _is_regular(coord,rtol=1e-3):
+    if len(coord)<2:
+        return False
+    diff = np.diff(coord)
+    return bool(np.allclose(diff,diff[0],rtol=rtol,atol=0))
+
+def platecarree_grid(field,projection):
+    """
+    field      : xr.DataArray , "lon","lat"の次元を持つ配列
+    projection : cartopy CRS of the axes
+    ------------------------------------------------------------
+    地図がPlateCarree(中心経度は任意)で格子が等間隔なら，経度を地図上のx座標
+    (中心経度からのずれ, -180~180)に置き換えて単調増加に並べたfieldを返す。
+    この場合は画像をそのまま地図座標に置けるので，投影の計算(warp)が要らない。
+    並べ替えが要らなければデータはコピーしない。それ以外の場合はNoneを返す。
+    """
+    import cartopy.crs as ccrs
+    if not isinstance(projection,ccrs.PlateCarree) or 'lon' not in getattr(field,'dims',()) \
+       or 'lat' not in field.dims:
+        return None
+    # cartopyのPlateCarreeは中心経度を'pm'(本初子午線)として持つ
+    params = projection.proj4_params
+    clon = float(params.get('lon_0',0.))+float(params.get('pm',0.))
+    x = np.mod(np.asarray(field['lon'],dtype=float)-clon+180,360)-180
+    order = np.argsort(x,kind='stable')
+    if np.any(order!=np.arange(len(order))):
+        field, x = field.isel(lon=order), x[order]
+    if not (_is_regular(x) and _is_regular(np.asarray(field['lat'],dtype=float))):
+        return None
+    return field.transpose(...,'lat','lon').assign_coords(lon=x)
+
+def _native_grid(field,projection,transform):
+    # regrid_to_projectionの戻り値のように，すでに地図の座標の等間隔格子("y","x")ならそのまま返す
+    if 'lon' in field.dims or transform is None or transform!=projection:
+        return None
+    ydim, xdim = field.dims[-2:]
+    if not (_is_regular(np.asarray(field[xdim],dtype=float)) and
+            _is_regular(np.asarray(field[ydim],dtype=float))):
+        return None
+    return field
+
+def _image_grid(field,ax,transform):
+    grid = platecarree_grid(field,ax.projection)
+    return grid if grid is not None else _native_grid(field,ax.projection,transform)
+
+def _plot_filled_spec(field,mode,spec,ax,transform=None,add_colorbar=True,cbar_kwargs=None,
+                      center=None,levels=None,cmap=None,extend=None,**kwargs):
+    # levels/cmap/extend/centerはspecのものを使い，xarrayのplotを通さずに描く
+    ydim, xdim = ('lat','lon') if 'lon' in field.dims else field.dims[-2:]
+    field = field.transpose(...,ydim,xdim)
+    kwargs.update(cmap=spec.cmap,norm=spec.norm)
+    if mode=="contour":
+        from .meshes import geo_xy
+        x, y, transform = geo_xy(ax,field[xdim].values,field[ydim].values,transform)
+        c = ax.contourf(x,y,field.values,levels=spec.levels,extend=spec.extend,
+                        transform=transform,**kwargs)
+    elif mode=="raster":
+        kwargs.pop('corner_mask',None)
+        grid = _image_grid(field,ax,transform)
+        if grid is not None:
+            x, y = grid[grid.dims[-1]].values, grid[grid.dims[-2]].values
+            dx, dy = x[1]-x[0], y[1]-y[0]
+            kwargs.setdefault('interpolation','nearest')
+            c = ax.imshow(grid.values,extent=(x[0]-dx/2,x[-1]+dx/2,y[0]-dy/2,y[-1]+dy/2),
+                          origin='lower',transform=ax.projection,**kwargs)
+        else:
+            kwargs.setdefault('rasterized',True)
+            c = ax.pcolormesh(field[xdim].values,field[ydim].values,field.values,
+                              shading='auto',transform=transform,**kwargs)
+    else:
+        raise Exception(f"mode '{mode}' is not supported!")
+    if add_colorbar:
+        cbar_kwargs = dict(cbar_kwargs or {})
+        cbar_kwargs.setdefault('extend',spec.extend)
+        ax.figure.colorbar(c,ax=ax,**cbar_kwargs)
+    return c
+
+def plot_filled(field,mode="contour",spec=None,**kwargs):
+    """
+    field  : xr.DataArray , 2-dims ("lat","lon"), または地図の座標の格子("y","x", transform=ax.projection)
+    mode   : string , "contour" (field.plot.contourf) or "raster"
+    spec   : LevelSpec , 指定するとlevels/cmap/extendの代わりに使い，xarrayを通さずに描く
+    kwargs : field.plot.contourfと同じ引数 (ax,transform,levels,cmap,center,extend,add_colorbar,cbar_kwargs,...)
+    ------------------------------------------------------------
+    塗りつぶしの描画をmodeで切り替える関数。
+    "raster"では同じlevels(BoundaryNorm)・カラーマップ・カラーバーのまま，
+    ポリゴンを作らずに1枚の画像として描きます。PlateCarreeの地図で等間隔の格子なら
+    imshow(地図座標にそのまま配置)，それ以外はpcolormesh(rasterized)を使う。
+    地図の座標の等間隔格子(regrid_to_projectionの戻り値)もimshowで描く。
+    """
+    if spec is not None:
+        return _plot_filled_spec(field,mode,spec,**kwargs)
+    if mode=="contour":
+        from .meshes import geo_plot
+        return geo_plot(field,"contourf",**kwargs)
+    if mode!="raster":
+        raise Exception(f"mode '{mode}' is not supported!")
+    kwargs.pop('corner_mask',None)
+    ax = kwargs['ax']
+    grid = _image_grid(field,ax,kwargs.get('transform'))
+    if grid is not None:
+        kwargs['transform'] = ax.projection
+        kwargs.setdefault('interpolation','nearest')
+        return grid.plot.imshow(**kwargs)
+    kwargs.setdefault('rasterized',True)
+    return field.plot.pcolormesh(**kwargs)
+
+def update_raster(artist,field):
+    """
+    artist : plot_filled(mode="raster")の戻り値 (AxesImage or QuadMesh)
+    field  : xr.DataArray , 同じ格子の新しいデータ
+    ------------------------------------------------------------
+    画像の値だけを入れ替える (座標・norm・カラーマップはそのまま)。
+    """
+    grid = platecarree_grid(field,artist.axes.projection) if hasattr(artist,'set_extent') else None
+    if grid is not None:
+        artist.set_data(np.asarray(grid))
+    else:
+        artist.set_array(np.asarray(field.transpose(...,'lat','lon')).ravel())
+    return artist
+
+def _layer_names(rasterize):
+    if rasterize is True:
+        return ("fill","hatch")
+    if not rasterize:
+        return ()
+    names = (rasterize,) if isinstance(rasterize,str) else tuple(rasterize)
+    for name in names:
+        if name not in ("fill","hatch"):
+            raise Exception(f"layer '{name}' cannot be rasterized! (use 'fill' or 'hatch')")
+    return names
+
+def rasterize_layers(rasterize,fill=None,hatch=None):
+    """
+    rasterize : bool, string or list , 画像として埋め込む層。
+                True ("fill"と"hatch"の両方), "fill", "hatch", ["fill","hatch"], False (全てベクター)
+    fill      : artist or list , 塗りつぶしの層 (contourfなど)
+    hatch     : artist or list , ハッチの層
+    ------------------------------------------------------------
+    PDF/SVGで保存するときに，指定した層だけを画像にする(set_rasterized)。
+    海岸線・コンター・文字・カラーバーはベクターのまま残るので，ファイルが小さく保存も速くなります。
+    画像の解像度はfig.savefig(..., dpi=)で決まる (draw_*関数ではraster_dpi)。
+    """
+    names = _layer_names(rasterize)
+    for name,artists in (("fill",fill),("hatch",hatch)):
+        if name not in names or artists is None:
+            continue
+        for artist in artists if isinstance(artists,(list,tuple)) else [artists]:
+            if artist is not None:
+                artist.set_rasterized(True)
+
+def _savefig_dpi(fname_save,raster_dpi=None):
+    # raster_dpiはベクター形式(PDF/SVG/EPS/PS)の中の画像の解像度。PNGなどは図の解像度のまま保存する
+    ext = os.path.splitext(os.fspath(fname_save))[1].lower() if isinstance(fname_save,(str,os.PathLike)) else ''
+    if raster_dpi and ext in _vector_formats:
+        return raster_dpi
+    return 'figure'
@@ -0,0 +1,228 @@
+import os
+import warnings
+import numpy as np
+#
+# 子プロセス側で保持する状態 (initializerで設定)
+_worker = {}
+
+def event_index(field,events,time='time'):
+    """
+    field  : xr.DataArray , timeの次元を持つ配列
+    events : 事例の番号(int), timeと同じ長さのbool, または時刻 (field[time]の値)
+    ------------------------------------------------------------
+    事例のtimeの番号 (int, 1次元) を返す。時刻がfieldにないとき・同じ事例が重複しているときはエラーにする。
+    """
+    nt = field.sizes[time]
+    values = np.asarray(getattr(events,'values',events))
+    if values.dtype==bool:
+        if len(values)!=nt:
+            raise Exception(f"Length of the bool events ({len(values)}) is not that of '{time}' ({nt})!")
+        return np.flatnonzero(values)
+    if values.dtype.kind in 'iu':
+        index = values.astype(int).ravel()
+    else:
+        index = field.get_index(time).get_indexer(values.ravel())
+        if np.any(index<0):
+            raise Exception(f"Events {values.ravel()[index<0][:5]} are not found in '{time}'!")
+    if len(index)==0 or index.min()<-nt or index.max()>=nt:
+        raise Exception("Event indices are empty or out of range!")
+    index = index%nt
+    # 重複した事例はcomposite.build_compositeと同じくエラーにする
+    unique, counts = np.unique(index,return_counts=True)
+    if np.any(counts>1):
+        raise Exception(f"Duplicate events (index {unique[counts>1][:5]}) are given!")
+    return index
+
+def _batch_size(npoint,batch,max_mb):
+    # 1回の標本の配列 (batch, 格子点の数) がmax_mbに収まる数
+    if batch is not None:
+        return max(int(batch),1)
+    return max(int(max_mb*2**20//(8*4*max(npoint,1))),1)
+
+def _composite_counts(arrays,params,rng,size):
+    data, valid, events = arrays['data'], arrays.get('valid'), arrays['events']
+    nt, nevent = data.shape[0], len(events)
+    if params['method']=='permutation':
+        # 全期間から事例と同じ数を重複なしに選ぶ
+        idx = np.argsort(rng.random((size,nt)),axis=1)[:,:nevent]
+    else:
+        idx = events[rng.integers(0,nevent,(size,nevent))]
+    total = np.zeros((size,)+data.shape[1:])
+    count = np.zeros((size,)+data.shape[1:]) if valid is not None else nevent
+    for j in range(nevent):
+        total += data[idx[:,j]]
+        if valid is not None:
+            count += valid[idx[:,j]]
+    with np.errstate(invalid='ignore',divide='ignore'):
+        mean = total/count
+    # 選んだ事例が全てNaNの標本は数えない (最後の配列が有効な標本の数)
+    if params['method']=='permutation':
+        return (np.abs(mean-arrays['clim'])>=arrays['obs_dev']*(1-1e-12),np.isfinite(mean))
+    return (mean<=params['null'],mean>=params['null'],np.isfinite(mean))
+
+def _bootstrap_weights(rng,size,nt):
+    # 重複ありで選んだときの各時刻の回数 (size, nt)
+    idx = rng.integers(0,nt,(size,nt))+np.arange(size)[:,None]*nt
+    return np.bincount(idx.ravel(),minlength=size*nt).reshape(size,nt).astype(np.float32)
+
+def _correlation_counts(arrays,params,rng,size):
+    x, z = arrays['x'], arrays['z']
+    nt = len(x)
+    if params['method']=='permutation':
+        # 標準化したxを並べ替えても平均・分散は同じなので，相関は内積だけで計算できる
+        r = rng.permuted(np.tile(x,(size,1)),axis=1)@z/nt
+        return (np.abs(r)>=np.abs(arrays['obs'])*(1-1e-12),np.isfinite(r))
+    w = _bootstrap_weights(rng,size,nt)
+    sx, sxx = w@x, w@(x*x)
+    sy, syy, sxy = w@z, w@arrays['zz'], (w*x)@z
+    sx, sxx = sx.astype(float)[:,None], sxx.astype(float)[:,None]
+    with np.errstate(invalid='ignore',divide='ignore'):
+        r = (nt*sxy-sx*sy)/np.sqrt((nt*sxx-sx*sx)*(nt*syy-sy*sy))
+    return (r<=0,r>=0,np.isfinite(r))
+
+_count_funcs = {'composite':_composite_counts,'correlation':_correlation_counts}
+
+def _run_batch(kind,arrays,params,seed,size):
+    rng = np.random.default_rng(seed)
+    return [np.sum(c,axis=0,dtype=np.int64) for c in _count_funcs[kind](arrays,params,rng,size)]
+
+def _init_worker(kind,specs,params):
+    from .batch import _attach_shared_memory
+    shms, arrays = [], {}
+    for key,(name,shape,dtype) in specs.items():
+        shm = _attach_shared_memory(name)
+        shms.append(shm)
+        arrays[key] = np.ndarray(shape,dtype=dtype,buffer=shm.buf)
+    _worker.update(kind=kind,arrays=arrays,params=params,shms=shms)
+
+def _worker_batch(task):
+    return _run_batch(_worker['kind'],_worker['arrays'],_worker['params'],*task)
+
+def _resample_counts(kind,arrays,params,nresample,batch,nworkers,seed):
+    # 標本をbatchずつに分け，それぞれにSeedSequenceから作った乱数の種を割り当てる
+    # (nworkersを変えても同じ結果になる)
+    nbatch = -(-nresample//batch)
+    sizes = [min(batch,nresample-i*batch) for i in range(nbatch)]
+    tasks = list(zip(np.random.SeedSequence(seed).spawn(nbatch),sizes))
+    nworkers = os.cpu_count() if nworkers is None else nworkers
+    if nworkers<=1 or nbatch==1:
+        results = (_run_batch(kind,arrays,params,*task) for task in tasks)
+        return [sum(counts) for counts in zip(*results)]
+
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    shms, specs = [], {}
+    try:
+        for key,arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            shm = shared_memory.SharedMemory(create=True,size=max(arr.nbytes,1))
+            shms.append(shm)
+            np.ndarray(arr.shape,dtype=arr.dtype,buffer=shm.buf)[...] = arr
+            specs[key] = (shm.name,arr.shape,arr.dtype)
+        with ProcessPoolExecutor(max_workers=nworkers,initializer=_init_worker,
+                                 initargs=(kind,specs,params)) as pool:
+            return [sum(counts) for counts in zip(*pool.map(_worker_batch,tasks))]
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+def _pvalue_field(counts,method,nresample,template,valid,alpha,mask,attrs):
+    import xarray as xr
+    # 分母はnresampleではなく，格子点ごとの平均・相関がNaNでなかった標本の数
+    nfinite = counts[-1]
+    with np.errstate(invalid='ignore',divide='ignore'):
+        if method=='permutation':
+            pval = (counts[0]+1)/(nfinite+1)
+        else:
+            pval = np.minimum(2*np.minimum(counts[0],counts[1])/nfinite,1.)
+    pval = np.where(valid&(nfinite>0),pval,np.nan).reshape(template.shape)
+    result = xr.DataArray(pval,dims=template.dims,coords=template.coords,name='pvalue',
+                          attrs=dict(attrs,method=method,nresample=nresample))
+    return result<1-alpha if mask else result
+
+def _check_method(method):
+    if method not in ('permutation','bootstrap'):
+        raise Exception(f"method must be 'permutation' or 'bootstrap', not '{method}'!")
+
+def composite_pvalue(field,events,nresample=10000,method='permutation',null=0.,time='time',
+                     alpha=0.95,mask=False,batch=None,max_mb=64,nworkers=1,seed=0):
+    """
+    field     : xr.DataArray , timeの次元を持つ配列 ((time,lat,lon)など)
+    events    : 事例の番号(int), timeと同じ長さのbool, または時刻 (event_indexを参照)
+    nresample : int , 標本の数
+    method    : string , "permutation" : 全期間から事例と同じ数の時刻を選んだ平均と比べる (Monte Carlo)
+                         "bootstrap"   : 事例を重複ありで選び直した平均の分布がnullを含むかを調べる
+    null      : float , bootstrapの帰無仮説の値 (偏差ならそのまま0)
+    alpha     : float , 信頼水準 (maskのとき)
+    mask      : bool  , Trueならp<1-alphaのboolのマスクを返す
+    batch     : int   , 1回にまとめて作る標本の数 (Noneなら(batch, 格子点の数)の配列がmax_mb[MB]に収まる数)
+    nworkers  : int   , プロセスの数 (Noneならos.cpu_count(), 1ならこのプロセスで計算する)
+    seed      : int   , 乱数の種 (同じseedならnworkers・batchの分け方によらず同じ結果。batchは同じにする)
+    ------------------------------------------------------------
+    事例の合成(コンポジット)平均の有意性を再標本化で調べ，格子点ごとのp値を返す関数。
+    標本はbatchずつまとめて作り，nworkers>1ならデータを共有メモリに1回だけ置いて複数プロセスで計算します。
+    NaNは標本ごとに除いて平均し，p値は平均がNaNでなかった標本の数で割る。
+    有効な事例が2つ未満の格子点はNaNになります。
+
+        p = composite_pvalue(sst,el_nino_dates,nworkers=8)
+        draw_hrz_field_double_hatch(comp,comp2,p<0.05,None)    # boolのマスクとして渡す
+        axplot_hrz_field_hatch(ax,comp,p.where(p<0.05))         # 有意な所だけの場として渡す
+    """
+    _check_method(method)
+    field = field.transpose(time,...)
+    template = field.isel({time:0},drop=True)
+    index = event_index(field,events,time)
+    data = np.asarray(field.values,dtype=float).reshape(field.sizes[time],-1)
+    valid = np.isfinite(data)
+    arrays = {'data':np.where(valid,data,0.),'events':index}
+    if not valid.all():
+        arrays['valid'] = valid
+    with np.errstate(invalid='ignore',divide='ignore'):
+        obs = arrays['data'][index].sum(axis=0)/valid[index].sum(axis=0)
+        clim = arrays['data'].sum(axis=0)/valid.sum(axis=0)
+    if method=='permutation':
+        arrays['clim'], arrays['obs_dev'] = clim, np.abs(obs-clim)
+    batch = _batch_size(data.shape[1],batch,max_mb)
+    counts = _resample_counts('composite',arrays,{'method':method,'null':null},nresample,batch,nworkers,seed)
+    valid_event = valid[index].sum(axis=0)>=2
+    return _pvalue_field(counts,method,nresample,template,valid_event,alpha,mask,
+                         {'long_name':'p-value of the composite mean','nevent':len(index)})
+
+def correlation_pvalue(index,field,nresample=10000,method='permutation',time='time',
+                       alpha=0.95,mask=False,batch=None,max_mb=64,nworkers=1,seed=0):
+    """
+    index     : 1-dim array or xr.DataArray (time) , 基準の時系列 (DataArrayならfieldと時刻を合わせる)
+    field     : xr.DataArray , timeの次元を持つ配列
+    method    : string , "permutation" : indexを並べ替えた相関と比べる
+                         "bootstrap"   : (index, field)の組を重複ありで選び直した相関の分布が0を含むかを調べる
+    その他はcomposite_pvalueと同じ
+    ------------------------------------------------------------
+    indexとfieldの相関の有意性を再標本化で調べ，格子点ごとのp値を返す関数。
+    相関は標準化した配列の行列積でbatchごとにまとめて計算する。
+    NaNは各格子点の平均で置き換えて計算します (indexのNaNの時刻は除く)。
+    """
+    from .lagstats import _prepare_inputs
+    _check_method(method)
+    x, field = _prepare_inputs(index,field,time)
+    field = field.transpose(time,...)
+    template = field.isel({time:0},drop=True)
+    ok = np.isfinite(x)
+    data = np.asarray(field.values,dtype=float).reshape(field.sizes[time],-1)[ok]
+    x = x[ok]
+    x = (x-x.mean())/x.std()
+    with warnings.catch_warnings(), np.errstate(invalid='ignore',divide='ignore'):
+        warnings.simplefilter('ignore',RuntimeWarning)  # 全てNaNの格子点
+        z = (data-np.nanmean(data,axis=0))/np.nanstd(data,axis=0)
+    valid = np.isfinite(z).sum(axis=0)>=3
+    # 標本の相関は大小を比べるだけなので，行列積はfloat32で計算する (float64の約2倍速い)
+    z = np.where(np.isfinite(z),z,0.).astype(np.float32)
+    arrays = {'x':x.astype(np.float32),'z':z}
+    if method=='permutation':
+        arrays['obs'] = x@z.astype(float)/len(x)
+    else:
+        arrays['zz'] = z*z
+    batch = _batch_size(z.shape[1],batch,max_mb)
+    counts = _resample_counts('correlation',arrays,{'method':method},nresample,batch,nworkers,seed)
+    return _pvalue_field(counts,method,nresample,template,valid,alpha,mask,
+                         {'long_name':'p-value of the correlation'})
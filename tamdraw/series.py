@@ -0,0 +1,150 @@
+import datetime as dt
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from .cmaps import register_ipcc_cmaps
+register_ipcc_cmaps()
+# 
+def plot_lagcorr(x, y, title, xlabel='Lag[mon]', ylabel='Correlation',
+                 fsize_label=18, fsize_title=28, fsize_tick=14,
+                 savefig=False, fname="./sample.png"):
+    fig = plt.figure(figsize=(6.4,4.8))
+    ax = fig.add_subplot()
+    ax.plot(x, y, linewidth=2)
+    ax.set_xlim(min(x), max(x))
+    ax.set_ylim(-1,1)
+    ax.hlines([0], min(x), max(x), linewidth=2, color='black')
+    ax.vlines([0], -1, 1, linewidth=2, color='black')
+    ax.set_title(title, fontsize=fsize_title)
+    ax.set_xlabel(xlabel, fontsize=fsize_label)
+    ax.set_ylabel(ylabel, fontsize=fsize_label)
+    ax.tick_params('x', labelsize=fsize_tick)
+    ax.tick_params('y', labelsize=fsize_tick)
+    ax.grid()
+    if savefig:
+        
+        fig.savefig(fname)
+# 
+def plot_1d_normalized_series(series, key, title, ylabel='Index /std', xlabel='Time[year]',
+                           yr_start=1979, yr_end=2018, yr_int=10,
+                           fsize_label=18, fsize_title=28, fsize_tick=14,
+                           savefig=False, fname="./sample.png"):
+    fig = plt.figure(figsize=(6.4,4.8))
+    ax = fig.add_subplot()
+    ax.plot(series[key],series.values)
+    x_min = dt.datetime(yr_start-5,1,1)
+    x_max = dt.datetime(yr_end+5,1,1)
+    #xticks_data = np.array([cft.DatetimeGregorian(yr,1,1) for yr in range(x_min,x_max,yr_int)])
+    ax.set_xlim((x_min,x_max))
+    #abs_max = max(np.abs(series.values.min()), np.abs(series.values.max()))
+    #ax.set_ylim(-abs_max-0.5, abs_max+0.5)
+    ax.hlines([0], x_min, x_max, linewidth=2, color='black')
+    ax.set_xlabel(xlabel, fontsize=fsize_label)
+    ax.set_ylabel(ylabel, fontsize=fsize_label)
+    ax.xaxis.set_major_locator(mdates.YearLocator(yr_int,1,1))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
+    ax.tick_params('x', labelsize=fsize_tick)
+    ax.tick_params('y', labelsize=fsize_tick)
+    ax.set_title(title, fontsize=fsize_title)
+    ax.grid()
+    if savefig:
+        
+        fig.savefig(fname)
+#
+def plot_contourf(ax,x,y,var,
+                  cmin=0.,cmax=1.,cint=0.1,
+                  extend='both',
+                  title=None,
+                  xlabel=None,ylabel=None,
+                  cmap='viridis',
+                  pad = 0.1,):
+    clevels = np.arange(cmin,cmax+cint,cint)
+    cticks = None
+    xm,ym = np.meshgrid(x,y)
+    cf = ax.contourf(xm,ym,var,
+                        levels=clevels,cmap=cmap,extend=extend)
+    plt.colorbar(cf, pad=pad,
+            extend=extend,orientation='horizontal',shrink=1,aspect=40,
+            ticks=cticks)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+def plot_contour(ax,x,y,var,
+                  cmin=0.,cmax=1.,cint=0.1,
+                  linewidths=2,colors='black',
+                  title=None,
+                  xlabel=None,ylabel=None,
+                  clabel=False,fmt=None,
+                  ):
+    clevels = np.arange(cmin,cmax+cint,cint)
+    cticks = None
+
+    contour = ax.contour(x,y,var,
+                    levels=clevels,linewidths=linewidths,
+                    colors=colors)
+    if clabel:
+        ax.clabel(
+            contour,
+            fmt=fmt,
+            fontsize=6,
+            colors='black',
+            zorder=6.1
+        )
+
+def plot_pcolormesh(ax,x,y,var,
+                  cmin=0.,cmax=1.,cint=0.1,
+                  extend='both',
+                  title=None,
+                  xlabel=None,ylabel=None,
+                  cmap='viridis',
+                  pad = 0.1,):
+    clevels = np.arange(cmin,cmax+cint,cint)
+    cticks = None
+
+    cf = ax.pcolormesh(x,y,var,
+                       vmin=cmin,vmax=cmax,
+                        cmap=cmap)
+    plt.colorbar(cf, pad=pad,
+            extend=extend,orientation='horizontal',shrink=1,aspect=40,
+            ticks=cticks)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    
+def pcolmesh_lonlon(fig,ax,c,x,y,
+                    xmin=140,xmax=240,dx=1,
+                    ymin=140,ymax=240,dy=1,
+                    vmin=None,vmax=None,
+                    xlabel='Longitude',ylabel='Longitude',
+                    cmap='coolwarm',
+                    title=None,
+                    savefig=False,fname=None):
+    from   cartopy.mpl.ticker import LongitudeFormatter
+    ax.invert_yaxis()
+    # Make a copy
+    cmap = plt.get_cmap(cmap).copy()
+    # Choose the color
+    cmap.set_bad('silver',1.)
+    
+    # x = np.arange(xmin-dx*0.5,xmax+dx*0.5,dx)
+    # y = np.arange(ymin-dy*0.5,ymax+dy*0.5,dy)
+    pcolmesh = ax.pcolormesh(x,y,c,
+                cmap=cmap,vmin=vmin,vmax=vmax
+                )
+    
+    cbar = fig.colorbar(pcolmesh,ax=ax,)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    # ticks
+    xticks = np.arange(xmin,xmax+20,20)
+    yticks = np.arange(ymin,ymax+20,20)
+    ax.set_xticks(xticks)
+    ax.set_yticks(yticks)
+    lon_formatter = LongitudeFormatter(zero_direction_label=True)
+    ax.xaxis.set_major_formatter(lon_formatter)
+    ax.yaxis.set_major_formatter(lon_formatter)
+    
+    if savefig:
+        fig.savefig(fname)
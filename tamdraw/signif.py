@@ -0,0 +1,214 @@
+import functools
+import numpy as np
+#
+@functools.lru_cache(maxsize=None)
+def _t_ppf(q,dof):
+    from scipy import stats
+    return float(stats.t.ppf(q,dof))
+
+def t_critical(dof,alpha=0.95,two_sided=True):
+    """
+    dof       : float or array (xr.DataArray) , degree of freedom
+    alpha     : float , 信頼水準 (0.95なら両側5%)
+    two_sided : bool  , 両側検定ならTrue
+    ------------------------------------------------------------
+    t分布の臨界値 stats.t.ppf(1-(1-alpha)/2,dof) を返す。
+    同じ(alpha,dof)の値は1回だけ計算してプロセス内で使い回します。
+    dofが配列なら同じ形(DataArrayならDataArray)で返す。
+    """
+    q = float(1-(1-alpha)/2 if two_sided else alpha)
+    if np.isscalar(dof):
+        return _t_ppf(q,float(dof))
+    from scipy import stats
+    values = np.asarray(dof,dtype=float)
+    # 同じ自由度は1回だけ，残りは1回のstats.t.ppfでまとめて計算する
+    uniq, inverse = np.unique(values,return_inverse=True)
+    with np.errstate(invalid='ignore'):
+        crit = stats.t.ppf(q,np.where(uniq>0,uniq,np.nan))
+    crit = crit[inverse].reshape(values.shape)
+    return dof.copy(data=crit) if hasattr(dof,'dims') else crit
+
+def significance_mask(field_hatch,tc_val=None,pval=False,alpha=0.95,dof=None):
+    """
+    field_hatch : xr.DataArray , t値 (pval=Trueならp値)。boolならそのままマスクとして使う
+    tc_val      : float or xr.DataArray , t値の臨界値。Noneならalphaとdofから計算する
+    pval        : bool  , field_hatchがp値ならTrue (p<1-alphaを有意とする)
+    ------------------------------------------------------------
+    有意な格子点をTrueとするboolの配列を返す。
+    """
+    if field_hatch.dtype==bool:
+        return field_hatch
+    if pval:
+        return field_hatch<1-alpha
+    if tc_val is None:
+        if dof is None:
+            raise Exception("tc_val or dof is needed for the significance test!")
+        tc_val = t_critical(dof,alpha)
+    return np.abs(field_hatch)>tc_val
+
+def _autocorr_sums(source,maxlag,var,time,chunk,max_mb,engine,select):
+    # ラグ1..maxlagの組 (x(t),x(t+k)) の和をchunkごとに足していく
+    #   sums[:,k-1] = (組の数, Σa, Σb, Σa^2, Σb^2, Σab), count = 有効なデータの数
+    from .stream import iter_time_chunks
+    sums, count, carry, ref, template = None, None, None, None, None
+    for part in iter_time_chunks(source,var,time,chunk,max_mb,engine,select):
+        part = part.transpose(time,...)
+        data = np.asarray(part.values,dtype=float)
+        if template is None:
+            template = part.isel({time:0},drop=True)
+            sums = np.zeros((6,maxlag)+data.shape[1:])
+            count = np.zeros(data.shape[1:])
+            # 最初のchunkの平均を引いて桁落ちを防ぐ (相関は平行移動で変わらない)
+            valid = np.isfinite(data)
+            ref = np.where(valid,data,0).sum(axis=0)/np.maximum(valid.sum(axis=0),1)
+        data = data-ref
+        count += np.isfinite(data).sum(axis=0)
+        ncarry = 0 if carry is None else len(carry)
+        block = data if carry is None else np.concatenate([carry,data])
+        for k in range(1,maxlag+1):
+            # 後ろの点が今のchunkにある組だけを数える (前のchunkとの境目の組も含む)
+            start = max(ncarry-k,0)
+            a, b = block[start:len(block)-k], block[start+k:]
+            ok = np.isfinite(a)&np.isfinite(b)
+            a, b = np.where(ok,a,0.), np.where(ok,b,0.)
+            sums[:,k-1] += [ok.sum(axis=0),a.sum(axis=0),b.sum(axis=0),
+                            (a*a).sum(axis=0),(b*b).sum(axis=0),(a*b).sum(axis=0)]
+        carry = block[-maxlag:]
+    if template is None:
+        raise Exception("No data was read!")
+    n, sa, sb, saa, sbb, sab = sums
+    with np.errstate(invalid='ignore',divide='ignore'):
+        acf = (n*sab-sa*sb)/np.sqrt((n*saa-sa*sa)*(n*sbb-sb*sb))
+    acf = np.where(n>=3,np.clip(acf,-1,1),np.nan)
+    return acf, count, template
+
+def autocorrelation(source,maxlag=1,var=None,time='time',chunk=None,max_mb=256,engine=None,select=None):
+    """
+    source : xr.DataArray (time,...) , またはファイル名(globのパターン可)・Datasetなど (iter_time_chunksと同じ)
+    maxlag : int , 計算する最大のラグ (1ならラグ1の自己相関)
+    chunk, max_mb, engine, select : iter_time_chunksと同じ (1回に読む時間の長さ・読む範囲)
+    ------------------------------------------------------------
+    格子点ごとのラグ1..maxlagの自己相関を (lag, time以外の次元) のDataArrayで返す。
+    timeの方向にchunkずつ読んで和を足していくので，メモリには1つのchunkと
+    格子点ごとの和 (6*maxlag枚) しか載りません。NaNを含む組は除く。
+    """
+    import xarray as xr
+    acf, count, template = _autocorr_sums(source,maxlag,var,time,chunk,max_mb,engine,select)
+    return xr.DataArray(acf,dims=('lag',)+template.dims,
+                        coords=dict(template.coords,lag=np.arange(1,maxlag+1)),
+                        name='acf',attrs={'long_name':'autocorrelation'})
+
+def effective_dof(source,maxlag=1,other=None,ddof=2,var=None,time='time',
+                  chunk=None,max_mb=256,engine=None,select=None):
+    """
+    source : xr.DataArray (time,...) , またはファイル名など (autocorrelationと同じ)
+    maxlag : int , 1ならラグ1の自己相関 r から n(1-r)/(1+r)，
+                   2以上なら n/(1+2Σ(1-k/n)r(k)) (k=1..maxlag) で有効なデータの数を見積もる
+    other  : 1-dim array or xr.DataArray (time) , 相関・回帰の相手の時系列 (指数など)。
+             指定するとrの代わりに両方の自己相関の積を使う (Bretherton et al. 1999)
+    ddof   : int , 有効なデータの数から引く数 (相関・回帰のt検定なら2)
+    ------------------------------------------------------------
+    格子点ごとの有効な自由度 (有効なデータの数-ddof) を，time以外の次元のDataArrayで返す。
+    有効なデータの数は各格子点の欠測でないデータの数を超えないようにする。
+    """
+    acf, count, template = _autocorr_sums(source,maxlag,var,time,chunk,max_mb,engine,select)
+    if other is not None:
+        import xarray as xr
+        other = xr.DataArray(np.asarray(other,dtype=float),dims=(time,))
+        acf_other = _autocorr_sums(other,maxlag,None,time,None,max_mb,None,None)[0]
+        acf = acf*acf_other.reshape((maxlag,)+(1,)*(acf.ndim-1))
+    with np.errstate(invalid='ignore',divide='ignore'):
+        if maxlag==1:
+            neff = count*(1-acf[0])/(1+acf[0])
+        else:
+            k = np.arange(1,maxlag+1).reshape((maxlag,)+(1,)*(acf.ndim-1))
+            neff = count/(1+2*np.sum((1-k/np.maximum(count,1))*np.nan_to_num(acf),axis=0))
+    import xarray as xr
+    neff = np.where(np.isfinite(neff),np.minimum(neff,count),np.nan)
+    return xr.DataArray(neff-ddof,dims=template.dims,coords=template.coords,name='dof',
+                        attrs={'long_name':'effective degrees of freedom'})
+
+def tcval_field(source,alpha=0.95,two_sided=True,maxlag=1,other=None,ddof=2,**kwargs):
+    """
+    source : xr.DataArray (time,...) , またはファイル名など (autocorrelationと同じ)
+    alpha  : float , 信頼水準 (0.95なら両側5%)
+    maxlag, other, ddof : effective_dofと同じ
+    ------------------------------------------------------------
+    格子点ごとに有効な自由度を見積もり，t値の臨界値の場 (tcval_da) を返す。
+    臨界値は全ての格子点をまとめて1回のstats.t.ppfで計算します。
+
+        tcval_da = tcval_field(olr,maxlag=1,other=nino34)
+        draw_hrz_field_hatch_hrz(reg,tval,tcval_da)
+    """
+    dof = effective_dof(source,maxlag,other,ddof,**kwargs)
+    return t_critical(dof,alpha,two_sided).rename('tcval')
+
+def _cell_edges(center):
+    center = np.asarray(center,dtype=float)
+    if len(center)<2:
+        return np.array([center[0]-0.5,center[0]+0.5])
+    mid = (center[:-1]+center[1:])/2
+    return np.concatenate([[2*center[0]-mid[0]],mid,[2*center[-1]-mid[-1]]])
+
+def mask_to_path(mask,x,y):
+    """
+    mask : 2-dims bool array (ny,nx)
+    x, y : 格子点の座標 (nx,), (ny,)
+    ------------------------------------------------------------
+    Trueの格子の範囲を，行ごとの連続区間をつなげた長方形の集まり(1つのPath)にする。
+    コンターを計算しないので，格子点が多くても速い。
+    """
+    from matplotlib.path import Path
+    mask = np.asarray(mask,dtype=bool)
+    xe, ye = _cell_edges(x), _cell_edges(y)
+    rects, active = [], {}
+    for j in range(mask.shape[0]+1):
+        runs = set()
+        if j<mask.shape[0]:
+            diff = np.diff(np.concatenate([[0],mask[j].astype(np.int8),[0]]))
+            runs = set(zip(np.flatnonzero(diff==1),np.flatnonzero(diff==-1)))
+        # 上の行と同じ区間は長方形を縦に伸ばす
+        for run in list(active):
+            if run not in runs:
+                rects.append((run[0],run[1],active.pop(run),j))
+        for run in runs:
+            active.setdefault(run,j)
+    if not rects:
+        return Path(np.zeros((0,2)))
+    i0, i1, j0, j1 = np.array(rects).T
+    x0, x1, y0, y1 = xe[i0], xe[i1], ye[j0], ye[j1]
+    verts = np.stack([np.stack([x0,y0],1),np.stack([x1,y0],1),np.stack([x1,y1],1),
+                      np.stack([x0,y1],1),np.stack([x0,y0],1)],1).reshape(-1,2)
+    codes = np.tile([Path.MOVETO,Path.LINETO,Path.LINETO,Path.LINETO,Path.CLOSEPOLY],len(rects))
+    return Path(verts,codes)
+
+def add_mask_hatch(ax,mask,hatches=[".."],ec="black",zorder=5,x='lon',y='lat',transform=None):
+    """
+    ax        : Axes (GeoAxes)
+    mask      : xr.DataArray , 2-dims bool. Trueの所にハッチを付ける (significance_maskの戻り値など)
+    x, y      : string , maskの横軸・縦軸の座標の名前
+    transform : Noneなら地図(経度・緯度)として描く。ホフメラー図などはax.transDataを指定
+    ------------------------------------------------------------
+    有意な領域にハッチを付ける関数。t値をcontourfする代わりにマスクの外形(長方形の集まり)を
+    1つのPathPatchとして描くので，2枚目の浮動小数点の場をコンターしなくて済みます。
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import PathPatch
+    if transform is None and hasattr(ax,'projection'):
+        from .raster import platecarree_grid
+        grid = platecarree_grid(mask,ax.projection) if (x,y)==('lon','lat') else None
+        if grid is not None:
+            mask, transform = grid, ax.transData
+        else:
+            import cartopy.crs as ccrs
+            transform = ccrs.PlateCarree()
+    elif transform is None:
+        transform = ax.transData
+    mask = mask.transpose(...,y,x)
+    path = mask_to_path(mask.values,mask[x].values,mask[y].values)
+    hatch = hatches if isinstance(hatches,str) else next(h for h in hatches if h)
+    plt.rcParams["hatch.color"]=ec
+    patch = PathPatch(path,facecolor='none',edgecolor=ec,linewidth=0,hatch=hatch,
+                      zorder=zorder,transform=transform)
+    ax.add_patch(patch)
+    return patch
@@ -0,0 +1,153 @@
+import os
+import glob
+import numpy as np
+#
+def _source_paths(source):
+    sources = [source] if isinstance(source,(str,os.PathLike)) else list(source)
+    paths = []
+    for src in sources:
+        src = os.fspath(src)
+        found = sorted(glob.glob(src)) if glob.has_magic(src) else [src]
+        if not found:
+            raise Exception(f"No file matches '{src}'!")
+        paths.extend(found)
+    return paths
+
+def _pick(ds,var):
+    if var is None:
+        names = [name for name,v in ds.data_vars.items() if v.ndim>=2]
+        if len(names)!=1:
+            raise Exception(f"Cannot decide the variable from {list(ds.data_vars)}! (use var=)")
+        var = names[0]
+    return ds[var]
+
+def _open(path,engine):
+    import xarray as xr
+    if engine is None and path.rstrip('/').endswith('.zarr'):
+        engine = 'zarr'
+    # chunks=Noneならdaskを使わずに，isel/selしたところだけを読む遅延配列になる
+    return xr.open_dataset(path,engine=engine,chunks=None)
+
+def iter_sources(source,var=None,engine=None):
+    """
+    source : xr.DataArray, xr.Dataset, ファイル名(globのパターン可, netCDF/zarr) or そのリスト
+    var    : string , 変数名 (Noneならデータ変数が1つのときにそれを使う)
+    engine : string , xr.open_datasetのengine (Noneなら自動, ".zarr"ならzarr)
+    ------------------------------------------------------------
+    ファイルを1つずつ開いて，読み込む前の(遅延した)DataArrayを順に返すジェネレータ。
+    次のファイルに進むときに前のファイルを閉じる。
+    """
+    import xarray as xr
+    if isinstance(source,xr.DataArray):
+        yield source
+        return
+    if isinstance(source,xr.Dataset):
+        yield _pick(source,var)
+        return
+    for path in _source_paths(source):
+        ds = _open(path,engine)
+        try:
+            yield _pick(ds,var)
+        finally:
+            ds.close()
+
+def chunk_length(da,time='time',chunk=None,max_mb=256):
+    """
+    1回に読むtimeの長さ。chunkを指定しなければ，1つのchunkがmax_mb[MB](float64)に収まる長さにする。
+    """
+    if chunk is not None:
+        return max(int(chunk),1)
+    step_bytes = 8*max(int(np.prod([n for d,n in da.sizes.items() if d!=time])),1)
+    return max(int(max_mb*2**20//step_bytes),1)
+
+def _apply_select(da,select):
+    # dictならda.sel(select), 関数ならselect(da)
+    if select is None:
+        return da
+    if isinstance(select,dict):
+        return da.sel(select)
+    return select(da)
+
+def iter_time_chunks(source,var=None,time='time',chunk=None,max_mb=256,engine=None,select=None):
+    """
+    source : iter_sourcesと同じ (DataArray, Dataset, ファイル名, globのパターン, リスト)
+    time   : string , 分割する次元
+    chunk  : int    , 1回に読むtimeの長さ (Noneならmax_mbから決める)
+    max_mb : float  , 1回に読む配列の大きさの上限[MB] (chunk=Noneのとき)
+    select : dict or function , 読む前の各ファイルのDataArrayから選ぶ範囲。dictならda.sel(select) (例: {"level":850})，
+             関数ならDataArrayを受け取り，必要な範囲を切り出して返す (緯度の帯など。読み込む量がここで決まる)
+    ------------------------------------------------------------
+    ファイルを順に開き，timeの方向にchunkずつ読み込んだ(メモリ上の)DataArrayを返すジェネレータ。
+    同時にメモリに載るのは1つのchunkだけなので，全期間を読み込まずに長い記録を処理できます。
+    daskで開いた配列も，chunkごとに計算して返す。
+    """
+    for da in iter_sources(source,var,engine):
+        da = _apply_select(da,select)
+        step = chunk_length(da,time,chunk,max_mb)
+        for i0 in range(0,da.sizes[time],step):
+            yield da.isel({time:slice(i0,i0+step)}).load()
+
+def _band_indexer(coord,vmin,vmax):
+    # vmin<=coord<=vmaxの番号 (連続ならslice。遅延配列の読み込みが1回で済む)
+    coord = np.asarray(coord)
+    index = np.flatnonzero((coord>=vmin)&(coord<=vmax))
+    if len(index)==0:
+        raise Exception(f"No grid point between {vmin} and {vmax}!")
+    if np.all(np.diff(index)==1):
+        return slice(int(index[0]),int(index[-1])+1)
+    return index
+
+def build_hovmuller(source,lat_min,lat_max,var=None,x_min=None,x_max=None,
+                    time='time',lat='lat',lon='lon',select=None,weighted=True,
+                    chunk=None,max_mb=256,engine=None):
+    """
+    source   : xr.DataArray, xr.Dataset, ファイル名(globのパターン可, netCDF/zarr) or そのリスト
+               ("./data/u850_*.nc", ["a.nc","b.nc"], "u.zarr" など。ファイルの順に時間をつなぐ)
+    lat_min, lat_max : float , 平均する緯度の帯
+    var      : string , 変数名 (Noneならデータ変数が1つのときにそれを使う)
+    x_min, x_max : float , 経度の範囲 (Noneなら全ての経度)
+    time, lat, lon : string , 次元の名前
+    select   : dict or function , 読む前に選ぶ範囲 (例: {"level":850}。iter_time_chunksと同じ)
+    weighted : bool , Trueならcos(緯度)の重みを付けて平均する (NaNの格子点は除く)
+    chunk    : int  , 1回に読むtimeの長さ (Noneならmax_mb[MB]に収まる長さ)
+    ------------------------------------------------------------
+    長い記録(複数ファイル・chunkしたnetCDF/zarr)から，時間・経度のホフメラー図の配列 (time, lon) を作る関数。
+    ファイルを1つずつ開き，緯度の帯だけをchunkずつ読んで平均するので，
+    メモリには1つのchunkと結果の(time, lon)の配列しか載りません。
+    結果はそのままホフメラー図の関数に渡せる。
+
+        hov = build_hovmuller("./olr/olr_*.nc",-10,10,var="olr",chunk=365)
+        plot_laghovmuller(ax,hov,-30,30,5,lag='time',lagmin='2000-01-01',lagmax='2000-12-31',
+                          x_min=40,x_max=280)
+    """
+    import xarray as xr
+    def select_band(da):
+        da = _apply_select(da,select)
+        indexers = {lat:_band_indexer(da[lat].values,lat_min,lat_max)}
+        if x_min is not None or x_max is not None:
+            lon_values = da[lon].values
+            indexers[lon] = _band_indexer(lon_values,-np.inf if x_min is None else x_min,
+                                          np.inf if x_max is None else x_max)
+        return da.isel(indexers)
+
+    rows, times, template = [], [], None
+    for part in iter_time_chunks(source,var,time,chunk,max_mb,engine,select_band):
+        extra = set(part.dims)-{time,lat,lon}
+        if extra:
+            raise Exception(f"Dimensions {sorted(extra)} remain! (select them with select=)")
+        data = np.asarray(part.transpose(time,lat,lon).values,dtype=float)
+        w = np.cos(np.deg2rad(part[lat].values.astype(float))) if weighted else np.ones(part.sizes[lat])
+        valid = np.isfinite(data)
+        num = np.einsum('tyx,y->tx',np.where(valid,data,0.),w)
+        den = np.einsum('tyx,y->tx',valid.astype(float),w)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            rows.append(np.where(den>0,num/den,np.nan).astype(part.dtype if part.dtype.kind=='f' else float))
+        times.append(part[time].values)
+        if template is None:
+            template = part
+    if template is None:
+        raise Exception("No data was read!")
+    attrs = dict(template.attrs,lat_band=(float(lat_min),float(lat_max)))
+    return xr.DataArray(np.concatenate(rows),dims=(time,lon),
+                        coords={time:np.concatenate(times),lon:template[lon].values},
+                        name=template.name,attrs=attrs)
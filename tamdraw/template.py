@@ -0,0 +1,148 @@
+import matplotlib.pyplot as plt
+import cartopy.crs as ccrs
+from .hrz import axplot_whitemap
+from .meshes import geo_xy
+#
+class MapTemplate:
+    """
+    ax        : GeoAxes. Noneなら draw_hrz_field と同じFigure/Axesを作る
+    figsize   : tuple , size of the Figure (ax=Noneのとき)
+    dpi       : int   , resolution of the Figure (ax=Noneのとき)
+    central_longitude : float , PlateCarreeの中心経度 (ax=Noneのとき)
+    zdata     : float , データ層のzorder。これより大きいzorderの背景(海岸線・陸地・四角形など)は
+                データ層の上に毎フレーム描き直す
+    kwargs    : axplot_whitemap の引数 (x_min,x_max,y_min,y_max,xtickint,ytickint,grid,
+                rec,xy,width,height,landcol,landfc,zland,zrec,...)
+    ------------------------------------------------------------
+    axplot_whitemapと同じ背景(目盛り・海岸線・陸地・グリッド・四角形)を1回だけ描いてビットマップを保持し，
+    フレームごとにはデータ層(contourf, contour, hatch)とタイトルだけを描いて重ねる(blit)クラス。
+    1フレームの描画時間はデータ層だけで決まります。
+
+        tmpl = MapTemplate(x_min=120,x_max=260,y_min=-20,y_max=70)
+        with AnimationWriter('./sst.gif',duration=200) as writer:
+            for t in range(sst.sizes['time']):
+                tmpl.clear()
+                c = tmpl.contourf(sst[t],levels=np.arange(-2,2.1,0.2))
+                tmpl.hatch(pval[t]<0.05)
+                tmpl.set_title(f"{sst.time.values[t]}")
+                if t==0:
+                    tmpl.colorbar(c,label="SST [K]")
+                writer.append(tmpl.frame())
+    """
+    def __init__(self,ax=None,figsize=(6,4),dpi=150,central_longitude=180,zdata=1,**kwargs):
+        if ax is None:
+            fig = plt.figure(figsize=figsize,dpi=dpi,layout='constrained')
+            ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=central_longitude))
+        self.ax = ax
+        self.fig = ax.figure
+        before = set(ax.get_children())
+        axplot_whitemap(ax,**kwargs)
+        # データ層より上に来る背景は毎フレーム描き直す
+        self.overlay = [artist for artist in ax.get_children()
+                        if artist not in before and artist.get_zorder()>zdata]
+        for artist in self.overlay:
+            artist.set_animated(True)
+        ax.title.set_animated(True)
+        self.layers = []
+        self._background = None
+        self._background_key = None
+
+    def add_layer(self,*artists):
+        """
+        自分で描いたartist(ax.pcolormesh, ax.quiverなど)をデータ層として登録する。
+        """
+        for artist in artists:
+            artist.set_animated(True)
+            self.layers.append(artist)
+        return artists[0] if len(artists)==1 else artists
+
+    def contourf(self,field,levels=9,cmap="RdBu_r",extend='both',spec=None,**kwargs):
+        """
+        field : xr.DataArray , 2-dims ("lat","lon")
+        spec  : LevelSpec , levels/cmap/extendの代わりに使う (全てのフレームで色が揃う)
+        ------------------------------------------------------------
+        塗りつぶしのデータ層を追加する。xarrayのplotを経由しないのでタイトル・軸ラベルは変わりません。
+        """
+        if spec is not None:
+            levels, cmap, extend = spec.levels, spec.cmap, spec.extend
+            kwargs['norm'] = spec.norm
+        x, y, transform = geo_xy(self.ax,field.lon.values,field.lat.values,ccrs.PlateCarree())
+        c = self.ax.contourf(x,y,field,levels=levels,cmap=cmap,
+                             extend=extend,transform=transform,**kwargs)
+        return self.add_layer(c)
+
+    def contour(self,field,levels=9,colors="black",linewidths=1,zorder=6,**kwargs):
+        x, y, transform = geo_xy(self.ax,field.lon.values,field.lat.values,ccrs.PlateCarree())
+        c = self.ax.contour(x,y,field,levels=levels,colors=colors,
+                            linewidths=linewidths,transform=transform,zorder=zorder,**kwargs)
+        return self.add_layer(c)
+
+    def hatch(self,field_hatch,hatches=[".."],ec="black",colors="none",corner_mask=True,zorder=5):
+        """
+        field_hatch : xr.DataArray , 2-dims. ax_addhatch と同じくハッチを付ける範囲
+        """
+        plt.rcParams["hatch.color"]=ec
+        x, y, transform = geo_xy(self.ax,field_hatch.lon.values,field_hatch.lat.values,ccrs.PlateCarree())
+        c = self.ax.contourf(x,y,field_hatch,
+                             hatches=hatches,colors=colors,corner_mask=corner_mask,
+                             transform=transform,zorder=zorder)
+        return self.add_layer(c)
+
+    def set_title(self,title,**kwargs):
+        self.ax.set_title(title,**kwargs)
+
+    def colorbar(self,mappable,label="",orientation="horizontal",shrink=1.1,aspect=40,**kwargs):
+        """
+        カラーバーを付ける。レベルが固定ならカラーバーも背景の一部として扱う(背景は次のframeで取り直す)。
+        """
+        cbar = self.fig.colorbar(mappable,ax=self.ax,label=label,orientation=orientation,
+                                 shrink=shrink,aspect=aspect,**kwargs)
+        self.invalidate()
+        return cbar
+
+    def clear(self):
+        """データ層を全て取り除く。背景はそのまま。"""
+        for artist in self.layers:
+            artist.remove()
+        self.layers = []
+
+    def invalidate(self):
+        """背景を変更したとき(目盛り・カラーバーの追加など)に呼ぶ。次のblitで背景を描き直す。"""
+        self._background = None
+
+    def _draw_layers(self):
+        # 同じzorderなら背景が先 (axplot_whitemapの後にデータを描いたときと同じ順番)
+        for artist in sorted(self.overlay+self.layers,key=lambda a:a.get_zorder()):
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+        if self.ax.title.get_text():
+            self.ax.draw_artist(self.ax.title)
+
+    def blit(self):
+        """
+        保持している背景を復元し，その上にデータ層を描く。
+        Figureのサイズ・解像度が変わったときや初回は背景を描き直して保持する。
+        """
+        canvas = self.fig.canvas
+        key = (tuple(self.fig.bbox.bounds),self.fig.dpi)
+        if self._background is None or key!=self._background_key:
+            canvas.draw() # animatedなartistを除いた背景
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+            self._background_key = key
+        else:
+            canvas.restore_region(self._background)
+        self._draw_layers()
+        canvas.blit(self.fig.bbox)
+
+    def frame(self):
+        """
+        blitした結果をPIL.Imageとして返す(コピーしない)。
+        AnimationWriter.appendにすぐ渡してください。
+        """
+        from .anim import figure_to_image
+        self.blit()
+        return figure_to_image(self.fig,draw=False)
+
+    def savefig(self,fname_save,**kwargs):
+        """blitした結果をそのまま保存する (fig.savefigは描き直すので使わない)。"""
+        self.frame().save(fname_save,**kwargs)
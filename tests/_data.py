@@ -0,0 +1,96 @@
+"""
+テストとベンチマーク(benchmarks/bench_render.pyなど)で共通に使う合成データ。
+numpy・xarrayなどは関数の中でimportするので，ベンチマークの子プロセスでも読み込みの時間に含まれない。
+"""
+import os
+
+def synthetic_field(res,seed=0,scale=1.):
+    """
+    res : float , 格子間隔[deg]
+    ------------------------------------------------------------
+    大規模な波 + 小さなノイズの全球場 (lat,lon) を返す。
+    """
+    import numpy as np
+    import xarray as xr
+    rng = np.random.default_rng(seed)
+    lon = np.arange(0,360,res)
+    lat = np.arange(-90,90+res/2,res)
+    x, y = np.deg2rad(lon)[None,:], np.deg2rad(lat)[:,None]
+    data = np.sin(3*x+seed)*np.cos(2*y)+0.5*np.cos(5*x)*np.sin(3*y)**2
+    data = data+0.1*rng.standard_normal(data.shape)
+    return xr.DataArray(scale*data.astype('float32'),dims=('lat','lon'),
+                        coords={'lat':lat,'lon':lon})
+
+def synthetic_hovmuller(res,seed=0,lagmax=60):
+    """(lag,lon)のホフメラー図用の場 (東進する波 + ノイズ) を返す。"""
+    import numpy as np
+    import xarray as xr
+    rng = np.random.default_rng(seed)
+    lon = np.arange(0,360,res)
+    lag = np.arange(-lagmax,lagmax+1,1.)
+    data = np.sin(np.deg2rad(2*lon[None,:]-4*lag[:,None]))*np.exp(-(lag[:,None]/40)**2)
+    data = data+0.2*rng.standard_normal(data.shape)
+    return xr.DataArray(data,dims=('lag','lon'),coords={'lag':lag,'lon':lon})
+
+def write_natural_earth(data_dir,scales=('110m','50m','10m'),seed=0):
+    """
+    data_dir : string , cartopy.config["data_dir"]に設定するディレクトリ
+    ------------------------------------------------------------
+    ne_{scale}_land / ne_{scale}_coastline の代わりになる，波打った大陸が数個だけのshapefileを作る。
+    細かいscaleほど頂点を多くする。
+    """
+    import numpy as np
+    import shapefile
+    rng = np.random.default_rng(seed)
+    # 中心から見て星形の多角形なので自己交差しない (極・日付変更線にはかからない位置と大きさ)
+    centers = [(-100,45,30),(-60,-15,22),(20,5,28),(90,45,30),(135,-25,18),(0,-75,10),(-40,72,12)]
+    nvert = {'110m':60,'50m':400,'10m':3000}
+    dirname = os.path.join(data_dir,'shapefiles','natural_earth','physical')
+    os.makedirs(dirname,exist_ok=True)
+    for scale in scales:
+        theta = np.linspace(0,2*np.pi,nvert[scale])
+        rings = []
+        for lon0,lat0,r in centers:
+            wave = 1+0.15*np.sin(7*theta+rng.uniform(0,6))+0.05*rng.standard_normal(len(theta))
+            wave[-1] = wave[0]
+            lon = lon0+1.5*r*wave*np.cos(theta)
+            lat = lat0+r*wave*np.sin(theta)
+            rings.append(np.stack([lon,lat],1)[::-1].tolist()) # 外周は時計回り
+        for kind,shape in (('land',shapefile.POLYGON),('coastline',shapefile.POLYLINE)):
+            with shapefile.Writer(os.path.join(dirname,f'ne_{scale}_{kind}'),shapeType=shape) as w:
+                w.field('featurecla','C')
+                for ring in rings:
+                    if shape==shapefile.POLYGON:
+                        w.poly([ring])
+                    else:
+                        w.line([ring])
+                    w.record(kind)
+
+def random_field(nt=60,lat=4,lon=5,level=None,seed=0,nan=0.,phi=0.,offset=0.):
+    """
+    nt       : int , 時刻の数 (2000-01-01からの日ごと)
+    lat, lon : int or array , 格子点の数または座標 (Noneならその次元を作らない)
+    level    : list , 鉛直の座標 (Noneならその次元を作らない)
+    nan      : float , NaNにする点の割合
+    phi      : float , AR(1)の係数 (0なら白色雑音)
+    ------------------------------------------------------------
+    (time,[level],[lat],[lon]) の乱数の場を返す。統計・ストリーミングの関数のテストに使う。
+    """
+    import numpy as np
+    import pandas as pd
+    import xarray as xr
+    rng = np.random.default_rng(seed)
+    coords = {'time':pd.date_range('2000-01-01',periods=nt)}
+    for name,values,default in (('level',level,None),('lat',lat,(-10,10)),('lon',lon,(100,140))):
+        if values is None:
+            continue
+        coords[name] = np.linspace(*default,values) if np.isscalar(values) else np.asarray(values,dtype=float)
+    shape = tuple(len(c) for c in coords.values())
+    noise = rng.standard_normal(shape)
+    data = noise.copy()
+    if phi:
+        for t in range(1,nt):
+            data[t] = phi*data[t-1]+noise[t]
+    if nan:
+        data[rng.random(shape)<nan] = np.nan
+    return xr.DataArray(data+offset,dims=tuple(coords),coords=coords)
@@ -0,0 +1,28 @@
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+
+@pytest.fixture(scope='session',autouse=True)
+def natural_earth(tmp_path_factory):
+    """海岸線・陸地はネットワークに接続せずに，一時ディレクトリに作った簡単なshapefileを使う。"""
+    import cartopy
+    from _data import write_natural_earth
+    data_dir = str(tmp_path_factory.mktemp('cartopy'))
+    write_natural_earth(data_dir,scales=('110m','50m'))
+    saved = dict(cartopy.config)
+    cartopy.config['data_dir'] = data_dir
+    cartopy.config['pre_existing_data_dir'] = ''
+    yield data_dir
+    cartopy.config.update(saved)
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    import matplotlib.pyplot as plt
+    yield
+    plt.close('all')
+
+@pytest.fixture
+def random_field():
+    """(time,lat,lon)などの乱数の場を作る関数 (_data.random_fieldを参照)。"""
+    from _data import random_field
+    return random_field
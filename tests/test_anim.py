@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+def write_frames(tmp_path,nframes=4,size=(40,30)):
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(nframes):
+        path = tmp_path/f'frame_{i:03d}.png'
+        Image.fromarray(rng.integers(0,256,(size[1],size[0],3),dtype=np.uint8)).save(path)
+        paths.append(path)
+    return paths
+
+def read_frames(path):
+    with Image.open(path) as img:
+        return [(np.asarray(f.convert('RGB')),f.info.get('duration')) for f in ImageSequence.Iterator(img)]
+
+def test_create_gif_default_matches_pillow_optimize(tmp_path):
+    from tamdraw import create_gif
+    paths = write_frames(tmp_path)
+    create_gif(str(tmp_path/'frame_*.png'),duration=120,fname_save=str(tmp_path/'anim.gif'))
+    # 以前のcreate_gifと同じ (全フレームを開いてoptimize=Trueで保存)
+    imgs = [Image.open(p) for p in paths]
+    imgs[0].save(tmp_path/'ref.gif',save_all=True,append_images=imgs[1:],optimize=True,duration=120,loop=0)
+    assert (tmp_path/'anim.gif').read_bytes()==(tmp_path/'ref.gif').read_bytes()
+
+def test_create_gif_palette_is_opt_in(tmp_path):
+    from tamdraw import create_gif
+    write_frames(tmp_path)
+    create_gif(str(tmp_path/'frame_*.png'),duration=80,fname_save=str(tmp_path/'anim.gif'),palette='global')
+    frames = read_frames(tmp_path/'anim.gif')
+    assert len(frames)==4 and all(d==80 for _,d in frames)
+    with Image.open(tmp_path/'anim.gif') as img:
+        assert img.palette is not None
+
+def test_create_gif_no_match(tmp_path):
+    from tamdraw import create_gif
+    with pytest.raises(Exception,match='No file matches'):
+        create_gif(str(tmp_path/'none_*.png'))
+
+@pytest.mark.parametrize('direct',[True,False])
+def test_webp_writer(tmp_path,monkeypatch,direct):
+    from tamdraw import anim
+    if direct and not anim._webp_encoder_ok():
+        pytest.skip('WebP encoder of this Pillow is not supported')
+    monkeypatch.setattr(anim,'_webp_encoder_ok',lambda: direct)
+    paths = write_frames(tmp_path)
+    n = anim.write_animation(paths,str(tmp_path/'anim.webp'),duration=[50,60,70,80],lossless=True)
+    frames = read_frames(tmp_path/'anim.webp')
+    assert n==4 and [d for _,d in frames]==[50,60,70,80]
+    with Image.open(paths[2]) as img:
+        np.testing.assert_array_equal(frames[2][0],np.asarray(img.convert('RGB')))
+
+@pytest.mark.parametrize('fname',['anim.gif','anim.webp','anim.png'])
+def test_writer_without_frames_removes_file(tmp_path,fname):
+    from tamdraw import AnimationWriter
+    writer = AnimationWriter(str(tmp_path/fname))
+    with pytest.raises(Exception,match='No frames'):
+        writer.close()
+    assert not (tmp_path/fname).exists()
+
+def test_writer_error_in_with_removes_file(tmp_path):
+    from tamdraw import AnimationWriter
+    paths = write_frames(tmp_path)
+    with pytest.raises(ZeroDivisionError):
+        with AnimationWriter(str(tmp_path/'anim.gif')) as writer:
+            writer.append(paths[0])
+            1/0
+    assert not (tmp_path/'anim.gif').exists()
+
+def palette_frames(colors,size=(48,36)):
+    # パレットの色だけで塗った4フレーム (2つ目と3つ目は同じ，4つ目は右下の隅だけ変える)
+    rng = np.random.default_rng(1)
+    base = colors[rng.integers(0,len(colors),(size[1]//6,size[0]//6))].repeat(6,0).repeat(6,1)
+    second = base.copy()
+    second[10:20,15:30] = colors[3]
+    last = second.copy()
+    last[-3:,-5:] = colors[-1]
+    return [base,second,second.copy(),last]
+
+@pytest.mark.parametrize('palette,delta',[('fixed',True),('fixed',False),('global',True)])
+def test_gif_palette_round_trip(tmp_path,palette,delta):
+    from tamdraw import AnimationWriter,gif_palette
+    colors = gif_palette("RdBu_r",levels=9)
+    frames = palette_frames(colors)
+    with AnimationWriter(str(tmp_path/'anim.gif'),duration=[40,50,60,70],
+                         palette=colors if palette=='fixed' else 'global',delta=delta) as writer:
+        writer.extend(frames)
+    decoded = read_frames(tmp_path/'anim.gif')
+    assert [d for _,d in decoded]==[40,50,60,70]
+    # 差分(透明色・切り出した矩形の位置)を重ねた後の各フレームが元の画像と一致する
+    for (rgb,_),frame in zip(decoded,frames):
+        np.testing.assert_array_equal(rgb,frame)
+
+def test_gif_palette_and_complete_palette():
+    from PIL import Image
+    from tamdraw.anim import gif_palette,_complete_palette
+    pal = gif_palette("RdBu_r",levels=[0,1,2,3],extend='max',colors=("white","black"))
+    assert pal.shape==(2+3+1,3) and pal.dtype==np.uint8
+    np.testing.assert_array_equal(pal[:2],[[255,255,255],[0,0,0]])
+    # 固定色は先頭にそのまま，重複は除き，残りは画像の色で埋めて長さをncolorsにする
+    img = Image.fromarray(np.array([[[10,20,30],[200,100,0]],[[0,0,0],[10,20,30]]],dtype=np.uint8))
+    full = _complete_palette(np.vstack([pal[:2],pal[:1]]),img,8)
+    assert full.shape==(8,3)
+    np.testing.assert_array_equal(full[:2],pal[:2])
+    listed = {tuple(c) for c in full}
+    assert {(10,20,30),(200,100,0)}<=listed
+    np.testing.assert_array_equal(_complete_palette(pal,img,3),pal[:3])
+
+def small_figure(seed):
+    # 色数の少ない小さな図 (GIFの減色でも画素が変わらない)
+    import matplotlib.pyplot as plt
+    fig = plt.figure(figsize=(0.6,0.4),dpi=100)
+    ax = fig.add_axes([0,0,1,1])
+    ax.set_axis_off()
+    data = np.random.default_rng(seed).integers(0,4,(4,6))
+    ax.imshow(data,cmap='viridis',vmin=0,vmax=3,interpolation='nearest',aspect='auto')
+    return fig
+
+def small_figures(buffers,n=3):
+    # 書き出された後のバッファをbuffersに残す
+    for i in range(n):
+        fig = small_figure(i)
+        canvas = fig.canvas   # plt.closeでfig.canvasは入れ替わる
+        yield fig
+        buffers.append(np.array(canvas.buffer_rgba()))
+
+@pytest.mark.parametrize('fname',['anim.gif','anim.png'])
+def test_write_figures_matches_canvas(tmp_path,fname):
+    import matplotlib.pyplot as plt
+    from tamdraw import write_figures
+    buffers = []
+    n = write_figures(small_figures(buffers),str(tmp_path/fname),duration=[30,40,50])
+    assert n==3 and len(buffers)==3 and not plt.get_fignums()
+    frames = read_frames(tmp_path/fname)
+    assert len(frames)==3 and [d for _,d in frames]==[30,40,50]
+    for (rgb,_),buf in zip(frames,buffers):
+        np.testing.assert_array_equal(rgb,buf[...,:3])
+
+def test_apng_frame_count_is_written_back(tmp_path):
+    import struct
+    from PIL import Image
+    from tamdraw import AnimationWriter
+    paths = write_frames(tmp_path,nframes=5)
+    with AnimationWriter(str(tmp_path/'anim.apng'),duration=20,loop=2) as writer:
+        writer.extend(paths)
+    data = (tmp_path/'anim.apng').read_bytes()
+    pos = data.index(b'acTL')
+    assert struct.unpack('>II',data[pos+4:pos+12])==(5,2)
+    with Image.open(tmp_path/'anim.apng') as img:
+        assert img.n_frames==5 and img.info['loop']==2
+    for (rgb,d),path in zip(read_frames(tmp_path/'anim.apng'),paths):
+        with Image.open(path) as ref:
+            np.testing.assert_array_equal(rgb,np.asarray(ref.convert('RGB')))
+        assert d==20
+
+def test_append_figure_and_figure_to_image(tmp_path):
+    import matplotlib.pyplot as plt
+    from tamdraw import AnimationWriter,figure_to_image
+    figs = [small_figure(i) for i in range(2)]
+    canvas = figs[1].canvas
+    img = figure_to_image(figs[0].axes[0])
+    assert img.mode=='RGBA' and img.size==(60,40)
+    np.testing.assert_array_equal(np.asarray(img),np.asarray(figs[0].canvas.buffer_rgba()))
+    with AnimationWriter(str(tmp_path/'anim.png')) as writer:
+        writer.append_figure(figs[0].axes[0])
+        plt.figure(figs[1])
+        writer.append_figure(close=True)
+    assert writer.nframes==2
+    assert plt.fignum_exists(figs[0].number) and not plt.fignum_exists(figs[1].number)
+    frames = read_frames(tmp_path/'anim.png')
+    np.testing.assert_array_equal(frames[1][0],np.asarray(canvas.buffer_rgba())[...,:3])
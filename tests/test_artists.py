@@ -0,0 +1,28 @@
+import numpy as np
+import cartopy.crs as ccrs
+from _data import synthetic_field
+
+def draw_order(ax):
+    # matplotlibと同じく，zorderで安定に並べた順
+    return sorted(ax.get_children(),key=lambda a: a.get_zorder())
+
+def test_handle_update_keeps_draw_order_and_levels():
+    import matplotlib.pyplot as plt
+    from tamdraw import axplot_hrz_field_double_hatch
+    field1, field2 = synthetic_field(5.), synthetic_field(5.,seed=1,scale=4.)
+    fig = plt.figure()
+    ax = fig.add_subplot(projection=ccrs.PlateCarree(central_longitude=180))
+    # ハッチと陸地はどちらもzorder=5 (陸地が上)
+    h = axplot_hrz_field_double_hatch(ax,field1,field2,np.abs(field1)>0.5,None,
+                                      clev_min2=-4,clev_max2=4,clev_int2=1.,add_colorbar=True,handle=True)
+    land = next(a for a in ax.get_children() if a.get_zorder()==5 and a is not h.layers['hatch'][0][0])
+    levels = h.layers['field1'][0][0].levels.copy()
+    before = draw_order(ax).index(h.layers['hatch'][0][0])<draw_order(ax).index(land)
+    new1, new2 = synthetic_field(5.,seed=2), synthetic_field(5.,seed=3,scale=4.)
+    artists = h.update(new1,new2,np.abs(new1)>0.5)
+    hatch = h.layers['hatch'][0][0]
+    assert before and draw_order(ax).index(hatch)<draw_order(ax).index(land)
+    np.testing.assert_allclose(h.layers['field1'][0][0].levels,levels)
+    assert h.colorbar is not None and h.colorbar.mappable is h.layers['field1'][0][0]
+    assert all(a in ax.get_children() or a.axes is ax for a in artists)
+    assert hatch.hatches==['..']
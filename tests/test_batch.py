@@ -0,0 +1,26 @@
+import pandas as pd
+import xarray as xr
+from _data import synthetic_field
+
+def time_field(nt=3):
+    fields = [synthetic_field(10.,seed=i) for i in range(nt)]
+    return xr.concat(fields,dim=pd.Index(pd.date_range('2000-01-01',periods=nt),name='time')).assign_attrs(units='K')
+
+def test_frame_template_rebuilds_slice():
+    from tamdraw.batch import _frame_template,_frame
+    field = time_field()
+    template = _frame_template(field,'time')
+    xr.testing.assert_identical(_frame(template,field.values[1]),field.isel(time=1,drop=True))
+
+def test_batch_output_does_not_depend_on_nworkers(tmp_path):
+    from tamdraw.batch import render_hrz_batch
+    field = time_field()
+    images = []
+    for nworkers in (1,2):
+        fname = str(tmp_path/f'n{nworkers}_{{time:%Y%m%d}}.png')
+        result = render_hrz_batch('draw_hrz_field',field,fname_save=fname,nworkers=nworkers,
+                                  clev_min=-1.5,clev_max=1.5,clev_int=0.25,title="{time:%Y-%m-%d}")
+        assert [r['index'] for r in result]==[0,1,2]
+        images.append([open(r['fname'],'rb').read() for r in result])
+    assert images[0]==images[1]
+    assert (tmp_path/'n2_20000103.png').exists()
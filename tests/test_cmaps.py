@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+@pytest.mark.filterwarnings('ignore::PendingDeprecationWarning')  # set_bad
+def test_cmaps_ipcc_returns_independent_copies():
+    from tamdraw import cmaps_ipcc
+    first = cmaps_ipcc('temp_div')
+    first.set_bad('magenta')
+    second = cmaps_ipcc('temp_div')
+    assert first is not second
+    assert second(np.nan)!=first(np.nan)
+
+def test_get_ipcc_cmap_same_colors_and_reverse():
+    from tamdraw import get_ipcc_cmap
+    cmap, rev = get_ipcc_cmap('temp_div'), get_ipcc_cmap('temp_div_r')
+    assert cmap is not get_ipcc_cmap('temp_div')
+    np.testing.assert_allclose(cmap(np.linspace(0,1,11)),get_ipcc_cmap('temp_div')(np.linspace(0,1,11)))
+    np.testing.assert_allclose(rev(0.),cmap(1.))
+    assert rev.name=='ipcc_temp_div_r'
+
+def test_registered_names():
+    import matplotlib as mpl
+    from tamdraw import register_ipcc_cmaps,ipcc_cmap_names
+    register_ipcc_cmaps()
+    name = ipcc_cmap_names()[0]
+    assert f'ipcc_{name}' in mpl.colormaps and f'ipcc_{name}_r' in mpl.colormaps
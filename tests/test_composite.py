@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from scipy import stats
+
+def test_welch_t_matches_scipy(random_field):
+    from tamdraw.composite import build_composite
+    field = random_field(120,nan=0.05)
+    events = np.random.default_rng(1).choice(field.sizes['time'],25,replace=False)
+    field1, _, tval, tc_val = build_composite(field,field['time'].values[events],chunk=17)
+    mask = np.isin(np.arange(field.sizes['time']),events)
+    data = field.values
+    ref = stats.ttest_ind(data[mask],data[~mask],axis=0,equal_var=False,nan_policy='omit')
+    np.testing.assert_allclose(tval.values,np.asarray(ref.statistic),rtol=1e-10)
+    np.testing.assert_allclose(tc_val.values,stats.t.ppf(0.975,np.asarray(ref.df)),rtol=1e-8)
+    np.testing.assert_allclose(field1.values,np.nanmean(data[mask],0)-np.nanmean(data[~mask],0),atol=1e-12)
+
+def test_reference_all_is_one_sample_t(random_field):
+    from tamdraw.composite import build_composite
+    field = random_field(120)
+    events = np.arange(10,110,4)
+    field1, _, tval, tc_val = build_composite(field,events,reference='all',chunk=30)
+    data = field.values
+    clim = data.mean(axis=0)
+    ref = stats.ttest_1samp(data[events],clim,axis=0)
+    np.testing.assert_allclose(tval.values,ref.statistic,rtol=1e-10)
+    np.testing.assert_allclose(field1.values,data[events].mean(0)-clim,atol=1e-12)
+    np.testing.assert_allclose(tc_val.values,stats.t.ppf(0.975,len(events)-1))
+
+def test_duplicate_events_raise_in_composite_and_resample(random_field):
+    from tamdraw.composite import build_composite
+    from tamdraw.resample import composite_pvalue
+    field = random_field(120)
+    for events in ([3,5,5,9],field['time'].values[[3,5,5,9]]):
+        with pytest.raises(Exception,match='Duplicate'):
+            build_composite(field,events)
+        with pytest.raises(Exception,match='Duplicate'):
+            composite_pvalue(field,events,nresample=10)
+
+def test_select_accepts_dict_and_function(random_field):
+    from tamdraw.composite import build_composite
+    field = xr.concat([random_field(120,seed=s,nan=0.05) for s in (0,1)],dim=pd.Index([850,500],name='level'))
+    events = np.arange(0,120,7)
+    by_dict = build_composite(field,events,select={'level':850})[0]
+    by_func = build_composite(field,events,select=lambda da: da.sel(level=850))[0]
+    direct = build_composite(field.sel(level=850),events)[0]
+    xr.testing.assert_allclose(by_dict,direct)
+    xr.testing.assert_allclose(by_func,direct)
+
+@pytest.mark.parametrize('nmask',[40,72])
+def test_bool_events_length_is_checked(nmask,random_field):
+    from tamdraw.composite import build_composite
+    from tamdraw.resample import composite_pvalue
+    field = random_field(60,nan=0.05)
+    events = np.zeros(nmask,dtype=bool)
+    events[::5] = True
+    # resample.event_indexと同じメッセージ (短いときは読み終わる前に，長いときは読み終わってから)
+    for chunk in (None,25):
+        with pytest.raises(Exception,match="Length of the bool events"):
+            build_composite(field,events,chunk=chunk)
+    with pytest.raises(Exception,match="Length of the bool events"):
+        composite_pvalue(field,events,nresample=10)
@@ -0,0 +1,18 @@
+import cartopy.crs as ccrs
+
+def test_path_cache_is_bounded_lru(monkeypatch):
+    from tamdraw import features
+    features.clear_feature_cache()
+    monkeypatch.setattr(features,'_path_cache_max',3)
+    proj = ccrs.PlateCarree(central_longitude=180)
+    first = features.cached_feature_paths('land',proj,(-60,60,-30,30),scale='110m')
+    for i in range(1,4):
+        features.cached_feature_paths('land',proj,(-60+i,60,-30,30),scale='110m')
+        # 最初の範囲を使い続ければ残る
+        assert features.cached_feature_paths('land',proj,(-60,60,-30,30),scale='110m') is first
+    assert len(features._path_cache)==3
+    features.cached_feature_paths('land',proj,(-50,50,-20,20),scale='110m')
+    features.cached_feature_paths('land',proj,(-40,40,-20,20),scale='110m')
+    features.cached_feature_paths('land',proj,(-30,30,-20,20),scale='110m')
+    assert features.cached_feature_paths('land',proj,(-60,60,-30,30),scale='110m') is not first
+    assert len(features._path_cache)==3
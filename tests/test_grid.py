@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+import xarray as xr
+from _data import synthetic_field
+
+def test_subset_is_view_with_halo():
+    from tamdraw.grid import subset_to_extent
+    field = synthetic_field(2.5)
+    sub = subset_to_extent(field,120,260,-20,70,halo=2)
+    assert float(sub.lon[0])==115 and float(sub.lon[-1])==265
+    assert float(sub.lat[0])==-25 and float(sub.lat[-1])==75
+    assert np.shares_memory(sub.values,field.values)
+
+def test_subset_across_greenwich_is_monotonic():
+    from tamdraw.grid import subset_to_extent
+    field = synthetic_field(2.5)
+    sub = subset_to_extent(field,-30,40,-20,20,halo=1)
+    lon = sub.lon.values
+    assert np.all(np.diff(lon)>0) and lon[0]==327.5 and lon[-1]==402.5
+    np.testing.assert_array_equal(sub.sel(lon=362.5).values,field.sel(lon=2.5,lat=sub.lat).values)
+
+def test_subset_keeps_full_extent():
+    from tamdraw.grid import subset_to_extent
+    field = synthetic_field(2.5)
+    assert subset_to_extent(field,0,360,-90,90) is field
+
+@pytest.mark.parametrize('center',[None,0])
+def test_resolve_levels_matches_xarray(center):
+    import matplotlib.pyplot as plt
+    from tamdraw.grid import resolve_levels
+    field = synthetic_field(5.)+0.3
+    fig, ax = plt.subplots()
+    kwargs = {} if center is None else {'center':center}
+    c = field.plot.contourf(ax=ax,levels=9,add_colorbar=False,**kwargs)
+    np.testing.assert_allclose(resolve_levels(field,9,center=center),c.levels)
+    assert resolve_levels(field,[1,2]) == [1,2]
+
+def test_coarsen_mean_matches_xarray():
+    from tamdraw.grid import coarsen_field
+    field = synthetic_field(2.5).isel(lat=slice(0,72))
+    field[3,5] = np.nan
+    out = coarsen_field(field,fx=4,fy=3,min_valid=0.)
+    ref = field.astype(float).coarsen(lon=4,lat=3).mean()
+    np.testing.assert_allclose(out.values,ref.values,rtol=1e-6)
+    np.testing.assert_allclose(out.lon.values,ref.lon.values)
+    assert out.dtype==field.dtype
+
+def test_coarsen_stride_and_min_valid():
+    from tamdraw.grid import coarsen_field
+    field = xr.DataArray(np.arange(16.).reshape(4,4),dims=('lat','lon'),
+                         coords={'lat':np.arange(4.),'lon':np.arange(4.)})
+    assert np.shares_memory(coarsen_field(field,2,2,method='stride').values,field.values)
+    field[0,0] = field[0,1] = field[1,0] = np.nan
+    out = coarsen_field(field,2,2,min_valid=0.5)
+    assert np.isnan(out.values[0,0]) and out.values[1,1]==np.mean([10,11,14,15])
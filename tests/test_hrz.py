@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from matplotlib.contour import ContourSet
+from _data import synthetic_field
+
+def filled_levels(fig):
+    ax = fig.axes[0]
+    return next(c for c in ax.collections if isinstance(c,ContourSet) and c.filled).levels
+
+@pytest.mark.parametrize('coarsen',[False,2])
+def test_auto_levels_do_not_depend_on_subset(coarsen):
+    import matplotlib.pyplot as plt
+    from tamdraw import draw_hrz_field
+    # 描画範囲の外側に大きな値を置く (切り出した場からレベルを決めると範囲が狭くなる)
+    field = synthetic_field(2.5)
+    field = field.where(field['lon']<300,3.)
+    levels = []
+    for subset in (False,True):
+        draw_hrz_field(field,x_min=120,x_max=260,y_min=-20,y_max=70,subset=subset,coarsen=coarsen)
+        levels.append(filled_levels(plt.gcf()))
+    np.testing.assert_allclose(levels[0],levels[1])
+    assert levels[0].max()>=3.
+
+def test_double_fill_levels_do_not_depend_on_subset():
+    import matplotlib.pyplot as plt
+    from tamdraw import draw_hrz_field_double
+    field1, field2 = synthetic_field(2.5), synthetic_field(2.5,seed=1,scale=4.)
+    field1 = field1.where(field1['lon']<300,3.)
+    levels = []
+    for subset in (False,True):
+        draw_hrz_field_double(field1,field2,subset=subset,clev_min2=-4,clev_max2=4,clev_int2=1.)
+        levels.append(filled_levels(plt.gcf()))
+    np.testing.assert_allclose(levels[0],levels[1])
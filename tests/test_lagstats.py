@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+def lagged_fields(random_field,nt=120,nlon=7):
+    # 赤色雑音のindexと，lon方向にkステップ遅れてindexに追従する場
+    index = random_field(nt,lat=None,lon=None,phi=0.8)
+    field = random_field(nt,lat=None,lon=np.arange(nlon)*10.,seed=1)
+    for k in range(nlon):
+        field[:,k] += np.roll(index.values,k)*(k+1)
+    field.attrs['units'] = 'm/s'
+    index[[5,nt//3]] = np.nan
+    field[10:14,2] = np.nan
+    field[:,5] = np.nan   # 全てNaNの格子点
+    return index, field
+
+def brute_force(x,y,lags,min_count=3):
+    # ラグごとに両方が有効な組だけでループして計算する
+    corr, regr, count = (np.full((len(lags),y.shape[1]),np.nan) for _ in range(3))
+    nt = len(x)
+    for i,k in enumerate(lags):
+        a = x[max(0,-k):nt-max(0,k)]
+        for j in range(y.shape[1]):
+            b = y[max(0,k):nt+min(0,k),j]
+            ok = np.isfinite(a)&np.isfinite(b)
+            count[i,j] = ok.sum()
+            if ok.sum()<min_count:
+                continue
+            da, db = a[ok]-a[ok].mean(), b[ok]-b[ok].mean()
+            regr[i,j] = (da*db).sum()/(da*da).sum()
+            corr[i,j] = (da*db).sum()/np.sqrt((da*da).sum()*(db*db).sum())
+    return corr, regr, count
+
+@pytest.mark.parametrize('chunk',[None,2])
+def test_lag_regression_matches_brute_force(chunk,random_field):
+    from tamdraw.lagstats import lag_regression
+    index, field = lagged_fields(random_field)
+    ds = lag_regression(index,field,-10,15,chunk=chunk)
+    lags = np.arange(-10,16)
+    corr, regr, count = brute_force(index.values,field.values,lags)
+    np.testing.assert_array_equal(ds['lag'].values,lags)
+    assert ds['corr'].dims==('lag','lon')
+    np.testing.assert_array_equal(ds['nsample'].values,count)
+    np.testing.assert_allclose(ds['corr'].values,corr,atol=1e-10)
+    np.testing.assert_allclose(ds['regr'].values,regr,atol=1e-10)
+    assert ds['regr'].attrs['units']=='m/s'
+
+def test_lag_regression_aligns_time(random_field):
+    from tamdraw.lagstats import lag_regression
+    index, field = lagged_fields(random_field)
+    # indexの時刻が一部だけ重なるときは共通の時刻で計算する
+    ds = lag_regression(index.isel(time=slice(20,None)),field,-5,5)
+    ref = lag_regression(index.values[20:],field.isel(time=slice(20,None)),-5,5)
+    xr.testing.assert_allclose(ds,ref)
+
+def test_lag_correlation_and_errors(random_field):
+    from tamdraw.lagstats import lag_correlation,lag_regression
+    index, field = lagged_fields(random_field,nt=30)
+    corr = lag_correlation(index,field,-3,3)
+    xr.testing.assert_equal(corr,lag_regression(index,field,-3,3)['corr'])
+    with pytest.raises(Exception,match='longer than the record'):
+        lag_regression(index,field,-30,3)
+    with pytest.raises(Exception,match='Length of index'):
+        lag_regression(index.values[1:],field)
+    with pytest.raises(Exception,match='xr.DataArray'):
+        lag_regression(index,field.values)
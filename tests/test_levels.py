@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from _data import synthetic_field
+
+def test_color_levels_branches():
+    from tamdraw.levels import color_levels
+    clevels, cticks = color_levels(-1,1,0.5)
+    np.testing.assert_allclose(clevels,[-1,-0.5,0,0.5,1])
+    assert cticks is None
+    clevels, cticks = color_levels(-1,1)
+    assert len(clevels)==12 and cticks==list(clevels[:6:2])+list(clevels[7::2])
+    assert color_levels()==(9,None)
+    with pytest.raises(Exception,match='not correct'):
+        color_levels(-1,None,0.5)
+
+def test_level_spec_matches_xarray_levels():
+    import matplotlib.pyplot as plt
+    from tamdraw.levels import LevelSpec
+    field = synthetic_field(5.)
+    spec = LevelSpec(field=field)
+    fig, ax = plt.subplots()
+    c = field.plot.contourf(ax=ax,levels=9,center=0,extend='both',add_colorbar=False)
+    np.testing.assert_allclose(spec.levels,c.levels)
+    # xarrayのcontourfと同じ色 (両端を伸ばした色を含む)
+    assert spec.cmap.N==c.cmap.N==len(spec.levels)-1
+    np.testing.assert_allclose(spec.cmap(np.arange(spec.cmap.N)),c.cmap(np.arange(c.cmap.N)))
+    np.testing.assert_allclose([spec.cmap(-np.inf),spec.cmap(np.inf)],[c.cmap(-np.inf),c.cmap(np.inf)])
+
+def test_spec_overrides_clev_in_draw():
+    import matplotlib.pyplot as plt
+    from matplotlib.contour import ContourSet
+    from tamdraw import draw_hrz_field
+    from tamdraw.levels import LevelSpec
+    spec = LevelSpec(-2,2,0.5)
+    draw_hrz_field(synthetic_field(5.),clev_min=-1,clev_max=1,clev_int=0.1,spec=spec)
+    c = next(a for a in plt.gcf().axes[0].collections if isinstance(a,ContourSet))
+    np.testing.assert_allclose(c.levels,spec.levels)
+
+@pytest.mark.parametrize('kwargs',[{},dict(clev_min=-1,clev_max=1,clev_int=0.5),
+                                   dict(spec='spec',clev_min=-1,clev_max=1,clev_int=0.1)])
+def test_axplot_contour_levels(kwargs):
+    import cartopy.crs as ccrs
+    import matplotlib.pyplot as plt
+    from matplotlib.contour import ContourSet
+    from tamdraw import axplot_hrz_field_contour
+    from tamdraw.grid import resolve_levels
+    from tamdraw.levels import LevelSpec
+    field = synthetic_field(5.)
+    spec = LevelSpec(levels=[-2,-1,0,0.5,1])
+    if kwargs.get('spec'):
+        kwargs = dict(kwargs,spec=spec)
+    ax = plt.figure().add_subplot(projection=ccrs.PlateCarree(central_longitude=180))
+    axplot_hrz_field_contour(ax,field,sub_contour=True,**kwargs)
+    main, sub = [c for c in ax.collections if isinstance(c,ContourSet)]
+    if 'spec' in kwargs:
+        ref = spec.levels
+    elif kwargs:
+        ref = [-1,-0.5,0,0.5,1]
+    else:
+        ref = resolve_levels(field,9)
+    np.testing.assert_allclose(main.levels,ref)
+    # 副コンターはレベルの間を5等分する
+    np.testing.assert_allclose(sub.levels[::5],ref)
+    assert len(sub.levels)==(len(ref)-1)*5+1
@@ -0,0 +1,25 @@
+import numpy as np
+import cartopy.crs as ccrs
+
+def test_coord_key_distinguishes_values():
+    from tamdraw.meshes import _coord_key
+    x = np.arange(0,360,2.5)
+    assert _coord_key(x)==_coord_key(list(x))
+    assert _coord_key(x)!=_coord_key(x+1e-9)
+    assert _coord_key(x)!=_coord_key(x[:-1])
+
+def test_projected_mesh_matches_transform_points_and_is_cached():
+    from tamdraw.meshes import projected_mesh,clear_mesh_cache,mesh_cache_info
+    clear_mesh_cache()
+    lon, lat = np.arange(0,360,10.), np.arange(-60,61,10.)
+    proj = ccrs.Robinson(central_longitude=180)
+    X, Y = projected_mesh(lon,lat,proj)
+    ref = proj.transform_points(ccrs.PlateCarree(),*np.meshgrid(lon,lat))
+    np.testing.assert_allclose(X,ref[...,0])
+    np.testing.assert_allclose(Y,ref[...,1])
+    assert projected_mesh(lon,lat,proj)[0] is X
+    # 座標が少しでも違えば別の格子として投影し直す
+    other = projected_mesh(lon,lat+0.5,proj)
+    assert not np.allclose(other[1],Y)
+    info = mesh_cache_info()
+    assert info['hits']==1 and info['misses']==2
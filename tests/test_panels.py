@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+import xarray as xr
+from matplotlib.contour import ContourSet
+from _data import synthetic_field
+
+def seasonal_fields():
+    fields = [synthetic_field(2.5,seed=i,scale=i+1.) for i in range(3)]
+    return xr.concat(fields,'season').assign_coords(season=['DJF','MAM','JJA'])
+
+def test_panel_grid_shares_levels_and_colorbar(tmp_path):
+    from tamdraw import draw_hrz_panel_grid,LevelSpec
+    field = seasonal_fields()
+    fig, axes = draw_hrz_panel_grid(field,field_hatch=abs(field)>2.,ncols=2,
+                                    savefig=True,fname_save=str(tmp_path/'panels.pdf'))
+    assert axes.shape==(2,2) and not axes[1,1].get_visible()
+    # 全パネルのデータから決めた1つのレベル
+    ref = LevelSpec(None,None,None,field=field).levels
+    for ax in axes.ravel()[:3]:
+        fill = next(c for c in ax.collections if isinstance(c,ContourSet) and c.filled)
+        np.testing.assert_allclose(fill.levels,ref)
+    assert [ax.get_title() for ax in axes.ravel()[:3]]==['DJF','MAM','JJA']
+    # カラーバーは図に1つだけ
+    assert len(fig.axes)==5
+    assert (tmp_path/'panels.pdf').stat().st_size>0
+
+def test_panel_grid_titles_and_dims():
+    from tamdraw import draw_hrz_panel_grid
+    field = seasonal_fields()
+    fig, axes = draw_hrz_panel_grid(field,field,titles="({index}) {season}",
+                                    clev_min=-2,clev_max=2,clev_int=0.5,clev_min2=-2,clev_max2=2,clev_int2=1.)
+    assert axes.shape==(2,2) and axes[0,1].get_title()=='(1) MAM'
+    with pytest.raises(Exception,match='Number of titles'):
+        draw_hrz_panel_grid(field,titles=['a','b'])
+    with pytest.raises(Exception,match='panel dimension'):
+        draw_hrz_panel_grid(field.expand_dims(level=[850]))
@@ -0,0 +1,51 @@
+import numpy as np
+import xarray as xr
+
+def polar_axes():
+    import cartopy.crs as ccrs
+    import matplotlib.pyplot as plt
+    ax = plt.figure(figsize=(3,3)).add_subplot(projection=ccrs.NorthPolarStereo())
+    ax.set_extent([-180,180,30,90],ccrs.PlateCarree())
+    return ax
+
+def smooth_field():
+    lat, lon = np.arange(-90,90.1,2.5), np.arange(0,360,2.5)
+    values = np.cos(np.deg2rad(lat))[:,None]*np.sin(np.deg2rad(lon))[None,:]+lat[:,None]/90
+    return xr.DataArray(values,dims=('lat','lon'),coords={'lat':lat,'lon':lon},name='z')
+
+def test_regrid_matches_scipy_interpolator():
+    import cartopy.crs as ccrs
+    from scipy.interpolate import RegularGridInterpolator
+    from tamdraw.polar import regrid_to_projection,clear_regrid_cache
+    clear_regrid_cache()
+    ax = polar_axes()
+    field = smooth_field()
+    out = regrid_to_projection(field,ax,npix=40)
+    assert out.dims==('y','x') and out.shape==(40,40)
+    X, Y = np.meshgrid(out['x'].values,out['y'].values)
+    pts = ccrs.PlateCarree().transform_points(ax.projection,X,Y)
+    # 全球の経度なので360度の列を足して内挿する
+    cyclic = xr.concat([field,field.isel(lon=[0]).assign_coords(lon=[360.])],'lon')
+    interp = RegularGridInterpolator((cyclic['lat'].values,cyclic['lon'].values),cyclic.values)
+    ref = interp(np.stack([pts[...,1],np.mod(pts[...,0],360)],-1))
+    np.testing.assert_allclose(out.values,ref,atol=1e-10)
+
+def test_regrid_reuses_weights_and_masks():
+    import cartopy.crs as ccrs
+    from tamdraw.polar import regrid_fields,_weight_cache,clear_regrid_cache
+    clear_regrid_cache()
+    ax = polar_axes()
+    field = smooth_field()
+    # 南緯側の降順の緯度・NaNを含む配列とboolのマスク
+    field_nan = field.where(field['lat']<80).isel(lat=slice(None,None,-1))
+    out, mask, tc = regrid_fields(ax,field_nan,field>0.5,2.0,npix=30)
+    assert len(_weight_cache)==1 and tc==2.0
+    assert mask.dtype==bool
+    assert np.isnan(out.values).any() and np.isfinite(out.values).any()
+    ref = regrid_fields(ax,field,npix=30)[0]
+    # NaNの境界から離れた(周りの格子点が全て有効な)点は元の配列と同じ
+    X, Y = np.meshgrid(out['x'].values,out['y'].values)
+    qlat = ccrs.PlateCarree().transform_points(ax.projection,X,Y)[...,1]
+    ok = qlat<77.5
+    assert np.isfinite(out.values[ok]).all() and np.isnan(out.values[qlat>78.75]).all()
+    np.testing.assert_allclose(out.values[ok],ref.values[ok],atol=1e-10)
@@ -0,0 +1,44 @@
+import io
+import json
+import time
+
+def test_profile_records_nested_stages(tmp_path):
+    from tamdraw import profile,profiled,stage
+    @profiled
+    def inner():
+        stage("work")
+        time.sleep(0.01)
+    @profiled
+    def outer():
+        stage("a")
+        time.sleep(0.01)
+        stage("b")
+        inner()
+        stage("a")
+        time.sleep(0.01)
+    outer()   # 計測していないときは記録しない
+    with profile() as p:
+        outer()
+        outer()
+    outer()
+    assert [r['func'] for r in p.records]==['inner','outer','inner','outer']
+    summary = p.summary()
+    assert summary['outer']['calls']==2 and summary['inner']['calls']==2
+    stages = summary['outer']['stages']
+    # 同じ段階は足し合わせ，入れ子の呼び出しは呼んだ段階(b)に入る
+    assert stages['a']['mean']>=0.02 and stages['b']['mean']>=0.01
+    assert abs(sum(st['share'] for st in stages.values())-1)<1e-9
+    assert list(p.stage_totals())[0]=='a'
+    data = json.loads(p.to_json(str(tmp_path/'profile.json')))
+    assert data==json.loads((tmp_path/'profile.json').read_text())
+    out = io.StringIO()
+    p.report(file=out)
+    assert 'outer: 2 calls' in out.getvalue()
+
+def test_profile_draw_stages():
+    from _data import synthetic_field
+    from tamdraw import profile,draw_hrz_field
+    with profile() as p:
+        draw_hrz_field(synthetic_field(2.5))
+    stages = p.summary()['draw_hrz_field']['stages']
+    assert {'levels','contourf'}<=set(stages)
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import numpy as np
+from PIL import Image
+from _data import synthetic_field
+
+def test_raster_dpi_only_for_vector_formats():
+    from tamdraw.raster import _savefig_dpi
+    assert _savefig_dpi('a.pdf',300)==300 and _savefig_dpi('a.SVG',300)==300
+    assert _savefig_dpi('a.png',300)=='figure' and _savefig_dpi('a.pdf',None)=='figure'
+
+def test_draw_png_resolution_ignores_raster_dpi(tmp_path):
+    import matplotlib.pyplot as plt
+    from tamdraw import draw_hrz_field
+    field = synthetic_field(5.)
+    sizes = []
+    for raster_dpi in (None,300):
+        fname = str(tmp_path/f'map_{raster_dpi}.png')
+        draw_hrz_field(field,clev_min=-1,clev_max=1,clev_int=0.25,rasterize=True,raster_dpi=raster_dpi,
+                       savefig=True,fname_save=fname)
+        plt.close('all')
+        with Image.open(fname) as img:
+            sizes.append(img.size)
+    assert sizes[0]==sizes[1]
+
+def test_hovmuller_import_does_not_load_cartopy_crs():
+    code = "import sys, tamdraw.hovmuller; print('cartopy.crs' in sys.modules)"
+    out = subprocess.run([sys.executable,'-c',code],capture_output=True,text=True,check=True).stdout
+    assert out.strip()=='False'
+
+def test_platecarree_grid_reorders_to_map_x():
+    import cartopy.crs as ccrs
+    from tamdraw.raster import platecarree_grid
+    field = synthetic_field(5.)
+    grid = platecarree_grid(field,ccrs.PlateCarree(central_longitude=180))
+    x = grid.lon.values
+    assert x[0]==-180 and np.all(np.diff(x)==5)
+    # x=-180は経度0, x=0は経度180
+    np.testing.assert_array_equal(grid.sel(lon=0).values,field.sel(lon=180).values)
+    np.testing.assert_array_equal(grid.sel(lon=-180).values,field.sel(lon=0).values)
+    assert platecarree_grid(field,ccrs.Robinson()) is None
+    assert platecarree_grid(field.isel(lat=[0,1,5]),ccrs.PlateCarree()) is None
+
+def test_raster_mode_uses_contour_levels_and_updates():
+    import matplotlib.pyplot as plt
+    from matplotlib.contour import ContourSet
+    from matplotlib.image import AxesImage
+    from tamdraw import draw_hrz_field
+    from tamdraw.raster import update_raster
+    field = synthetic_field(2.5)
+    draw_hrz_field(field,clev_min=-1,clev_max=1,clev_int=0.25)
+    levels = next(a for a in plt.gcf().axes[0].collections if isinstance(a,ContourSet)).levels
+    plt.close('all')
+    draw_hrz_field(field,clev_min=-1,clev_max=1,clev_int=0.25,mode="raster",subset=False)
+    image = next(a for a in plt.gcf().axes[0].get_children() if isinstance(a,AxesImage))
+    np.testing.assert_allclose(image.norm.boundaries,levels)
+    new = synthetic_field(2.5,seed=5)
+    update_raster(image,new)
+    np.testing.assert_array_equal(np.sort(np.ravel(image.get_array())),np.sort(np.ravel(new.values)))
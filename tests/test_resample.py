@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+def add_events(field):
+    # 6日ごとの事例で最初の緯度だけ大きくし，NaNを入れる
+    events = np.zeros(field.sizes['time'],dtype=bool)
+    events[::6] = True
+    field = field.copy()
+    field[events,0,:] += 3.
+    field[7,1,1] = np.nan
+    field[:,3,4] = np.nan      # 全てNaNの格子点
+    return field, events
+
+def test_event_index_inputs(random_field):
+    from tamdraw.resample import event_index
+    field, events = add_events(random_field())
+    index = np.flatnonzero(events)
+    np.testing.assert_array_equal(event_index(field,events),index)
+    np.testing.assert_array_equal(event_index(field,index),index)
+    np.testing.assert_array_equal(event_index(field,field['time'].values[index]),index)
+    np.testing.assert_array_equal(event_index(field,[-1]),[59])
+    with pytest.raises(Exception,match='not found'):
+        event_index(field,np.array(['1999-01-01'],dtype='datetime64[ns]'))
+    with pytest.raises(Exception,match='Length of the bool'):
+        event_index(field,events[1:])
+    with pytest.raises(Exception,match='out of range'):
+        event_index(field,[60])
+    with pytest.raises(Exception,match='Duplicate'):
+        event_index(field,[3,3])
+
+@pytest.mark.parametrize('method',['permutation','bootstrap'])
+def test_composite_pvalue_nworkers(method,random_field):
+    from tamdraw.resample import composite_pvalue
+    field, events = add_events(random_field())
+    kwargs = dict(nresample=300,method=method,batch=64,seed=3)
+    p1 = composite_pvalue(field,events,nworkers=1,**kwargs)
+    p2 = composite_pvalue(field,events,nworkers=2,**kwargs)
+    xr.testing.assert_identical(p1,p2)
+    assert p1.dims==('lat','lon') and np.isnan(p1[3,4])
+    values = p1.values[np.isfinite(p1.values)]
+    assert values.min()>=0 and values.max()<=1
+    # permutationは(count+1)/(nresample+1)なので0にならない
+    assert method=='bootstrap' or values.min()>0
+    # 事例で大きくした所は有意
+    assert (p1[0]<0.05).all()
+    mask = composite_pvalue(field,events,mask=True,**kwargs)
+    xr.testing.assert_equal(mask,p1<0.05)
+
+@pytest.mark.parametrize('method',['permutation','bootstrap'])
+def test_correlation_pvalue_nworkers(method,random_field):
+    from tamdraw.resample import correlation_pvalue
+    field, events = add_events(random_field())
+    index = xr.DataArray(events.astype(float),dims='time',coords={'time':field['time']})
+    kwargs = dict(nresample=300,method=method,batch=64,seed=5)
+    p1 = correlation_pvalue(index,field,nworkers=1,**kwargs)
+    p2 = correlation_pvalue(index,field,nworkers=2,**kwargs)
+    xr.testing.assert_identical(p1,p2)
+    assert np.isnan(p1[3,4]) and (p1[0]<0.05).all()
+    # 同じseed・batchなら別のseedとは違う標本になる
+    p3 = correlation_pvalue(index,field,nworkers=1,**dict(kwargs,seed=6))
+    assert not np.array_equal(p1.values[:3],p3.values[:3])
+
+def test_resample_method_error(random_field):
+    from tamdraw.resample import composite_pvalue
+    field, events = add_events(random_field())
+    with pytest.raises(Exception,match='method must be'):
+        composite_pvalue(field,events,method='jackknife')
+
+@pytest.mark.parametrize('method',['permutation','bootstrap'])
+def test_composite_pvalue_sparse_events(method,random_field):
+    from tamdraw.resample import composite_pvalue
+    field, events = add_events(random_field())
+    index = np.flatnonzero(events)
+    # (1,0): 事例が1つだけ有効 , (2,0): 事例の3つだけ有効 (-1,1,1)
+    field[index[1:],1,0] = np.nan
+    field[index,2,0] = np.nan
+    field[index[:3],2,0] = [-1.,1.,1.]
+    p = composite_pvalue(field,events,nresample=4000,method=method,batch=500,seed=1)
+    assert np.isnan(p[1,0]) and np.isfinite(p[2,0])
+    if method=='bootstrap':
+        # 有効な標本だけを分母にした参照 (事例を重複ありで選び，全てNaNの標本は除く)
+        rng = np.random.default_rng(7)
+        data = field.values[index,2,0]
+        draws = data[rng.integers(0,len(index),(20000,len(index)))]
+        ok = np.isfinite(draws).any(axis=1)
+        means = np.nanmean(draws[ok],axis=1)
+        ref = min(2*min((means<=0).mean(),(means>=0).mean()),1.)
+        assert abs(float(p[2,0])-ref)<0.03
@@ -0,0 +1,86 @@
+import numpy as np
+import xarray as xr
+from scipy import stats
+
+def test_t_critical_matches_scipy():
+    from tamdraw.signif import t_critical
+    assert np.isclose(t_critical(20),stats.t.ppf(0.975,20))
+    assert np.isclose(t_critical(20,alpha=0.9,two_sided=False),stats.t.ppf(0.9,20))
+    dof = xr.DataArray([[5.,10.],[5.,-1.]],dims=('lat','lon'))
+    crit = t_critical(dof)
+    assert isinstance(crit,xr.DataArray) and crit.dims==dof.dims
+    np.testing.assert_allclose(crit.values[:,0],stats.t.ppf(0.975,5))
+    assert np.isnan(crit.values[1,1])
+
+def test_significance_mask():
+    from tamdraw.signif import significance_mask
+    tval = xr.DataArray([-3.,-1.,0.5,2.5])
+    np.testing.assert_array_equal(significance_mask(tval,2.),[True,False,False,True])
+    np.testing.assert_array_equal(significance_mask(tval,dof=10),np.abs(tval)>stats.t.ppf(0.975,10))
+    pval = xr.DataArray([0.01,0.2])
+    np.testing.assert_array_equal(significance_mask(pval,pval=True),[True,False])
+    mask = xr.DataArray([True,False])
+    assert significance_mask(mask) is mask
+
+def test_mask_to_path_covers_true_cells():
+    from tamdraw.signif import mask_to_path
+    rng = np.random.default_rng(0)
+    mask = rng.random((7,9))<0.4
+    x, y = np.arange(9)*2., np.arange(7)*3.
+    path = mask_to_path(mask,x,y)
+    from matplotlib.path import Path
+    polygons = [Path(poly) for poly in path.to_polygons()]
+    X, Y = np.meshgrid(x,y)
+    inside = [any(poly.contains_point(pt) for poly in polygons) for pt in zip(X.ravel(),Y.ravel())]
+    np.testing.assert_array_equal(np.reshape(inside,mask.shape),mask)
+
+# AR(1)の赤色雑音 (5%はNaN)
+red_noise = {'lat':3,'lon':4,'phi':0.6,'nan':0.05,'offset':10.}
+
+def reference_acf(data,maxlag):
+    # ラグごとに両方が欠測でない組だけで相関を計算する
+    acf = np.full((maxlag,)+data.shape[1:],np.nan)
+    for k in range(1,maxlag+1):
+        for idx in np.ndindex(data.shape[1:]):
+            a, b = data[:-k][(slice(None),)+idx], data[k:][(slice(None),)+idx]
+            ok = np.isfinite(a)&np.isfinite(b)
+            acf[(k-1,)+idx] = np.corrcoef(a[ok],b[ok])[0,1]
+    return acf
+
+def test_autocorrelation_chunked_matches_reference(random_field):
+    from tamdraw.signif import autocorrelation
+    field = random_field(200,**red_noise)
+    ref = reference_acf(field.values,3)
+    for chunk in (None,7,50):
+        acf = autocorrelation(field,maxlag=3,chunk=chunk)
+        np.testing.assert_allclose(acf.values,ref,rtol=1e-10)
+    assert list(acf['lag'].values)==[1,2,3]
+
+def test_effective_dof_matches_formula(random_field):
+    from tamdraw.signif import effective_dof
+    field = random_field(200,**red_noise)
+    data = field.values
+    count = np.isfinite(data).sum(axis=0)
+    r1 = reference_acf(data,1)[0]
+    dof = effective_dof(field,chunk=13)
+    np.testing.assert_allclose(dof.values,np.minimum(count*(1-r1)/(1+r1),count)-2,rtol=1e-10)
+    # 相手の時系列の自己相関との積 (Bretherton et al. 1999)
+    index = random_field(200,lat=None,lon=None,phi=0.6,seed=3,nan=0.05).values
+    index = np.where(np.isfinite(index),index,np.nanmean(index))
+    ri = np.corrcoef(index[:-1],index[1:])[0,1]
+    dof = effective_dof(field,other=index,chunk=13)
+    r = r1*ri
+    np.testing.assert_allclose(dof.values,np.minimum(count*(1-r)/(1+r),count)-2,rtol=1e-10)
+    # maxlag>1
+    acf = reference_acf(data,4)
+    k = np.arange(1,5)[:,None,None]
+    neff = count/(1+2*np.sum((1-k/count)*acf,axis=0))
+    np.testing.assert_allclose(effective_dof(field,maxlag=4,ddof=0).values,np.minimum(neff,count),rtol=1e-10)
+
+def test_autocorrelation_from_files(tmp_path,random_field):
+    from tamdraw.signif import autocorrelation
+    field = random_field(200,**red_noise).rename('olr')
+    for i,part in enumerate((slice(0,70),slice(70,150),slice(150,None))):
+        field.isel(time=part).to_dataset().to_netcdf(tmp_path/f'olr_{i}.nc',engine='scipy')
+    acf = autocorrelation(str(tmp_path/'olr_*.nc'),maxlag=2,chunk=30)
+    np.testing.assert_allclose(acf.values,reference_acf(field.values,2),rtol=1e-10)
@@ -0,0 +1,41 @@
+import numpy as np
+import xarray as xr
+
+# (time,level,lat,lon) の全球の経度の格子
+grid = {'lat':np.arange(-30,31,5.),'lon':np.arange(0,360,30.),'level':[850,200]}
+
+def test_build_hovmuller_select_dict_and_function(random_field):
+    from tamdraw.stream import build_hovmuller
+    field = random_field(50,**grid)
+    by_dict = build_hovmuller(field,-10,10,select={'level':850},chunk=7)
+    by_func = build_hovmuller(field,-10,10,select=lambda da: da.sel(level=850),chunk=7)
+    direct = build_hovmuller(field.sel(level=850),-10,10)
+    xr.testing.assert_allclose(by_dict,direct)
+    xr.testing.assert_allclose(by_func,direct)
+
+def band_mean(field,lat_min,lat_max):
+    band = field.sel(lat=slice(lat_min,lat_max))
+    return band.weighted(np.cos(np.deg2rad(band['lat']))).mean('lat')
+
+def test_build_hovmuller_matches_in_memory(tmp_path,random_field):
+    from tamdraw.stream import build_hovmuller
+    field = random_field(40,**grid).sel(level=850,drop=True).rename('u')
+    field[3,2,4] = np.nan
+    for i,part in enumerate((slice(0,15),slice(15,None))):
+        field.isel(time=part).to_dataset().to_netcdf(tmp_path/f'u_{i}.nc',engine='scipy')
+    ref = band_mean(field,-10,10)
+    for source in (field,str(tmp_path/'u_*.nc'),[tmp_path/'u_0.nc',tmp_path/'u_1.nc']):
+        hov = build_hovmuller(source,-10,10,chunk=6)
+        assert hov.dims==('time','lon')
+        np.testing.assert_allclose(hov.values,ref.values,rtol=1e-12)
+        np.testing.assert_array_equal(hov['time'].values,field['time'].values)
+    hov = build_hovmuller(field,-10,10,x_min=60,x_max=200)
+    np.testing.assert_allclose(hov.values,ref.sel(lon=slice(60,200)).values,rtol=1e-12)
+
+def test_iter_time_chunks_sizes(random_field):
+    from tamdraw.stream import iter_time_chunks,chunk_length
+    field = random_field(23,**grid)
+    sizes = [part.sizes['time'] for part in iter_time_chunks(field,chunk=10)]
+    assert sizes==[10,10,3]
+    # 1つのchunkがmax_mbに収まる長さ
+    assert chunk_length(field,max_mb=8*2*13*12*5/2**20)==5
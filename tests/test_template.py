@@ -0,0 +1,22 @@
+import numpy as np
+from _data import synthetic_field
+
+def test_blitted_frame_matches_full_draw():
+    from tamdraw.template import MapTemplate
+    from tamdraw.anim import figure_to_image
+    tmpl = MapTemplate(x_min=120,x_max=260,y_min=-20,y_max=70,dpi=60)
+    frames = []
+    for seed in (0,1):
+        tmpl.clear()
+        field = synthetic_field(5.,seed=seed)
+        tmpl.contourf(field,levels=np.linspace(-1.5,1.5,13))
+        tmpl.hatch(np.abs(field)>1)
+        tmpl.set_title(f"seed={seed}")
+        frames.append(np.array(tmpl.frame()))
+    # 背景を保持せずに全て描き直した図と同じ
+    for artist in tmpl.overlay+tmpl.layers+[tmpl.ax.title]:
+        artist.set_animated(False)
+    full = np.asarray(figure_to_image(tmpl.fig))
+    assert not np.array_equal(frames[0],frames[1])
+    # 違いは境界のアンチエイリアスの画素だけ (重ねる順番が違えば陸地・海岸線の全体が変わる)
+    assert np.mean(np.any(frames[1]!=full,axis=-1))<0.02